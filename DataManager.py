@@ -9,19 +9,46 @@ import sys
 import os
 import re
 import json
-import pandas as pd
+import threading
 import numpy as np
 
+from meta_store import MetaStore
+from snapshot import DATASETS, Table, has_snapshot, table_path
+from weights import STATS_WEIGHTS, TEAM_WEIGHTS, YEAR_WEIGHTS
+
+# fantasy points per unit of each stat
+FANTASY_VALUES = {
+	'points': 0.5,
+	'plusMinus': 2,
+	'faceoff': 1,
+	'shg': 2,
+	'blocks': 3,
+	'pim': 5,
+	'hits': 7
+}
+
+# per-session weight overrides whose ratings and views are kept, see DataManager.ratings_with
+WEIGHTED_CACHE_SIZE = 64
+
+# stats shown on the boards, each as a total and as _avg, _sd and _ratio
+BOARD_STATS = ['hits', 'blocks', 'pim', 'faceoff', 'shg', 'plusMinus', 'points', 'fights']
+
 # --- Utility Functions ---
 def is_season_type(filename):
 	pattern = r'^\d{8}_[a-zA-Z0-9]+'
 	return re.match(pattern, filename) is not None
 
+def age_factor(age, peak=30, alpha=0.0025, minf=0.8, maxf=1.2):
+	"""Rating multiplier for age, highest at peak.  Works on a single age or an array of them."""
+	return np.clip(1.0 - alpha * (age - peak)**2, minf, maxf)
+
 # --- DataManager Class ---
 class DataManager:
 		
 	# --- Initialization & Loading ---
-	def __init__(self):
+	def __init__(self, ratings_only=False):
+		"""ratings_only loads just what compute_ratings needs, with no picks/notes store and no per-player rows,
+		for command line tools that only rank players."""
 		self.stats = [
 			'points',
 			'plusMinus',
@@ -33,74 +60,52 @@ class DataManager:
 			'fights',
 			'age'
 		]
-		self.stats_weights = {
-			'points':    0.10,
-			'plusMinus': 0.25,
-			'shg':       0.20,
-			'faceoff':   0.45,
-			'blocks':    0.65,
-			'hits':      0.90,
-			'pim':       0.65,
-			'gp':        0.50,
-			'fights':    0.80,
-			'age':       0.50,
-			'fr':        1.00,
-			'team':      0.20
-		}
-		self.year_weights = {
-			'20222023': 0.3,
-			'20232024': 0.5,
-			'20242025': 0.9
+		self.stats_weights = dict(STATS_WEIGHTS)
+		self.year_weights = dict(YEAR_WEIGHTS)
+		self.team_weights = dict(TEAM_WEIGHTS)
+
+		# terms of the per-season rating, each weighted by stats_weights[term]
+		self.rating_terms = ['points', 'plusMinus', 'shg', 'faceoff', 'blocks', 'hits', 'pim', 'fights', 'fr', 'gp']
+
+		# board views by name, see get_view
+		self.views = {
+			'full': self.get_fullset,
+			'ratios': self.get_ratios,
+			'totals': self.get_totals,
+			'averages': self.get_averages,
+			'std': self.get_std
 		}
+		self.weights_version = 0
+		self.meta_version = 0
+		# ratings and views for per-session weight overrides, keyed on weights_key
+		self._weighted_ratings = {}
+		self._weighted_views = {}
+		# one DataManager is shared by every Streamlit session, so the view cache and weights are guarded
+		self._lock = threading.RLock()
 
-		self.team_weights = {
-			"ARI": 0.99,
-			"ANA": 1.01,
-			"BOS": 1.09,
-			"BUF": 1.02,
-			"CGY": 1.05,
-			"CAR": 0.99,
-			"CBJ": 1.06,
-			"CHI": 0.94,
-			"COL": 0.93,
-			"DAL": 0.91,
-			"DET": 1.01,
-			"EDM": 0.90,
-			"FLA": 1.10,
-			"LAK": 0.98,
-			"MIN": 0.92,
-			"MTL": 1.07,
-			"NSH": 1.03,
-			"NJD": 1.04,
-			"NYI": 1.01,
-			"NYR": 1.06,
-			"OTT": 1.07,
-			"PHI": 1.02,
-			"PIT": 0.99,
-			"SJS": 0.95,
-			"SEA": 0.98,
-			"STL": 1.02,
-			"TBL": 0.94,
-			"TOR": 1.06,
-			"VAN": 1.09,
-			"VGK": 0.98,
-			"WPG": 1.04
-		}
-  
 		self.data = {}
-		self.bios = json.load(open('data/json/player_bios.json'))
-		self.players = self.load_player_list()
 		self.seasons = ['20222023', '20232024', '20242025']
-		self.meta = self.load_meta()
+		# the columnar snapshot is memory mapped column by column, the JSON files are the fallback
+		self.use_snapshot = has_snapshot(self.seasons)
+		self.bios = Table(table_path('bios')) if self.use_snapshot else json.load(open('data/json/player_bios.json'))
+		self.players = self.load_player_list()
+		self.meta = {} if ratings_only else self.load_meta()
 		self.base = {}
 		self._load_bulk_data()
-		self._add_ratios_to_data()
-		self._store_normalized_ratios()
-		self._store_player_data()
-		self._store_team_fantasy_scores()
-		self._store_fantasy_norms()
+		self._store_columns()
+		if not ratings_only:
+			self._store_normalized_ratios()
+			self._store_player_data()
+			self._store_team_fantasy_scores()
+			self._store_fantasy_norms()
+		self._build_rating_arrays()
 
 	def _load_bulk_data(self):
+		if self.use_snapshot:
+			for type in DATASETS:
+				self.data[type] = {season: Table(table_path(type, season)) for season in self.seasons}
+			return
+
 		json_dir = os.path.join('data', 'json')
 		for filename in os.listdir(json_dir):
 			if filename.endswith('.json') and is_season_type(filename):
@@ -112,13 +117,49 @@ class DataManager:
 					self.data[type] = {}
 					self.data[type][season] = self.load_file(type,season)
 
-	def _add_ratios_to_data(self):
-		for player in self.players:
-			for season in self.seasons:
-				if player in self.data['full'][season]:
-					self.data['ratios'][season][player]['faceoff_ratio'] = self.data['full'][season][player]['faceoff_ratio']
-					self.data['ratios'][season][player]['fights_ratio'] = self.data['full'][season][player]['fights_ratio']
-					self.data['ratios'][season][player]['age_ratio'] = self.get_age_ratio(player)
+	def column(self, records, name, ids=None, default=np.nan):
+		"""name for every player in ids (self.players by default) as an array, default where a player is missing.
+
+		records is a snapshot Table or a loaded JSON dict.  On the snapshot this is one read of a memory mapped
+		column, which is what keeps the passes below from going through the table row by row.
+		"""
+		ids = self.players if ids is None else ids
+		if isinstance(records, Table):
+			return records.take(name, ids, default)
+		return np.array([records[pid].get(name, default) if pid in records else default for pid in ids])
+
+	def _store_columns(self):
+		"""Pull the per-season inputs of the normalization and ratings into arrays over self.players."""
+		self.player_index = {player: i for i, player in enumerate(self.players)}
+		self.player_teams = self.column(self.bios, 'team', default='')
+		self.age_factors = age_factor(self.column(self.bios, 'age'))
+		self.in_full = {}
+		self.in_ratios = {}
+		self.games = {}
+		self.stat_ratios = {}
+		for season in self.seasons:
+			full = self.data['full'][season]
+			ratios = self.data['ratios'][season]
+			self.in_full[season] = np.array([player in full for player in self.players], dtype=bool)
+			self.in_ratios[season] = np.array([player in ratios for player in self.players], dtype=bool)
+			self.games[season] = self.column(full, 'gp')
+			self.stat_ratios[season] = {}
+			for stat in self.stats:
+				if stat in ('faceoff', 'fights'):
+					# only the full dataset has these two ratios
+					values = self.column(full, stat + '_ratio')
+				elif stat == 'age':
+					values = np.where(self.in_ratios[season], self.age_factors, np.nan)
+				else:
+					values = self.column(ratios, stat + '_ratio')
+				self.stat_ratios[season][stat] = values
+
+	def get_stat_ratios(self, player, season):
+		"""{stat + '_ratio': value} for one player's season, or {} if the player has no ratios that season."""
+		if player not in self.player_index or not self.in_ratios[season][self.player_index[player]]:
+			return {}
+		i = self.player_index[player]
+		return {stat + '_ratio': float(self.stat_ratios[season][stat][i]) for stat in self.stats}
 
 	def _store_normalized_ratios(self):
 		self.data['norms'] = {}
@@ -126,13 +167,16 @@ class DataManager:
 			self.data['norms'][season] = self.normalize_ratios(season)
 
 	def _store_player_data(self):
-		for player in self.players:
+		names = self.column(self.bios, 'name', default='').tolist()
+		positions = self.column(self.bios, 'position', default='').tolist()
+		ages = self.column(self.bios, 'age').tolist()
+		for player, team, name, position, age in zip(self.players, self.player_teams.tolist(), names, positions, ages):
 			self.base[player] = {
-				'Team': self.bios[player]['team'],
+				'Team': team,
 				'ID': player,
-				'Name': self.bios[player]['name'],
-				'Pos': self.bios[player]['position'],
-				'Age': self.bios[player]['age']
+				'Name': name,
+				'Pos': position,
+				'Age': age
 			}
 
 	def _store_team_fantasy_scores(self):
@@ -145,50 +189,230 @@ class DataManager:
 		for season in self.seasons:
 			self.fantasy_norms[season] = self.get_normalized_fantasy_points(season)
 
+	def _build_rating_arrays(self):
+		"""Lay the rating inputs out as one array of ratios, players x seasons x terms."""
+		self.rating_ratios = np.zeros((len(self.players), len(self.seasons), len(self.rating_terms)))
+		for s, season in enumerate(self.seasons):
+			for k, term in enumerate(self.rating_terms):
+				if term == 'fr':
+					values = self.normalized_fantasy_points(season)
+				elif term == 'gp':
+					values = self.games[season] / 82
+				else:
+					values = self.stat_ratios[season][term]
+				self.rating_ratios[:, s, k] = np.where(self.in_ratios[season], values, 0)
+		self.rank_deltas = np.zeros(len(self.players), dtype=int)
+		self._compute_contributions()
+		self._ratings = None
+		self._rank_order = None
+		self.invalidate_views()
+
+	def _compute_contributions(self):
+		"""Precompute each term's year-weighted contribution per player, so a weight change only rescales one column."""
+		self.term_vector = np.array([self.stats_weights[term] for term in self.rating_terms], dtype=float)
+		self.year_vector = np.array([self.year_weights[season] for season in self.seasons], dtype=float)
+		# players x terms: sum over seasons of ratio * year weight
+		self.term_contributions = np.einsum('psk,s->pk', self.rating_ratios, self.year_vector)
+		self.base_ratings = self.term_contributions @ self.term_vector
+		self.team_factors = np.array([self.team_weights.get(team, 1.0) for team in self.player_teams])
+
+	# --- Cached Views ---
+	def get_view(self, view, season, position='ALL', weights=()):
+		"""Board DataFrame for one of self.views in a season, sorted by rating with numbers rounded.
+
+		Frames are cached per (view, season, position).  After a weight change only the Rating column is
+		recomputed and the frame re-sorted, after a meta change only Picked and Notes are refreshed.  The data
+		is rebuilt only after invalidate_views().  Returned frames are shared, treat them as read-only.
+
+		weights is a weights_key of overrides to rate the board with instead of the shared weights.
+		"""
+		if any(weights):
+			return self._get_weighted_view(view, season, position, weights)
+		with self._lock:
+			key = (view, season, position)
+			entry = self._views.get(key)
+			if entry is None or entry[:2] != (self.weights_version, self.meta_version):
+				if position != 'ALL':
+					frame = self.get_view(view, season)
+					frame = frame[frame['Pos'] == position]
+				else:
+					frame = self._refresh_view(view, season, entry)
+				self._views[key] = (self.weights_version, self.meta_version, frame)
+			return self._views[key][2]
+
+	def _refresh_view(self, view, season, entry):
+		if entry is None:
+			weights_version, meta_version, frame = self.weights_version, None, self._build_view(view, season)
+		else:
+			weights_version, meta_version, frame = entry
+		if weights_version != self.weights_version:
+			rows = frame['ID'].map(self.player_index).to_numpy()
+			frame = frame.assign(Rating=np.round(self.compute_ratings()[rows], 3))
+			frame = frame.sort_values(by='Rating', ascending=False)
+		if meta_version != self.meta_version:
+			frame = frame.assign(
+				Picked=frame['ID'].map(lambda pid: self.meta[pid]['picked']),
+				Notes=frame['ID'].map(lambda pid: self.meta[pid]['note'])
+			)
+		return frame
+
+	def _build_view(self, view, season):
+		df = self.views[view](season)
+		numeric = [col for col in df.columns if col not in ['Name', 'Notes', 'Pos', 'Team', 'Picked', 'ID']]
+		df[numeric] = df[numeric].astype(float).round(3)
+		return df.sort_values(by='Rating', ascending=False)
+
+	def _get_weighted_view(self, view, season, position, weights):
+		with self._lock:
+			key = (view, season, position, weights)
+			entry = self._weighted_views.get(key)
+			if entry is None or entry[0] != self.meta_version:
+				frame = self.get_view(view, season, position)
+				rows = frame['ID'].map(self.player_index).to_numpy()
+				frame = frame.assign(Rating=np.round(self.ratings_with(weights)[rows], 3))
+				frame = frame.sort_values(by='Rating', ascending=False)
+				if len(self._weighted_views) >= WEIGHTED_CACHE_SIZE:
+					self._weighted_views.clear()
+				self._weighted_views[key] = (self.meta_version, frame)
+			return self._weighted_views[key][1]
+
+	def invalidate_views(self, weights=False):
+		"""Drop the cached views.  Call with weights=True after editing the weight dicts directly."""
+		with self._lock:
+			if weights:
+				self._compute_contributions()
+				self._weights_changed()
+			self._views = {}
+			self._weighted_views = {}
+
+	def _weights_changed(self):
+		self.weights_version += 1
+		self._ratings = None
+		self._rank_order = None
+		# overrides are relative to the shared weights, so their ratings are stale now too
+		self._weighted_ratings = {}
+		self._weighted_views = {}
+
+	# --- Live Weight Tuning ---
+	def set_weights(self, stats=None, years=None, teams=None):
+		"""Change rating weights at runtime and return the rank deltas (positive = moved up) per player.
+
+		stats maps a stats_weights key, years a season and teams a team abbreviation to its new weight.  Only
+		the affected contributions are updated: a stat weight rescales one column of term_contributions, a
+		year weight adds that season's ratios, a team weight touches that team's players.
+		"""
+		with self._lock:
+			return self._set_weights(stats, years, teams)
+
+	def _set_weights(self, stats, years, teams):
+		previous = self.get_ranks()
+		for term, value in (stats or {}).items():
+			delta = value - self.stats_weights.get(term, 0)
+			self.stats_weights[term] = value
+			if term in self.rating_terms and delta:
+				k = self.rating_terms.index(term)
+				self.term_vector[k] = value
+				self.base_ratings += delta * self.term_contributions[:, k]
+		for season, value in (years or {}).items():
+			delta = value - self.year_weights[season]
+			self.year_weights[season] = value
+			if delta:
+				s = self.seasons.index(season)
+				self.year_vector[s] = value
+				season_ratios = self.rating_ratios[:, s, :]
+				self.term_contributions += delta * season_ratios
+				self.base_ratings += delta * (season_ratios @ self.term_vector)
+		for team, value in (teams or {}).items():
+			self.team_weights[team] = value
+			self.team_factors[self.player_teams == team] = value
+		self._weights_changed()
+		self.rank_deltas = previous - self.get_ranks()
+		return self.rank_deltas
+
+	def reset_weights(self):
+		"""Go back to the defaults from weights.py."""
+		return self.set_weights(stats=STATS_WEIGHTS, years=YEAR_WEIGHTS, teams=TEAM_WEIGHTS)
+
+	def get_rank_delta(self, player_id):
+		"""How many places the last set_weights call moved a player up (negative = down)."""
+		if player_id not in self.player_index:
+			return 0
+		return int(self.rank_deltas[self.player_index[player_id]])
+
+	# --- Per-Session Weights ---
+	def weights_key(self, stats=None, years=None, teams=None):
+		"""Hashable form of weight overrides for get_view, ratings_with and friends.
+
+		Overrides equal to the shared weights are left out, so weights_key() and the key of the unchanged
+		sliders are both ((), (), ()).  Values are rounded to 3 places like the sliders' steps.
+		"""
+		def overrides(new, current, default=None):
+			return tuple(sorted(
+				(k, round(float(v), 3)) for k, v in (new or {}).items() if round(v, 3) != round(current.get(k, default), 3)
+			))
+		return (
+			overrides(stats, self.stats_weights, 0),
+			overrides(years, self.year_weights),
+			overrides(teams, self.team_weights, 1.0)
+		)
+
+	def ratings_with(self, weights):
+		"""compute_ratings() with the overrides of a weights_key applied.  Nothing shared is changed, so every
+		Streamlit session can rate players with its own weights."""
+		if not any(weights):
+			return self.compute_ratings()
+		with self._lock:
+			ratings = self._weighted_ratings.get(weights)
+			if ratings is None:
+				stats, years, teams = (dict(part) for part in weights)
+				term_vector = np.array([stats.get(term, self.stats_weights[term]) for term in self.rating_terms])
+				year_vector = np.array([years.get(season, self.year_weights[season]) for season in self.seasons])
+				team_factors = self.team_factors.copy()
+				for team, value in teams.items():
+					team_factors[self.player_teams == team] = value
+				contributions = np.einsum('psk,s->pk', self.rating_ratios, year_vector)
+				ratings = (contributions @ term_vector) * self.age_factors * team_factors
+				if len(self._weighted_ratings) >= WEIGHTED_CACHE_SIZE:
+					self._weighted_ratings.clear()
+				self._weighted_ratings[weights] = ratings
+			return ratings
+
+	def rank_deltas_between(self, before, after):
+		"""Places each player moves up (negative = down) going from one weights_key to another."""
+		return ranks_of(self.ratings_with(before)) - ranks_of(self.ratings_with(after))
+
 	# --- Data Transformation & Normalization ---
 
 
 	def normalize_ratios(self, season):
-		out = {}
+		present = self.in_ratios[season]
+		norms = {}
 		for stat in self.stats:
-			values = [self.data['ratios'][season][pid][stat+'_ratio'] for pid in self.players if pid in self.data['ratios'][season]]
-			min_val, max_val = min(values), max(values)
+			norms[stat+'_norm'] = min_max(self.stat_ratios[season][stat][present]).tolist()
 
-			for player in self.players:
-				if player not in self.data['ratios'][season]:
-					continue
+		players = [player for player, ok in zip(self.players, present) if ok]
+		return {player: {key: values[i] for key, values in norms.items()} for i, player in enumerate(players)}
 
-				if player not in out:
-					out[player] = {}
 
-				out[player][stat+'_norm'] = (self.data['ratios'][season][player][stat+'_ratio'] - min_val) / (max_val - min_val) if max_val > min_val else 0
-		
+	def normalized_fantasy_points(self, season):
+		"""Fantasy points per game scaled to 0..1 over the season's players, as an array over self.players."""
+		present = self.in_full[season]
+		out = np.full(len(self.players), np.nan)
+		out[present] = min_max(self.fantasy_points(season)[present])
 		return out
 
-
 	def get_normalized_fantasy_points(self, season):
-		out = {}
-		values = [self.get_fantasy_points(pid, season) for pid in self.players if pid in self.data['full'][season]]
-		min_val, max_val = min(values), max(values)
-
-		for player in self.players:
-			if player not in self.data['full'][season]:
-				continue
+		values = self.normalized_fantasy_points(season)
+		return {player: value for player, value, ok in zip(self.players, values.tolist(), self.in_full[season]) if ok}
 
-			out[player] = (self.get_fantasy_points(player, season) - min_val) / (max_val - min_val) if max_val > min_val else 0
-		
-		return out
+	def fantasy_points(self, season, suffix=''):
+		"""get_fantasy_points (suffix='') or get_fantasy_ratio (suffix='_ratio') for every player, nan if missing."""
+		full = self.data['full'][season]
+		points = sum(self.column(full, stat + suffix) * value for stat, value in FANTASY_VALUES.items())
+		return points / self.games[season]
 
 	def get_fantasy_ratio(self, player, season):
-		values = {
-			'points': 0.5,
-			'plusMinus': 2,
-			'faceoff': 1,
-			'shg': 2,
-			'blocks': 3,
-			'pim': 5,
-			'hits': 7
-		}
+		values = FANTASY_VALUES
 
 		if player not in self.data['full'][season]:
 			return 0
@@ -201,42 +425,16 @@ class DataManager:
 
 
 	def get_team_fantasy_scores(self, season):
-		teams = {}
-		games_played = {}
-		for player in self.players:
-			if player not in self.data['full'][season]:
-				continue
-
-			team = self.bios[player]['team']
-			if team not in teams:
-				teams[team] = 0
-				games_played[team] = 0
-
-			games_played[team] += self.data['full'][season][player]['gp']
-			teams[team] += self.get_fantasy_ratio(player, season)
-
-		for team in teams:
-			if team in games_played and games_played[team] > 0:
-				teams[team] /= games_played[team]
-
-		normalized_teams = {}
-		min_val = min(teams.values())
-		max_val = max(teams.values())
-		for team in teams:
-			normalized_teams[team] = (teams[team] - min_val) / (max_val - min_val) if max_val > min_val else 0
-		return normalized_teams
+		present = self.in_full[season]
+		teams, players = np.unique(self.player_teams[present], return_inverse=True)
+		totals = np.bincount(players, weights=self.fantasy_points(season, '_ratio')[present], minlength=len(teams))
+		games = np.bincount(players, weights=self.games[season][present], minlength=len(teams))
+		scores = np.divide(totals, games, out=totals.copy(), where=games > 0)
+		return dict(zip(teams.tolist(), min_max(scores).tolist()))
 
 
 	def get_fantasy_points(self, player, season):
-		values = {
-			'points': 0.5,
-			'plusMinus': 2,
-			'faceoff': 1,
-			'shg': 2,
-			'blocks': 3,
-			'pim': 5,
-			'hits': 7
-		}
+		values = FANTASY_VALUES
 
 		fp = 0.0
 		for v in values.keys():
@@ -246,9 +444,7 @@ class DataManager:
 
 
 	def get_age_ratio(self, player, peak=30, alpha=0.0025, minf=0.8, maxf=1.2):
-		age = self.bios[player]['age']
-		f = 1.0 - alpha * (age - peak)**2
-		return float(np.clip(f, minf, maxf))
+		return float(age_factor(self.bios[player]['age'], peak, alpha, minf, maxf))
 
 
 	def load_file(self, type, season):
@@ -261,6 +457,7 @@ class DataManager:
 			
 
 	def toCVS(self, data):
+		import pandas as pd
 		if 'Rating' in data[0]:
 			sorted_data = sorted(data, key=lambda x: x['Rating'], reverse=True)
 			return pd.DataFrame(sorted_data)
@@ -285,7 +482,7 @@ class DataManager:
 		return self.bios[player]
 
 	def stage_data(self, player, season, dataset=None, no_rank=False):
-		stats = ['hits', 'blocks', 'pim', 'faceoff', 'shg', 'plusMinus', 'points', 'fights']
+		stats = BOARD_STATS
 		if dataset:
 			tag = '_' + dataset
 		else:
@@ -306,124 +503,153 @@ class DataManager:
 		return out
 
 
-	def get_averages(self, season):
-		output = []
-		for player in self.players:
-			if player in self.data['full'][season].keys():
-				stats = self.stage_data(player, season, 'avg')
-				output.append({**{'Picked' : self.meta[player]['picked']}, **self.base[player] , **stats})
-
-		return output
-
-	def get_std(self, season):
-		output = []
-		for player in self.players:
-			if player in self.data['full'][season].keys():
-				stats = self.stage_data(player, season, 'sd')
-				output.append({**{'Picked' : self.meta[player]['picked']}, **self.base[player] , **stats})
-
-		return output
+	def stage_columns(self, season, dataset=None, no_rank=False):
+		"""stage_data for every player in the season at once, as arrays in self.players order."""
+		tag = '_' + dataset if dataset else ''
+		present = self.in_full[season]
+		full = self.data['full'][season]
 
-	def get_ratios(self, season):
-		output = []
-		for player in self.players:
-			if player in self.data['full'][season].keys():
-				stats = self.stage_data(player, season, 'ratio')
-				output.append({**{'Picked' : self.meta[player]['picked']}, **self.base[player] , **stats})
+		out = {}
+		out['GP'] = self.column(full, 'gp', default=0)[present]
+		if not no_rank:
+			out['Rating'] = self.compute_ratings()[present]
+		out['FP/GP'] = self.fantasy_points(season)[present]
+		for stat in BOARD_STATS:
+			out[stat+tag] = self.column(full, stat+tag, default=0)[present]
 
-		return output
+		return out
 
-	def get_totals(self, season):
-		output = []
-		for player in self.players:
-			if player in self.data['full'][season].keys():
-				stats = self.stage_data(player, season)
-				output.append({**{'Picked' : self.meta[player]['picked']}, **self.base[player] , **stats})
+	def board(self, season, *datasets):
+		"""Board DataFrame of every player in the season, best rated first.
 
-		return output
+		datasets are (dataset, no_rank) pairs for stage_columns; columns they share keep their first position.
+		"""
+		import pandas as pd
+		players = [player for player, ok in zip(self.players, self.in_full[season]) if ok]
+		columns = {'Picked': [self.meta[player]['picked'] for player in players]}
+		for key in ['Team', 'ID', 'Name', 'Pos', 'Age']:
+			columns[key] = [self.base[player][key] for player in players]
+		for dataset, no_rank in datasets:
+			columns.update(self.stage_columns(season, dataset, no_rank))
 
-	def get_fullset(self, season):
-		output = []
+		frame = pd.DataFrame(columns)
+		order = np.argsort(-frame['Rating'].to_numpy(), kind='stable')
+		return frame.iloc[order].reset_index(drop=True)
 
-		for player in self.players:
-			if player in self.data['full'][season].keys():
-				tot = self.stage_data(player, season, no_rank=True)
-				avg = self.stage_data(player, season, dataset='avg', no_rank=True)
-				sd = self.stage_data(player, season, dataset='sd', no_rank=True)
-				rat = self.stage_data(player, season, dataset='ratio')
-
-				output.append({**{'Picked' : self.meta[player]['picked']}, **self.base[player] , **rat, **tot, **avg, **sd})
-		
-		return output
+	def get_averages(self, season):
+		return self.board(season, ('avg', False))
 
+	def get_std(self, season):
+		return self.board(season, ('sd', False))
 
-	def get_ratings(self): 
-		players = []
+	def get_ratios(self, season):
+		return self.board(season, ('ratio', False))
 
-		for player_id in self.players:
-			player = self.get_rating(player_id)
-			players.append(player)
-			
-		return players
+	def get_totals(self, season):
+		return self.board(season, (None, False))
 
-	def get_rating(self, player_id):
+	def get_fullset(self, season):
+		return self.board(season, ('ratio', False), (None, True), ('avg', True), ('sd', True))
+
+
+	def get_ratings(self):
+		return self.compute_ratings().tolist()
+
+	def compute_ratings(self):
+		"""Every player's rating at once, in self.players order.  Cached until the weights change."""
+		if self._ratings is None:
+			self._ratings = self.base_ratings * self.age_factors * self.team_factors
+			self._rank_order = None
+		return self._ratings
+
+	def get_rank_order(self):
+		"""Indices into self.players from the highest rated player down."""
+		if self._rank_order is None:
+			self._rank_order = np.argsort(-self.compute_ratings(), kind='stable')
+		return self._rank_order
+
+	def get_ranks(self):
+		"""Each player's rank (0 = best), in self.players order."""
+		ranks = np.empty(len(self.players), dtype=int)
+		ranks[self.get_rank_order()] = np.arange(len(self.players))
+		return ranks
+
+	def get_rating(self, player_id, weights=()):
+		if player_id in self.player_index:
+			return float(self.ratings_with(weights)[self.player_index[player_id]])
+		return self._get_single_rating(player_id, weights)
+
+	def _get_single_rating(self, player_id, weights=()):
+		# players outside self.players (e.g. inactive) are not in the rating arrays
+		stats_weights, year_weights, team_weights = (
+			{**current, **dict(part)} for current, part in
+			zip((self.stats_weights, self.year_weights, self.team_weights), weights or ((), (), ()))
+		)
 		rating = 0
 		for season in self.seasons:
 			season_rating = 0
 			if player_id not in self.data['ratios'][season]:
 				continue
 		
-			season_rating += (self.data['ratios'][season][player_id]['points_ratio'] * self.stats_weights['points'])
-			season_rating += (self.data['ratios'][season][player_id]['plusMinus_ratio'] * self.stats_weights['plusMinus'])
-			season_rating += (self.data['ratios'][season][player_id]['shg_ratio'] * self.stats_weights['shg'])
-			season_rating += (self.data['ratios'][season][player_id]['faceoff_ratio'] * self.stats_weights['faceoff'])
-			season_rating += (self.data['ratios'][season][player_id]['blocks_ratio'] * self.stats_weights['blocks'])
-			season_rating += (self.data['ratios'][season][player_id]['hits_ratio'] * self.stats_weights['hits'])
-			season_rating += (self.data['ratios'][season][player_id]['pim_ratio'] * self.stats_weights['pim'])
-			season_rating += (self.data['ratios'][season][player_id]['fights_ratio'] * self.stats_weights['fights'])
-			season_rating += (self.fantasy_norms[season][player_id] * self.stats_weights['fr'])
-			# season_rating += (self.team_fantasy_scores[season].get(self.bios[player_id]['team'], 0) * self.stats_weights['team'])
-			season_rating += ((self.data['full'][season][player_id]['gp'] / 82) * self.stats_weights['gp'])
-			rating += (season_rating * self.year_weights[season])
-
-		return rating * self.get_age_ratio(player_id) * self.team_weights.get(self.bios[player_id]['team'], 1.0)
+			season_rating += (self.data['ratios'][season][player_id]['points_ratio'] * stats_weights['points'])
+			season_rating += (self.data['ratios'][season][player_id]['plusMinus_ratio'] * stats_weights['plusMinus'])
+			season_rating += (self.data['ratios'][season][player_id]['shg_ratio'] * stats_weights['shg'])
+			season_rating += (self.data['full'][season][player_id]['faceoff_ratio'] * stats_weights['faceoff'])
+			season_rating += (self.data['ratios'][season][player_id]['blocks_ratio'] * stats_weights['blocks'])
+			season_rating += (self.data['ratios'][season][player_id]['hits_ratio'] * stats_weights['hits'])
+			season_rating += (self.data['ratios'][season][player_id]['pim_ratio'] * stats_weights['pim'])
+			season_rating += (self.data['full'][season][player_id]['fights_ratio'] * stats_weights['fights'])
+			season_rating += (self.fantasy_norms[season].get(player_id, 0) * stats_weights['fr'])
+			# season_rating += (self.team_fantasy_scores[season].get(self.bios[player_id]['team'], 0) * stats_weights['team'])
+			season_rating += ((self.data['full'][season][player_id]['gp'] / 82) * stats_weights['gp'])
+			rating += (season_rating * year_weights[season])
+
+		return rating * self.get_age_ratio(player_id) * team_weights.get(self.bios[player_id]['team'], 1.0)
 
 	def set_pick(self, player, pick):
-		self.meta[player]['picked'] = pick
+		if self.meta[player]['picked'] != pick:
+			self.meta[player]['picked'] = pick
+			self.meta_version += 1
+			self.meta_store.mark(player, self.meta[player])
 
 	def set_note(self, player, note):
-		self.meta[player]['note'] = note
+		if self.meta[player]['note'] != note:
+			self.meta[player]['note'] = note
+			self.meta_version += 1
+			self.meta_store.mark(player, self.meta[player])
 
 	def save_meta(self):
-		filename = 'data/json/player_meta.json'
-		with open(filename, 'w') as f:
-			json.dump(self.meta, f)
+		# changes are already queued by set_pick/set_note and committed after a short debounce;
+		# this only forces the commit now
+		self.meta_store.flush()
 	
 	def load_meta(self):
-		filename = 'data/json/player_meta.json'
-		if os.path.exists(filename):
-			with open(filename, 'r') as f:
-				meta = json.load(f)
-		else:
-			meta = {}
-			for player in self.players:
-				meta[player] = {
-					'picked': False,
-					'note': ''
-				}
-
-		return meta
+		self.meta_store = MetaStore()
+		return self.meta_store.load(self.players)
 
 	def load_player_list(self):
 		filename = 'player_list.txt'
 		with open(filename, 'r') as f:
-			return [line.strip() for line in f if line.strip() and self.bios[line.strip()]['active']]
+			players = [line.strip() for line in f if line.strip()]
+		active = self.column(self.bios, 'active', ids=players, default=False)
+		return [player for player, ok in zip(players, active) if ok]
 
 
 def is_season_type(filename):
 	pattern = r'^\d{8}_[a-zA-Z0-9]+'
 	return re.match(pattern, filename) is not None
 
+def ranks_of(ratings):
+	"""Each entry's rank in ratings (0 = highest), ties in index order."""
+	ranks = np.empty(len(ratings), dtype=int)
+	ranks[np.argsort(-ratings, kind='stable')] = np.arange(len(ratings))
+	return ranks
+
+def min_max(values):
+	"""values scaled to 0..1, all zeros if they are all the same."""
+	min_val, max_val = values.min(), values.max()
+	return (values - min_val) / (max_val - min_val) if max_val > min_val else np.zeros(len(values))
+
 
 
 
@@ -10,6 +10,8 @@ st.set_page_config(layout="wide")
 seasons = ["20222023", "20232024", "20242025"]  # add all available seasons here
 data_types = ['Full', "Ratios", "Totals", "Means", "Deviations"]   # adjust to match what DataManager supports
 positions = ["ALL", "F", "D"]
+page_sizes = [25, 50, 100]
+view_names = {'Full': 'full', 'Ratios': 'ratios', 'Totals': 'totals', 'Means': 'averages', 'Deviations': 'std'}
 
 if "page" not in st.session_state:
     st.session_state.page = "main"
@@ -17,11 +19,73 @@ if "selected_player" not in st.session_state:
     st.session_state.selected_player = None
 
 
-# --- Get data ---
-if "dm" not in st.session_state:
-    st.session_state.dm = DataManager()
+def sync_picks(grid_response, sent):
+    """Apply only the Picked values the user changed in a grid, found by diffing against the frame sent to it."""
+    if grid_response['data'] is None:
+        return
+    returned = pd.DataFrame(grid_response['data']).set_index('ID')['Picked'].astype(bool)
+    # rows the grid returns that were not sent (e.g. from another page) have nothing to diff against
+    returned = returned[returned.index.isin(sent['ID'])]
+    before = sent.set_index('ID')['Picked'].astype(bool).reindex(returned.index)
+    for player_id, picked in returned[returned.ne(before)].items():
+        dm.set_pick(player_id, bool(picked))
+
+
+def get_page(frame, key, page_size):
+    """Slice out the page stored in session_state[key], with the Rank Δ column added for just those rows."""
+    pages = max(1, -(-len(frame) // page_size))
+    page = min(st.session_state.get(key, 1), pages)
+    st.session_state[key] = page
+    rows = frame.iloc[(page - 1) * page_size:page * page_size]
+    # places each player moved with this session's last weight change
+    deltas = st.session_state.get("rank_deltas")
+    if deltas is None:
+        return rows.assign(**{'Rank Δ': 0}), pages
+    return rows.assign(**{'Rank Δ': rows['ID'].map(lambda pid: int(deltas[dm.player_index[pid]]))}), pages
+
+
+def page_control(key, pages):
+    if pages > 1:
+        st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1, key=key)
+
 
-dm = st.session_state.dm
+def grid_height(frame, row_height=28, header_height=60):
+    return header_height + row_height * max(len(frame), 1)
+
+
+# --- Get data ---
+@st.cache_resource
+def get_data_manager():
+    # one DataManager per process, shared by every session; it caches the board frames itself
+    return DataManager()
+
+dm = get_data_manager()
+
+# --- Rating weights ---
+with st.sidebar:
+    st.header("Rating Weights")
+    stat_weights = {term: st.slider(term, 0.0, 2.0, float(dm.stats_weights[term]), 0.05, key=f"w_{term}")
+                    for term in dm.rating_terms}
+    with st.expander("Season weights"):
+        year_weights = {season: st.slider(season, 0.0, 2.0, float(dm.year_weights[season]), 0.05, key=f"y_{season}")
+                        for season in dm.seasons}
+    with st.expander("Team weights"):
+        team_weights = {team: st.slider(team, 0.5, 1.5, float(weight), 0.01, key=f"t_{team}")
+                        for team, weight in sorted(dm.team_weights.items())}
+
+    # the DataManager is shared by every session, so this session's weights only live in its session_state
+    # and are passed to get_view/get_rating as a key; dm.set_weights would change everyone's board
+    weights = dm.weights_key(stat_weights, year_weights, team_weights)
+    previous = st.session_state.get("weights", dm.weights_key())
+    if weights != previous:
+        st.session_state.rank_deltas = dm.rank_deltas_between(previous, weights)
+    st.session_state.weights = weights
+
+    if st.button("Reset weights"):
+        for key in list(st.session_state.keys()):
+            if key.startswith(("w_", "y_", "t_")):
+                del st.session_state[key]
+        st.rerun()
 
 
 
@@ -40,33 +104,7 @@ if st.session_state.page == "main":
         pos_type = st.selectbox("Position", positions, index=0)
     
 
-    if showing_type == 'Full':
-        data = dm.get_fullset(season)
-    elif showing_type == 'Ratios':
-        data = dm.get_ratios(season)
-    elif showing_type == "Totals":
-        data = dm.get_totals(season)
-    elif showing_type == "Means":
-        data = dm.get_averages(season)
-    elif showing_type == "Deviations":
-        data = dm.get_std(season)
-    
-    df = dm.toCVS(data)
-    if 'Picked' not in df.columns:
-        df['Picked'] = False
-    
-    df['Notes'] = df['ID'].map(lambda pid: dm.meta[pid]['note'])
-    
-    if pos_type != "ALL":
-        df = df[df['Pos'] == pos_type]
-
-
-    # Sort so picked players are at the bottom
-    df = df.sort_values(by='Rating', ascending=False)
-
-    for col in df.columns:
-        if col not in ['Name', 'Notes', 'Pos', 'Team', 'Picked', 'ID']:
-            df[col] = df[col].map(lambda v: round(float(v), 3))
+    df = dm.get_view(view_names[showing_type], season, pos_type, weights=weights)
 
     search_query = st.text_input("Search for player name...")
 
@@ -74,8 +112,23 @@ if st.session_state.page == "main":
     if search_query:
         df = df[df['Name'].str.contains(search_query, case=False, na=False)]
 
-    gb = GridOptionsBuilder.from_dataframe(df)
-    gb.configure_pagination(enabled=True, paginationPageSize=100)
+    # sorting and paging happen here against the cached frame; the grids only get the rows on screen
+    sort_columns = [col for col in df.columns if col not in ['Picked', 'Notes', 'ID']]
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        sort_by = st.selectbox("Sort by", sort_columns, index=sort_columns.index('Rating'))
+    with col2:
+        ascending = st.toggle("Ascending", value=False)
+    with col3:
+        page_size = st.selectbox("Rows per page", page_sizes, index=1)
+    if sort_by != 'Rating' or ascending:
+        df = df.sort_values(by=sort_by, ascending=ascending, kind='stable')
+
+    available, available_pages = get_page(df[df['Picked'] == 0], "available_page", page_size)
+    board, board_pages = get_page(df[df["Picked"] == 1], "board_page", page_size)
+
+    gb = GridOptionsBuilder.from_dataframe(available)
+    gb.configure_default_column(sortable=False)
     gb.configure_side_bar()
     gb.configure_selection('single', use_checkbox=False)
     gb.configure_column("Picked", editable=True, cellEditor='agCheckboxCellEditor')
@@ -114,36 +167,34 @@ if st.session_state.page == "main":
 
     grid_options = gb.build()
 
-    available = df[df['Picked'] == 0]
     grid_response = AgGrid(
         available,
         gridOptions=grid_options,
         update_mode=GridUpdateMode.VALUE_CHANGED,
-        height=2000,
+        height=grid_height(available),
         width=1000,
         allow_unsafe_jscode=True,
         enable_enterprise_modules=True,
+        key="available_grid",
     )
+    page_control("available_page", available_pages)
 
-    board = df[df["Picked"] == 1]
-    # board = temp[temp['Picked'] == 0]
     st.header("Draft Board")
     draft_board = AgGrid(
         board,
         gridOptions=grid_options,
         update_mode=GridUpdateMode.VALUE_CHANGED,
-        height=2000,
+        height=grid_height(board),
         width=1000,
         allow_unsafe_jscode=True,
         enable_enterprise_modules=True,
+        key="board_grid",
     )
+    page_control("board_page", board_pages)
 
 
-    if grid_response['data'] is not None:
-        updated_df = pd.DataFrame(grid_response['data'])
-        for _, row in updated_df.iterrows():
-            dm.set_pick(row['ID'], row['Picked'])
-        dm.save_meta()  # <-- Add this line here
+    sync_picks(grid_response, available)
+    sync_picks(draft_board, board)
 
     # If a row is selected
     if grid_response["selected_rows"] is not None and len(grid_response["selected_rows"]) > 0:
@@ -170,7 +221,7 @@ elif st.session_state.page == "player":
 
     with col2:
         st.header(f"{player_info['name']}")
-        st.write(f'Rating: {dm.get_rating(player)}')
+        st.write(f'Rating: {dm.get_rating(player, weights)}')
         st.write(f'Position: {player_info.get("pos", "N/A")}')
         st.write(f"Height: {player_info.get('height', 'N/A')} inches")
         st.write(f"Weight: {player_info.get('weight', 'N/A')} lbs")
@@ -180,12 +231,10 @@ elif st.session_state.page == "player":
         picked_key = f"picked_{player}"
         picked = st.checkbox("Picked", value=dm.meta[player]['picked'], key=picked_key)
         dm.set_pick(player, picked)
-        dm.save_meta()
 
     notes_key = f"notes_{player}"
     notes = st.text_area("([WATCH] - add watchlist, [WARN] - add warning flag)", value=dm.meta[player]['note'], key=notes_key)
     dm.set_note(player, notes)
-    dm.save_meta()
 
 
     showing_type = st.selectbox("Select Data Type", data_types, index=data_types.index("Full"))
@@ -205,9 +254,9 @@ elif st.session_state.page == "player":
         st.subheader("Rating Formula")
         # Use current season
         current_season = '20242025'
-        if player in dm.data['ratios'][current_season]:
-            stat_weights = dm.stats_weights
-            stat_ratios = dm.data['ratios'][current_season][player]
+        stat_ratios = dm.get_stat_ratios(player, current_season)
+        if stat_ratios:
+            stat_weights = {**dm.stats_weights, **stat_weights}
             formula_lines = []
             # Prepare aligned formula lines
             formula_lines = []
@@ -232,7 +281,7 @@ elif st.session_state.page == "player":
             age_ratio = dm.get_age_ratio(player)
             formula_lines.append(f"{'Age Ratio':<{col1}} {age_ratio:>{col2}.3f}")
             # Final rating
-            final_rating = dm.get_rating(player)
+            final_rating = dm.get_rating(player, weights)
             formula_lines.append(f"{'Final Rating':<{col1}} {final_rating:>{col6}.3f}")
             # Use Markdown code block for better spacing in Streamlit
             st.markdown("```\n" + "\n".join(formula_lines) + "\n```")
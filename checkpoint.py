@@ -0,0 +1,85 @@
+"""
+checkpoint.py
+resumable bookkeeping for the ingestion scripts. every completed unit of work
+(a player-season, a game) is appended to a JSON-lines log together with its
+result, so a run that dies partway through only redoes the missing units
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+
+
+class Checkpoint:
+    """Completed units and their results for one pipeline, stored under data/checkpoints/<name>.
+
+    <name>.jsonl is append-only, one {"unit": ..., "result": ...} line per completed unit, flushed as it is
+    written so a crash loses at most the unit in flight.  <name>.manifest.json holds run metadata such as
+    the time of the last finished run.
+    """
+
+    def __init__(self, name, directory="data/checkpoints"):
+        os.makedirs(directory, exist_ok=True)
+        self.log_path = os.path.join(directory, f"{name}.jsonl")
+        self.manifest_path = os.path.join(directory, f"{name}.manifest.json")
+        self._lock = threading.Lock()
+        self._results = {}
+        self.manifest = {}
+
+        if os.path.exists(self.log_path):
+            with open(self.log_path, "r") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # a line cut short by a crash, that unit simply runs again
+                        continue
+                    if entry.get("discarded"):
+                        self._results.pop(entry["unit"], None)
+                    else:
+                        self._results[entry["unit"]] = entry["result"]
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, "r") as f:
+                self.manifest = json.load(f)
+
+        self._log = open(self.log_path, "a")
+
+    def __contains__(self, unit):
+        return unit in self._results
+
+    def __len__(self):
+        return len(self._results)
+
+    def get(self, unit, default=None):
+        return self._results.get(unit, default)
+
+    def pending(self, units):
+        """The units that have not completed yet, in their original order."""
+        return [unit for unit in units if unit not in self._results]
+
+    def record(self, unit, result):
+        """Mark a unit complete and persist its result.  Safe to call from worker threads."""
+        with self._lock:
+            self._results[unit] = result
+            self._log.write(json.dumps({"unit": unit, "result": result}, separators=(',', ':')) + "\n")
+            self._log.flush()
+
+    def discard(self, units):
+        """Forget completed units so the next run does them again."""
+        with self._lock:
+            for unit in units:
+                if self._results.pop(unit, None) is not None:
+                    self._log.write(json.dumps({"unit": unit, "discarded": True}) + "\n")
+            self._log.flush()
+
+    def finish(self, **meta):
+        """Record a finished run (and any extra metadata) in the manifest."""
+        self.manifest.update(meta, last_run=datetime.now().isoformat(timespec="seconds"))
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def close(self):
+        self._log.close()
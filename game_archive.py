@@ -0,0 +1,289 @@
+"""
+game_archive.py
+local warehouse of the raw per-game payloads (boxscore, play-by-play and shift
+charts). every payload is downloaded once and kept compressed in append-only
+segment files, with an append-only index of where each game's payloads live, so
+a new per-game metric is a local scan of the archive instead of a re-download.
+only one process may write to the archive at a time: getData, stragglers and
+this script all add to it, and a writer holds data/archive/lock until it closes
+the archive, so a second writer waits for the first one to finish
+"""
+
+import argparse
+import concurrent.futures
+import json
+import os
+import sys
+import threading
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import fcntl
+except ImportError:
+    # not on Windows, where concurrent writers are simply not guarded against
+    fcntl = None
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "lib"))
+from myNHLapi.nhlpy.cache import FINAL_GAME_STATES
+from myNHLapi.nhlpy.decode import loads
+
+ARCHIVE_DIR = os.path.join('data', 'archive')
+KINDS = ('boxscore', 'play-by-play', 'shiftcharts')
+SEASONS = ['20222023', '20232024', '20242025']
+SEGMENT_SIZE = 256 * 1024 * 1024
+# zstd when it is installed; segments record their codec in the file extension, so both can be read back
+CODEC = 'zst' if zstandard is not None else 'zlib'
+
+
+class GameArchive:
+    """Raw payloads keyed by (game_id, kind), stored under data/archive.
+
+    segment-NNNNN.<codec> files hold the payloads, each compressed on its own so any one can be read back
+    directly.  index.jsonl has one {"game", "kind", "segment", "offset", "length"} line per payload, appended
+    after the payload itself is on disk, so a crash never indexes a partial write.  Safe to share between threads.
+
+    Single writer: the first put takes an exclusive lock on the lock file in the directory, held until close(), so
+    two processes never append to the same segment.  Payloads another process stored in the meantime are read into
+    the index once the lock is taken.  Reading never takes the lock.
+    """
+
+    def __init__(self, directory=ARCHIVE_DIR, segment_size=SEGMENT_SIZE, level=3):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.segment_size = segment_size
+        self.level = level
+        self._lock = threading.Lock()
+        self._read_lock = threading.Lock()
+        self._local = threading.local()
+        self._index = {}
+        self._readers = {}
+        self._segment = None
+        self._writer = None
+        self._write_lock = None
+        self._index_read = 0
+
+        index_path = os.path.join(directory, 'index.jsonl')
+        self._read_index(index_path)
+        self._index_log = open(index_path, 'a')
+
+    def __contains__(self, key):
+        game_id, kind = key
+        return (str(game_id), kind) in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def games(self, kind):
+        """Game ids with a stored payload of this kind."""
+        return sorted(game_id for game_id, k in self._index if k == kind)
+
+    def put(self, game_id, kind, body):
+        """Store a payload.  A (game_id, kind) already in the archive is kept as it is."""
+        key = (str(game_id), kind)
+        if key in self._index:
+            return
+        data = self._compress(body)
+        with self._lock:
+            writer = self._writable()
+            if key in self._index:
+                return
+            offset = writer.tell()
+            writer.write(data)
+            writer.flush()
+            self._index[key] = (self._segment, offset, len(data))
+            self._index_log.write(json.dumps({'game': key[0], 'kind': kind, 'segment': self._segment,
+                                              'offset': offset, 'length': len(data)}) + "\n")
+            self._index_log.flush()
+
+    def get(self, game_id, kind):
+        """The stored payload as bytes, or None if the archive does not have it."""
+        location = self._index.get((str(game_id), kind))
+        if location is None:
+            return None
+        segment, offset, length = location
+        with self._read_lock:
+            reader = self._readers.get(segment)
+            if reader is None:
+                reader = self._readers[segment] = open(os.path.join(self.directory, segment), 'rb')
+            reader.seek(offset)
+            data = reader.read(length)
+        return self._decompress(segment, data)
+
+    def scan(self, kind, game_ids=None):
+        """(game_id, payload) for every stored payload of a kind, optionally only for game_ids.
+
+        Payloads are read in the order they sit on disk, one segment at a time, which is much faster than
+        fetching them one by one in game order.
+        """
+        wanted = None if game_ids is None else {str(game_id) for game_id in game_ids}
+        with self._lock:
+            entries = list(self._index.items())
+        locations = sorted(
+            (segment, offset, length, game_id)
+            for (game_id, k), (segment, offset, length) in entries
+            if k == kind and (wanted is None or game_id in wanted)
+        )
+        f = None
+        current = None
+        try:
+            for segment, offset, length, game_id in locations:
+                if segment != current:
+                    if f is not None:
+                        f.close()
+                    f = open(os.path.join(self.directory, segment), 'rb')
+                    current = segment
+                f.seek(offset)
+                yield game_id, self._decompress(segment, f.read(length))
+        finally:
+            if f is not None:
+                f.close()
+
+    def close(self):
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            self._index_log.close()
+            if self._write_lock is not None:
+                # closing the file releases the lock
+                self._write_lock.close()
+                self._write_lock = None
+        with self._read_lock:
+            for reader in self._readers.values():
+                reader.close()
+            self._readers = {}
+
+    def _read_index(self, index_path):
+        """Add the index lines past the part already read, e.g. the ones another writer appended since."""
+        if not os.path.exists(index_path):
+            return
+        with open(index_path, 'r') as f:
+            f.seek(self._index_read)
+            while True:
+                line = f.readline()
+                if not line.endswith("\n"):
+                    # the end, or a line still being written
+                    break
+                self._index_read = f.tell()
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # a line cut short by a crash, that payload is simply fetched again
+                    continue
+                self._index[(entry['game'], entry['kind'])] = (entry['segment'], entry['offset'], entry['length'])
+
+    def _lock_writer(self):
+        """Take the archive's writer lock, waiting for another process that holds it to close its archive."""
+        self._write_lock = open(os.path.join(self.directory, 'lock'), 'a')
+        if fcntl is None:
+            return
+        try:
+            fcntl.flock(self._write_lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            print(f"{self.directory} is being written by another process, waiting for it to finish...")
+            fcntl.flock(self._write_lock, fcntl.LOCK_EX)
+
+    def _writable(self):
+        """The segment to append to, starting a new one once the current one is full."""
+        if self._write_lock is None:
+            self._lock_writer()
+            self._read_index(os.path.join(self.directory, 'index.jsonl'))
+        if self._writer is None:
+            segments = sorted(name for name in os.listdir(self.directory) if name.startswith('segment-'))
+            if segments and segments[-1].endswith('.' + CODEC):
+                self._segment = segments[-1]
+            else:
+                self._segment = f'segment-{len(segments):05d}.{CODEC}'
+            self._writer = open(os.path.join(self.directory, self._segment), 'ab')
+        if self._writer.tell() >= self.segment_size:
+            self._writer.close()
+            number = int(self._segment.split('-')[1].split('.')[0]) + 1
+            self._segment = f'segment-{number:05d}.{CODEC}'
+            self._writer = open(os.path.join(self.directory, self._segment), 'ab')
+        return self._writer
+
+    def _compress(self, body):
+        if CODEC == 'zlib':
+            return zlib.compress(body, 6)
+        # zstd contexts are not thread-safe, so each thread keeps its own
+        compressor = getattr(self._local, 'compressor', None)
+        if compressor is None:
+            compressor = self._local.compressor = zstandard.ZstdCompressor(level=self.level)
+        return compressor.compress(body)
+
+    def _decompress(self, segment, data):
+        if segment.endswith('.zlib'):
+            return zlib.decompress(data)
+        if zstandard is None:
+            raise ImportError(f"{segment} is zstd compressed, pip install zstandard to read it")
+        decompressor = getattr(self._local, 'decompressor', None)
+        if decompressor is None:
+            decompressor = self._local.decompressor = zstandard.ZstdDecompressor()
+        return decompressor.decompress(data)
+
+
+def fetch_payload(client, game_id, kind):
+    if kind == 'boxscore':
+        return client.game_center.boxscore(game_id=game_id, raw=True)
+    if kind == 'play-by-play':
+        return client.game_center.play_by_play(game_id, raw=True)
+    return client.game_center.shift_chart_data(game_id, raw=True)
+
+
+def archive_game(archive, client, game_id, kinds=KINDS):
+    """Download the kinds of a game the archive is missing.  Games that are not final are left out."""
+    bodies = {kind: fetch_payload(client, game_id, kind) for kind in kinds if (game_id, kind) not in archive}
+    # shift charts carry no game state, so a game only counts as final through its boxscore or play-by-play
+    if not any((game_id, kind) in archive for kind in ('play-by-play', 'boxscore')):
+        body = bodies.get('play-by-play') or bodies.get('boxscore') or fetch_payload(client, game_id, 'boxscore')
+        state = loads(body).get('gameState')
+        if state not in FINAL_GAME_STATES:
+            raise ValueError(f"game {game_id} is not final ({state})")
+    for kind, body in bodies.items():
+        archive.put(game_id, kind, body)
+
+
+def fill(archive, client, game_ids, kinds=KINDS, workers=8):
+    """Archive every game in game_ids, downloading on a thread pool."""
+    missing = [game_id for game_id in game_ids if any((game_id, kind) not in archive for kind in kinds)]
+    print(f"Archiving {len(missing)} of {len(game_ids)} games...")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(archive_game, archive, client, game_id, kinds): game_id for game_id in missing}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Error archiving game {futures[future]}: {e}")
+
+
+def load_game_ids(season):
+    with open(f"gameIds/{season}.txt", "r") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def main():
+    from myNHLapi.nhlpy import NHLClient
+    from myNHLapi.nhlpy.cassette import cassette_from_env
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--season", action="append", choices=SEASONS, help="seasons to archive, defaults to all")
+    parser.add_argument("--kind", action="append", choices=KINDS, help="payloads to archive, defaults to all")
+    args = parser.parse_args()
+
+    archive = GameArchive()
+    with NHLClient(max_connections=16, max_keepalive_connections=16, cassette=cassette_from_env(),
+                   base_url=os.environ.get("NHL_API_BASE_URL")) as client:
+        for season in args.season or SEASONS:
+            fill(archive, client, load_game_ids(season), kinds=tuple(args.kind or KINDS))
+    for kind in KINDS:
+        print(f"{kind}: {len(archive.games(kind))} games")
+    archive.close()
+
+
+if __name__ == "__main__":
+    main()
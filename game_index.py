@@ -0,0 +1,109 @@
+"""
+game_index.py
+per-season index of every game with its date, type and state, kept under
+data/index. the first run discovers a season from all teams' schedules at
+once; later runs only scan the league schedule from the earliest unfinished
+game onwards, so new and newly finished games are picked up without a full crawl
+"""
+
+import concurrent.futures
+import json
+import os
+from datetime import date, timedelta
+from functools import lru_cache
+
+INDEX_DIR = os.path.join('data', 'index')
+WEEK_WORKERS = 8
+
+
+@lru_cache(maxsize=None)
+def get_teams(client):
+    """client.teams.teams(), fetched once per run however many seasons are indexed."""
+    return client.teams.teams()
+
+
+def season_end(season):
+    """The day after which no game of the season is played: the playoffs are over by September."""
+    return date(int(season[4:]), 9, 1)
+
+
+class GameIndex:
+    """The games of one season as {game_id: {"date", "type", "state"}}, stored in data/index/<season>_games.json.
+
+    scanned_through is the last date the league schedule was read up to; games on later dates are not known yet.
+    """
+
+    def __init__(self, season, directory=INDEX_DIR):
+        self.season = season
+        self.path = os.path.join(directory, f'{season}_games.json')
+        self.games = {}
+        self.scanned_through = None
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                stored = json.load(f)
+            self.games = stored['games']
+            self.scanned_through = stored['scanned_through']
+
+    def __len__(self):
+        return len(self.games)
+
+    def game_ids(self, game_types=None, game_states=None):
+        """Indexed game ids in date order, optionally only of some game types and states."""
+        return [
+            game_id for game_id, game in sorted(self.games.items(), key=lambda item: (item[1]['date'] or '', item[0]))
+            if (not game_types or game['type'] in game_types) and (not game_states or game['state'] in game_states)
+        ]
+
+    def add(self, game):
+        self.games[str(game['id'])] = {'date': game['gameDate'], 'type': game['gameType'], 'state': game['gameState']}
+
+    def update(self, client, today=None):
+        """Bring the index up to today, returning the ids of games that are new to it.
+
+        An empty index is filled from every team's season schedule.  Otherwise the league's weekly schedule is read
+        from the earliest game that was not final yet, or from scanned_through if every game was, which covers both
+        games that finished since and games scheduled since.
+        """
+        from myNHLapi.nhlpy.cache import FINAL_GAME_STATES
+
+        today = today or date.today()
+        end = min(today, season_end(self.season))
+        known = set(self.games)
+
+        if not self.games:
+            for game in client.helpers.season_games(self.season, teams=get_teams(client)):
+                self.add(game)
+        else:
+            unfinished = [game['date'] for game in self.games.values() if game['state'] not in FINAL_GAME_STATES]
+            start = date.fromisoformat(min(unfinished + [self.scanned_through]))
+            if not unfinished and start >= end:
+                # a finished season, or one already read up to today
+                start = end + timedelta(days=1)
+            weeks = []
+            while start <= end:
+                weeks.append(start.isoformat())
+                start += timedelta(days=7)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=WEEK_WORKERS) as executor:
+                for schedule in executor.map(client.schedule.weekly_schedule, weeks):
+                    for day in schedule.get('gameWeek', []):
+                        for game in day.get('games', []):
+                            if str(game.get('season')) == self.season:
+                                self.add({**game, 'gameDate': day['date']})
+
+        self.scanned_through = end.isoformat()
+        self.save()
+        return [game_id for game_id in self.game_ids() if game_id not in known]
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path + ".tmp", 'w') as f:
+            json.dump({'scanned_through': self.scanned_through, 'games': self.games}, f, separators=(',', ':'))
+        os.replace(self.path + ".tmp", self.path)
+
+
+def update_season(client, season, today=None):
+    """The season's GameIndex, updated and saved."""
+    index = GameIndex(season)
+    added = index.update(client, today=today)
+    print(f"Season {season}: {len(index)} games indexed, {len(added)} new")
+    return index
@@ -3,7 +3,9 @@ getRanking.py
 calculate player rankings based on performance metrics.
 """
 
+import argparse
 import csv
+import gzip
 import math
 import sys
 import os
@@ -16,28 +18,104 @@ from datetime import datetime
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "lib"))
 from myNHLapi.nhlpy import NHLClient
-client = NHLClient()
+from myNHLapi.nhlpy.cache import FINAL_GAME_STATES, SQLiteResponseCache
+from myNHLapi.nhlpy.cassette import cassette_from_env
+from myNHLapi.nhlpy.decode import decode_boxscore
+from checkpoint import Checkpoint
+from snapshot import build_snapshot
+from game_archive import GameArchive
+
+# finished games never change, so reruns read them from the on-disk cache instead of the network
+cache = SQLiteResponseCache("data/cache/nhl_api.sqlite3")
+# one pooled client shared by every worker thread; size the pool to the default executor width
+client = NHLClient(max_connections=32, max_keepalive_connections=32, cache=cache,
+                   cassette=cassette_from_env(), base_url=os.environ.get("NHL_API_BASE_URL"), fast_json=True)
+archive = GameArchive()
 
 def load_player_list(filename):
     """Load player IDs from a txt file into a list."""
     with open(filename, 'r') as f:
         return [line.strip() for line in f if line.strip()]
 
-@lru_cache(maxsize=1024)
-def get_player_boxscore(player_id, game_id):
-    boxscore = client.game_center.boxscore(game_id=game_id)
-    for team in ['homeTeam', 'awayTeam']:
-        for position in ['forwards', 'defense']:
-            for player in boxscore['playerByGameStats'][team][position]:
-                if str(player['playerId']) == str(player_id):
-                    return player
+# per-game boxscore fields the stdev pass needs; index rows store them positionally in this order
+BOXSCORE_FIELDS = ('position', 'faceoffWinningPctg', 'blockedShots', 'hits')
+INDEX_SAVE_EVERY = 200
+
+def load_game_ids(season):
+    with open(f"gameIds/{season}.txt", "r") as f:
+        return [line.strip() for line in f if line.strip()]
+
+def get_boxscore_rows(game_id):
+    """Fetch one boxscore and reduce it to {player_id: [BOXSCORE_FIELDS...]} for every skater in the game.
+
+    The boxscore comes from the game archive when it has it; fetched boxscores of final games are added to it.
+    """
+    body = archive.get(game_id, 'boxscore')
+    fetched = body is None
+    if fetched:
+        body = client.game_center.boxscore(game_id=game_id, raw=True)
+    boxscore = decode_boxscore(body)
+    if fetched and boxscore.gameState in FINAL_GAME_STATES:
+        archive.put(game_id, 'boxscore', body)
+    rows = {}
+    for team in [boxscore.playerByGameStats.homeTeam, boxscore.playerByGameStats.awayTeam]:
+        for player in team.forwards + team.defense:
+            rows[str(player.playerId)] = [getattr(player, field) or 0 for field in BOXSCORE_FIELDS]
+    return rows
+
+def build_boxscore_index(season, index=None):
+    """Download the games in gameIds/<season>.txt missing from index, write {game_id: {player_id: row}} to data/index.
+
+    The index is saved every INDEX_SAVE_EVERY games, so an interrupted build resumes from where it stopped.
+    """
+    index = {} if index is None else index
+    game_ids = [game_id for game_id in load_game_ids(season) if game_id not in index]
+    print(f"Indexing {len(game_ids)} boxscores for season {season}...")
+
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        futures = {executor.submit(get_boxscore_rows, game_id): game_id for game_id in game_ids}
+        for n, future in enumerate(concurrent.futures.as_completed(futures), 1):
+            try:
+                index[futures[future]] = future.result()
+            except Exception as e:
+                print(f"Error fetching boxscore for game {futures[future]}: {e}")
+            if n % INDEX_SAVE_EVERY == 0:
+                save_boxscore_index(season, index)
+
+    save_boxscore_index(season, index)
+    return index
+
+def save_boxscore_index(season, index):
+    os.makedirs("data/index", exist_ok=True)
+    path = f"data/index/{season}_boxscores.json.gz"
+    with gzip.open(path + ".tmp", "wt") as f:
+        json.dump({'fields': BOXSCORE_FIELDS, 'games': index}, f, separators=(',', ':'))
+    os.replace(path + ".tmp", path)
+
+@lru_cache(maxsize=None)
+def get_boxscore_index(season):
+    """The season's boxscore index, read from disk and topped up with any games it does not have yet."""
+    path = f"data/index/{season}_boxscores.json.gz"
+    index = None
+    if os.path.exists(path):
+        with gzip.open(path, "rt") as f:
+            stored = json.load(f)
+        if tuple(stored['fields']) == BOXSCORE_FIELDS:
+            index = stored['games']
+            if all(game_id in index for game_id in load_game_ids(season)):
+                return index
+    return build_boxscore_index(season, index)
+
+def get_player_boxscore(player_id, game_id, season_id):
+    row = get_boxscore_index(str(season_id))[str(game_id)][str(player_id)]
+    return dict(zip(BOXSCORE_FIELDS, row))
 
 def get_player_gamelog(player_id, season_id, game_type, summary):
     try:
         gamelog = client.stats.player_game_log(player_id, season_id, game_type)
     except Exception as e:
         print(f"Error fetching gamelog for player {player_id}, season {season_id}: {e}")
-        return []
+        return None
     
     output = {}
 
@@ -66,7 +144,7 @@ def get_player_gamelog(player_id, season_id, game_type, summary):
     
     for game in gamelog:
         try:
-            boxscore = get_player_boxscore(player_id, game['gameId'])
+            boxscore = get_player_boxscore(player_id, game['gameId'], season_id)
             output['position'] = 'F' if boxscore['position'] != 'D' else 'D'
             output['points_sd'] += (game['points'] - average['points_avg'])**2
             output['plusMinus_sd'] += (game['plusMinus'] - average['plusMinus_avg'])**2
@@ -88,28 +166,53 @@ def get_player_gamelog(player_id, season_id, game_type, summary):
 
     return {**output, **average}
 
-def get_player_stats(player_id):
+SEASONS = ['20222023', '20232024', '20242025']
+
+def get_player_stats(player_id, summarys=None, checkpoint=None):
+    """summarys are the player's season rows, e.g. from client.stats.bulk_player_stats; fetched here if None.
+
+    Player-seasons already in the checkpoint are reused, new ones are recorded as soon as they are computed.
+    """
 
-    seasons = ['20222023', '20232024', '20242025']
     output = {}
 
-    try:
-        summarys = client.stats.get_player_stats(player_id, start='20222023', end='20242025')
-    except Exception as e:
-        print(f"Error fetching stats for player {player_id}: {e}")
-        summarys = [{},{},{}]
-    for season in seasons:
+    if summarys is None:
+        try:
+            summarys = client.stats.get_player_stats(player_id, start='20222023', end='20242025')
+        except Exception as e:
+            print(f"Error fetching stats for player {player_id}: {e}")
+            summarys = []
+    for season in SEASONS:
+        unit = f"{player_id}:{season}"
+        if checkpoint is not None and unit in checkpoint:
+            output[season] = checkpoint.get(unit)
+            continue
         for summary in summarys:
             if str(summary['seasonId']) == str(season):
                gamelog = get_player_gamelog(player_id, season_id=season, game_type=2,summary=summary)
+               if gamelog is None:
+                   continue
                output[season] = {**summary, **gamelog}
+               if checkpoint is not None:
+                   checkpoint.record(unit, output[season])
 
-    print(f"Fetched stats for player {summarys[0].get('skaterFullName','Unknown')} ({player_id})")
-    return parse_player_data(output)
+    name = summarys[0].get('skaterFullName', 'Unknown') if summarys else 'Unknown'
+    print(f"Fetched stats for player {name} ({player_id})")
+    return output
 
 
 def main():
-    request_player_bios()
+    parser = argparse.ArgumentParser(description="Fetch player data from the NHL API.")
+    parser.add_argument("task", nargs="?", choices=["bios", "players"], default="bios")
+    parser.add_argument("--since", action="store_true",
+                        help="players: redo the current season only, fetching boxscores just for new games")
+    args = parser.parse_args()
+    with client:
+        if args.task == "players":
+            request_player_data(since=args.since)
+        else:
+            request_player_bios()
+    print(f"API cache: {cache.stats()}, duplicate requests saved: {client.single_flight.saved}")
 
 
 
@@ -121,7 +224,8 @@ def get_full_data_set(season):
 
     output = {}
     for player in raw:
-        new_dict = {**player, **additional[player['playerId']], **ratios[player['playerId']]}
+        # the summary/realtime totals take precedence over the play-by-play counts of the same name
+        new_dict = {**additional[player['playerId']], **player, **ratios[player['playerId']]}
         new_dict['faceoff_ratio'] = float(additional[player['playerId']]['faceoff_avg']/(additional[player['playerId']]['faceoff_sd']+1))
         new_dict['fights_ratio'] = float(additional[player['playerId']]['fights']/player['gamesPlayed'])
         new_dict['faceoff'] = additional[player['playerId']]['faceoffWins']
@@ -220,17 +324,40 @@ def convert_season_data(data_list):
 
     return result   
 
-def request_player_data():
+def request_player_data(since=False):
+    """Fetch every player-season, resuming from data/checkpoints/players, and write the per-season outputs.
+
+    With since, the current season's player-seasons are redone (their stats have moved on) while completed
+    seasons and already indexed games are reused.  Run ``stragglers.py --since`` first to add the new game IDs.
+    """
     player_list = load_player_list("player_list.txt")
     print(f"Loaded {len(player_list)} players.")
-    
-    
-    raw_data = []
+
+    checkpoint = Checkpoint("players")
+    if since:
+        checkpoint.discard([f"{player}:{SEASONS[-1]}" for player in player_list])
+    print(f"Resuming with {len(checkpoint)} player-seasons already done.")
+
+    # build every season's boxscore index up front so the player workers only do dictionary lookups
+    for season in SEASONS:
+        get_boxscore_index(season)
+
+    # one paginated league-wide pull per report instead of two requests per player
+    bulk = client.stats.bulk_player_stats(start='20222023', end='20242025')
+
     with concurrent.futures.ThreadPoolExecutor() as executor:
-        results = list(executor.map(get_player_stats, player_list))
-    raw_data.extend(results)
-   
-    
+        results = list(executor.map(lambda player: get_player_stats(player, bulk.get(player, []), checkpoint),
+                                    player_list))
+    raw_data = [result for result in results if result]
+
+    with open("player_data_full.json", "w") as f:
+        json.dump(raw_data, f, indent=2)
+    parse_player_data(raw_data)
+    build_snapshot()
+
+    checkpoint.finish(players=len(raw_data))
+    checkpoint.close()
+    archive.close()
 
 
 def request_player_bios():
@@ -256,6 +383,7 @@ def request_player_bios():
         out[player] = data
     
     json.dump(out, open("data/json/player_bios.json", "w"), indent=2)
+    build_snapshot(datasets=[])
 
 def calculate_age(birthday_str):
     birthday = datetime.strptime(birthday_str, "%Y-%m-%d")
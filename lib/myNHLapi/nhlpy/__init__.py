@@ -1 +1 @@
-from .nhl_client import NHLClient  # noqa: F401
+from .nhl_client import AsyncNHLClient, NHLClient  # noqa: F401
@@ -1,16 +1,18 @@
-from typing import Optional, List
-from myNHLapi.nhlpy.http_client import HttpClient, Endpoint
+from typing import Any, AsyncIterator, Iterator, Optional, List, Tuple, Union
+from myNHLapi.nhlpy.http_client import AsyncHttpClient, HttpClient, Endpoint
+from myNHLapi.nhlpy.json_stream import aiter_items, iter_items
 
 
 class GameCenter:
     def __init__(self, http_client: HttpClient):
         self.client = http_client
 
-    def boxscore(self, game_id: str) -> dict:
+    def boxscore(self, game_id: str, raw: bool = False) -> Union[dict, bytes]:
         """Get boxscore data for a specific NHL game. GameIds can be retrieved from the schedule endpoint.
 
         Args:
            game_id (str): The game_id for the game you want the boxscore for
+           raw (bool): Return the undecoded JSON body as bytes, e.g. to decode it in another process
 
         Example:
            API endpoint format: https://api-web.nhle.com/v1/gamecenter/2023020280/boxscore
@@ -18,18 +20,34 @@ class GameCenter:
         Returns:
            dict: Game boxscore data
         """
-        return self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"gamecenter/{game_id}/boxscore").json()
+        response = self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"gamecenter/{game_id}/boxscore")
+        return response.content if raw else self.client.json(response)
 
-    def play_by_play(self, game_id: str) -> dict:
+    def play_by_play(
+        self, game_id: str, raw: bool = False, stream: bool = False
+    ) -> Union[dict, bytes, Iterator[Tuple[str, Any]]]:
         """Get play-by-play data for a specific NHL game. GameIds can be retrieved from the schedule endpoint.
 
         Args:
            game_id (str): The game_id for the game you want the play by play for
+           raw (bool): Return the undecoded JSON body as bytes, e.g. to decode it in another process
+           stream (bool): Return an iterator of the document's top-level (key, value) pairs, parsed while the
+              response downloads.  ``plays`` comes one play at a time as ("plays", play), so memory stays flat
+
+        Example:
+           for key, value in client.game_center.play_by_play(game_id, stream=True):
+               if key == "plays": ...
 
         Returns:
            dict: Play-by-play game data
         """
-        return self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"gamecenter/{game_id}/play-by-play").json()
+        if stream:
+            return iter_items(
+                self.client.stream(endpoint=Endpoint.API_WEB_V1, resource=f"gamecenter/{game_id}/play-by-play"),
+                expand=("plays",),
+            )
+        response = self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"gamecenter/{game_id}/play-by-play")
+        return response.content if raw else self.client.json(response)
 
     def match_up(self, game_id: str) -> dict:
         """Get detailed match up information for a specific NHL game. GameIds can be retrieved
@@ -41,7 +59,7 @@ class GameCenter:
         Returns:
            dict: Detailed game matchup data
         """
-        return self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"gamecenter/{game_id}/landing").json()
+        return self.client.get_json(endpoint=Endpoint.API_WEB_V1, resource=f"gamecenter/{game_id}/landing")
 
     def daily_scores(self, date: Optional[str] = None) -> dict:
         """Get scores for NHL games on a specific date or current day.
@@ -53,27 +71,31 @@ class GameCenter:
         Returns:
            dict: Game scores and status information
         """
-        return self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"score/{date if date else 'now'}").json()
+        return self.client.get_json(endpoint=Endpoint.API_WEB_V1, resource=f"score/{date if date else 'now'}")
 
-    def shift_chart_data(self, game_id: str, excludes: List[str] = None) -> dict:
+    def shift_chart_data(self, game_id: str, excludes: List[str] = None, raw: bool = False) -> Union[dict, bytes]:
         """Gets shift chart data for a specific game.
 
         Args:
            game_id (str): ID of the game to retrieve shift data for. Game IDs can be retrieved
                from the schedule endpoint.
            excludes (List[str]): List of items to exclude from the response.
+           raw (bool): Return the undecoded JSON body as bytes
 
         Returns:
            Dict containing the shift chart data.
         """
+        response = self.client.get(endpoint=Endpoint.API_STATS, resource=self._shift_chart_resource(game_id, excludes))
+        return response.content if raw else self.client.json(response)
+
+    @staticmethod
+    def _shift_chart_resource(game_id: str, excludes: List[str] = None) -> str:
         if excludes is None:
             excludes = ["eventDetails"]
 
         exclude_p: str = ",".join(excludes)
         expr_p: str = f"gameId={game_id} and ((duration != '00:00' and typeCode = 517) or typeCode != 517 )"
-        return self.client.get(
-            endpoint=Endpoint.API_STATS, resource=f"en/shiftcharts?cayenneExp={expr_p}&exclude={exclude_p}"
-        ).json()
+        return f"en/shiftcharts?cayenneExp={expr_p}&exclude={exclude_p}"
 
     def season_series_matchup(self, game_id: str) -> dict:
         """Gets game stats and season series information for a specific game.
@@ -85,7 +107,7 @@ class GameCenter:
         Returns:
            Dict containing game stats and season series data.
         """
-        return self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"gamecenter/{game_id}/right-rail").json()
+        return self.client.get_json(endpoint=Endpoint.API_WEB_V1, resource=f"gamecenter/{game_id}/right-rail")
 
     def game_story(self, game_id: str) -> dict:
         """Gets game story information for a specific game.
@@ -97,4 +119,49 @@ class GameCenter:
         Returns:
            Dict containing game story data.
         """
-        return self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"wsc/game-story/{game_id}").json()
+        return self.client.get_json(endpoint=Endpoint.API_WEB_V1, resource=f"wsc/game-story/{game_id}")
+
+
+class AsyncGameCenter(GameCenter):
+    """asyncio version of ``GameCenter``.  Every method is a coroutine with the same arguments and return value."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self.client = http_client
+
+    async def boxscore(self, game_id: str, raw: bool = False) -> Union[dict, bytes]:
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"gamecenter/{game_id}/boxscore")
+        return response.content if raw else self.client.json(response)
+
+    async def play_by_play(
+        self, game_id: str, raw: bool = False, stream: bool = False
+    ) -> Union[dict, bytes, AsyncIterator[Tuple[str, Any]]]:
+        """With stream=True this returns an async iterator: ``async for key, value in await ...play_by_play(...)``."""
+        if stream:
+            return aiter_items(
+                self.client.stream(endpoint=Endpoint.API_WEB_V1, resource=f"gamecenter/{game_id}/play-by-play"),
+                expand=("plays",),
+            )
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"gamecenter/{game_id}/play-by-play")
+        return response.content if raw else self.client.json(response)
+
+    async def match_up(self, game_id: str) -> dict:
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"gamecenter/{game_id}/landing")
+        return self.client.json(response)
+
+    async def daily_scores(self, date: Optional[str] = None) -> dict:
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"score/{date if date else 'now'}")
+        return self.client.json(response)
+
+    async def shift_chart_data(self, game_id: str, excludes: List[str] = None, raw: bool = False) -> Union[dict, bytes]:
+        response = await self.client.get(
+            endpoint=Endpoint.API_STATS, resource=self._shift_chart_resource(game_id, excludes)
+        )
+        return response.content if raw else self.client.json(response)
+
+    async def season_series_matchup(self, game_id: str) -> dict:
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"gamecenter/{game_id}/right-rail")
+        return self.client.json(response)
+
+    async def game_story(self, game_id: str) -> dict:
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"wsc/game-story/{game_id}")
+        return self.client.json(response)
@@ -1,13 +1,17 @@
+import asyncio
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Any
 
 from myNHLapi.nhlpy.api.query.builder import QueryBuilder
 from myNHLapi.nhlpy.api.query.filters.franchise import FranchiseQuery
 from myNHLapi.nhlpy.api.query.filters.season import SeasonQuery
-from myNHLapi.nhlpy.api.stats import Stats
-from myNHLapi.nhlpy.api.teams import Teams
-from myNHLapi.nhlpy.http_client import HttpClient
+from myNHLapi.nhlpy.api.stats import AsyncStats, Stats
+from myNHLapi.nhlpy.api.teams import AsyncTeams, Teams
+from myNHLapi.nhlpy.http_client import AsyncHttpClient, HttpClient
+
+# team schedules fetched at once by the sync client; the rate limiter still paces the requests themselves
+_SCHEDULE_WORKERS = 8
 
 
 class Helpers:
@@ -20,7 +24,14 @@ class Helpers:
         """
         return name[ntype]["default"]
 
-    def game_ids_by_season(self, season: str, game_types: List[int] = None, api_sleep_rate: float = 1) -> List[str]:
+    def game_ids_by_season(
+        self,
+        season: str,
+        game_types: List[int] = None,
+        api_sleep_rate: float = 1,
+        game_states: List[str] = None,
+        teams: List[dict] = None,
+    ) -> List[str]:
         """Gets all game IDs for a specified season.
 
         Args:
@@ -29,41 +40,70 @@ class Helpers:
                1: Preseason
                2: Regular season
                3: Playoffs
-        api_sleep_rate (float): Sleep rate in seconds between API calls to avoid hitting rate limits.
+        api_sleep_rate (float): Deprecated and ignored, requests are paced by the client's rate limiter.
+           game_states (List[str]): Only include games in these states, e.g. ["OFF", "FINAL"] for finished games.
+           teams (List[dict]): Result of ``teams()`` to reuse, so repeated calls do not fetch it again.
 
         Returns:
-           List of game IDs for the specified season and game types.
+           List of game IDs for the specified season and game types, each game once, in date order.
+        """
+        return [game["id"] for game in self.season_games(season, game_types, game_states, teams)]
+
+    def season_games(
+        self, season: str, game_types: List[int] = None, game_states: List[str] = None, teams: List[dict] = None
+    ) -> List[dict]:
+        """Gets every game of a season with its date, type and state.
+
+        Every team's season schedule is requested concurrently and games, which show up in both teams'
+        schedules, are kept once.
+
+        Args:
+           season (str): Season in YYYYYYYY format (e.g., 20232024).
+           game_types (List[int]): Game types to include, see ``game_ids_by_season``. Defaults to all.
+           game_states (List[str]): Game states to include (e.g. "FUT", "LIVE", "OFF", "FINAL"). Defaults to all.
+           teams (List[dict]): Result of ``teams()`` to reuse, so repeated calls do not fetch it again.
+
+        Returns:
+           List of {"id", "gameDate", "gameType", "gameState"} dicts sorted by date and ID.
         """
-        from myNHLapi.nhlpy.api.teams import Teams
         from myNHLapi.nhlpy.api.schedule import Schedule
 
-        teams = Teams(self.client).teams()
+        if teams is None:
+            teams = Teams(self.client).teams()
 
-        game_ids = []
         schedule_api = Schedule(self.client)
-        for team in teams:
-            team_abbr = team.get("abbr", "")
-            if not team_abbr:
-                continue
+        team_abbrs = [team["abbr"] for team in teams if team.get("abbr")]
+        with ThreadPoolExecutor(max_workers=_SCHEDULE_WORKERS) as executor:
+            schedules = list(executor.map(lambda abbr: schedule_api.team_season_schedule(abbr, season), team_abbrs))
 
-            time.sleep(api_sleep_rate)
-            schedule = schedule_api.team_season_schedule(team_abbr, season)
-            games = schedule.get("games", [])
+        return self._season_games(schedules, game_types, game_states)
 
-            for game in games:
-                game_type = game.get("gameType")
+    @staticmethod
+    def _season_games(schedules: List[dict], game_types: List[int] = None, game_states: List[str] = None) -> List[dict]:
+        games = {}
+        for schedule in schedules:
+            for game in schedule.get("games", []):
                 game_id = game.get("id")
-
-                if game_id and (not game_types or game_type in game_types):
-                    game_ids.append(game_id)
-
-        return game_ids
+                if not game_id or game_id in games:
+                    continue
+                if game_types and game.get("gameType") not in game_types:
+                    continue
+                if game_states and game.get("gameState") not in game_states:
+                    continue
+                games[game_id] = {
+                    "id": game_id,
+                    "gameDate": game.get("gameDate"),
+                    "gameType": game.get("gameType"),
+                    "gameState": game.get("gameState"),
+                }
+
+        return sorted(games.values(), key=lambda game: (game["gameDate"] or "", game["id"]))
 
     def all_players(self, season: str, api_sleep_rate: float = 0.5) -> List[dict[str, Any]]:
         """Gets all player base stats.
 
         Args:
-            api_sleep_rate (float): Sleep rate in seconds between API calls to avoid hitting rate limits.
+            api_sleep_rate (float): Deprecated and ignored, requests are paced by the client's rate limiter.
 
         Returns:
             List of player base stats.
@@ -76,24 +116,30 @@ class Helpers:
         print("Fetching all player base stats. This may take a while...")
         out_data = []
         for team in teams:
-            time.sleep(api_sleep_rate)
-            players = teams_client.roster_by_team(team_abbr=team["abbr"], season=season)
+            players = teams_client.team_roster(team_abbr=team["abbr"], season=season)
+
+            out_data.extend(self._clean_roster(players, team["abbr"]))
+
+        return out_data
 
-            # Tweak and clean some player data
-            for p in players["forwards"] + players["defensemen"] + players["goalies"]:
-                p["team"] = team["abbr"]
-                p["firstName"] = self._clean_name("firstName", p)
-                p["lastName"] = self._clean_name("lastName", p)
+    def _clean_roster(self, players: dict, team_abbr: str) -> List[dict]:
+        # Tweak and clean some player data
+        out_data = []
+        for p in players["forwards"] + players["defensemen"] + players["goalies"]:
+            p["team"] = team_abbr
+            p["firstName"] = self._clean_name("firstName", p)
+            p["lastName"] = self._clean_name("lastName", p)
 
-                out_data.append(p)
+            out_data.append(p)
 
         return out_data
 
     def all_players_summary_statistics(self, season: str, api_sleep_rate: float = 1):
-        """Gets all player summary statistics for a specified season."""
-        logging.warning(
-            "This method will take a while to run.  In the event of rate limiting, you may need to increase the api_sleep_rate."
-        )
+        """Gets all player summary statistics for a specified season.
+
+        api_sleep_rate is deprecated and ignored, requests are paced by the client's rate limiter.
+        """
+        logging.warning("This method will take a while to run.")
         players = self.all_players(season, api_sleep_rate=api_sleep_rate)
         teams = Teams(self.client).teams()
         stats_client = Stats(self.client)
@@ -103,7 +149,6 @@ class Helpers:
 
         out_data = []
         for team in teams:
-            time.sleep(api_sleep_rate)
             fran_query = FranchiseQuery(franchise_id=team["franchise_id"])
             context = query_builder.build(filters=[fran_query, season_query])
 
@@ -112,6 +157,10 @@ class Helpers:
             )
             out_data.extend(data.get("data", []))
 
+        return self._merge_players_with_stats(players, out_data)
+
+    @staticmethod
+    def _merge_players_with_stats(players: List[dict], out_data: List[dict]) -> List[dict]:
         # Create a dictionary for fast player lookup by id
         player_dict = {player["id"]: player for player in players}
 
@@ -128,3 +177,77 @@ class Helpers:
                 merged_data.append(stat_entry)
 
         return merged_data
+
+
+class AsyncHelpers(Helpers):
+    """asyncio version of ``Helpers``.  Every public method is a coroutine with the same arguments and return value."""
+
+    def __init__(self, http_client: AsyncHttpClient) -> None:
+        self.client = http_client
+
+    async def game_ids_by_season(
+        self,
+        season: str,
+        game_types: List[int] = None,
+        api_sleep_rate: float = 1,
+        game_states: List[str] = None,
+        teams: List[dict] = None,
+    ) -> List[str]:
+        return [game["id"] for game in await self.season_games(season, game_types, game_states, teams)]
+
+    async def season_games(
+        self, season: str, game_types: List[int] = None, game_states: List[str] = None, teams: List[dict] = None
+    ) -> List[dict]:
+        from myNHLapi.nhlpy.api.schedule import AsyncSchedule
+
+        if teams is None:
+            teams = await AsyncTeams(self.client).teams()
+
+        schedule_api = AsyncSchedule(self.client)
+        # the rate limiter paces these, so every team's schedule can be requested at once
+        schedules = await asyncio.gather(
+            *(schedule_api.team_season_schedule(team["abbr"], season) for team in teams if team.get("abbr"))
+        )
+
+        return self._season_games(schedules, game_types, game_states)
+
+    async def all_players(self, season: str, api_sleep_rate: float = 0.5) -> List[dict[str, Any]]:
+        teams_client = AsyncTeams(self.client)
+        teams = await teams_client.teams()
+
+        print("Fetching all player base stats. This may take a while...")
+        rosters = await asyncio.gather(
+            *(teams_client.team_roster(team_abbr=team["abbr"], season=season) for team in teams)
+        )
+
+        out_data = []
+        for team, players in zip(teams, rosters):
+            out_data.extend(self._clean_roster(players, team["abbr"]))
+
+        return out_data
+
+    async def all_players_summary_statistics(self, season: str, api_sleep_rate: float = 1):
+        logging.warning("This method will take a while to run.")
+        players = await self.all_players(season, api_sleep_rate=api_sleep_rate)
+        teams = await AsyncTeams(self.client).teams()
+        stats_client = AsyncStats(self.client)
+
+        season_query = SeasonQuery(season_start=season, season_end=season)
+        query_builder = QueryBuilder()
+
+        contexts = [
+            query_builder.build(filters=[FranchiseQuery(franchise_id=team["franchise_id"]), season_query])
+            for team in teams
+        ]
+        results = await asyncio.gather(
+            *(
+                stats_client.skater_stats_with_query_context(report_type="summary", query_context=c, aggregate=True)
+                for c in contexts
+            )
+        )
+
+        out_data = []
+        for data in results:
+            out_data.extend(data.get("data", []))
+
+        return self._merge_players_with_stats(players, out_data)
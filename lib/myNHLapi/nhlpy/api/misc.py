@@ -1,6 +1,6 @@
 from typing import List
 
-from myNHLapi.nhlpy.http_client import HttpClient, Endpoint
+from myNHLapi.nhlpy.http_client import AsyncHttpClient, HttpClient, Endpoint
 
 
 class Misc:
@@ -13,7 +13,7 @@ class Misc:
         Returns:
            dict: NHL API glossary data
         """
-        response = self.client.get(endpoint=Endpoint.API_CORE, resource="stats/rest/en/glossary?sort=fullName").json()
+        response = self.client.get_json(endpoint=Endpoint.API_CORE, resource="stats/rest/en/glossary?sort=fullName")
         return response.get("data", [])
 
     def config(self) -> dict:
@@ -22,7 +22,7 @@ class Misc:
         Returns:
            dict: Dictionary of filter options
         """
-        return self.client.get(endpoint=Endpoint.API_CORE, resource="stats/rest/en/config").json()
+        return self.client.get_json(endpoint=Endpoint.API_CORE, resource="stats/rest/en/config")
 
     def countries(self) -> List[dict]:
         """Get list of countries from NHL API.
@@ -30,7 +30,7 @@ class Misc:
         Returns:
            dict: Dictionary of country data
         """
-        response = self.client.get(endpoint=Endpoint.API_CORE, resource="stats/rest/en/country").json()
+        response = self.client.get_json(endpoint=Endpoint.API_CORE, resource="stats/rest/en/country")
         return response.get("data", [])
 
     def season_specific_rules_and_info(self) -> List[dict]:
@@ -39,7 +39,7 @@ class Misc:
         Returns:
            dict: Dictionary containing season-specific rules and information
         """
-        response = self.client.get(endpoint=Endpoint.API_CORE, resource="stats/rest/en/season").json()
+        response = self.client.get_json(endpoint=Endpoint.API_CORE, resource="stats/rest/en/season")
         return response.get("data", [])
 
     def draft_year_and_rounds(self) -> List[dict]:
@@ -48,5 +48,32 @@ class Misc:
         Returns:
            dict: Draft data containing 'id', 'draftYear', and 'rounds count'
         """
-        response = self.client.get(endpoint=Endpoint.API_CORE, resource="stats/rest/en/draft").json()
+        response = self.client.get_json(endpoint=Endpoint.API_CORE, resource="stats/rest/en/draft")
         return response.get("data", [])
+
+
+class AsyncMisc(Misc):
+    """asyncio version of ``Misc``.  Every method is a coroutine with the same arguments and return value."""
+
+    def __init__(self, http_client: AsyncHttpClient) -> None:
+        self.client = http_client
+
+    async def glossary(self) -> List[dict]:
+        response = await self.client.get(endpoint=Endpoint.API_CORE, resource="stats/rest/en/glossary?sort=fullName")
+        return self.client.json(response).get("data", [])
+
+    async def config(self) -> dict:
+        response = await self.client.get(endpoint=Endpoint.API_CORE, resource="stats/rest/en/config")
+        return self.client.json(response)
+
+    async def countries(self) -> List[dict]:
+        response = await self.client.get(endpoint=Endpoint.API_CORE, resource="stats/rest/en/country")
+        return self.client.json(response).get("data", [])
+
+    async def season_specific_rules_and_info(self) -> List[dict]:
+        response = await self.client.get(endpoint=Endpoint.API_CORE, resource="stats/rest/en/season")
+        return self.client.json(response).get("data", [])
+
+    async def draft_year_and_rounds(self) -> List[dict]:
+        response = await self.client.get(endpoint=Endpoint.API_CORE, resource="stats/rest/en/draft")
+        return self.client.json(response).get("data", [])
@@ -1,6 +1,6 @@
 from typing import Dict, Any
 
-from myNHLapi.nhlpy.http_client import Endpoint, HttpClient
+from myNHLapi.nhlpy.http_client import AsyncHttpClient, Endpoint, HttpClient
 
 
 class Players:
@@ -16,7 +16,7 @@ class Players:
         Returns:
            dict: Prospects data for the specified team.
         """
-        return self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"prospects/{team_abbr}").json()
+        return self.client.get_json(endpoint=Endpoint.API_WEB_V1, resource=f"prospects/{team_abbr}")
 
     def players_by_team(self, team_abbr: str, season: str) -> Dict[str, Any]:
         """Get the roster/players for the given team and season.  This is the same as teams.roster_by_team(),
@@ -32,4 +32,19 @@ class Players:
         Returns:
             Dict[str, Any]: Dictionary containing roster information for the specified team and season.
         """
-        return self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"roster/{team_abbr}/{season}").json()
+        return self.client.get_json(endpoint=Endpoint.API_WEB_V1, resource=f"roster/{team_abbr}/{season}")
+
+
+class AsyncPlayers(Players):
+    """asyncio version of ``Players``.  Every method is a coroutine with the same arguments and return value."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self.client = http_client
+
+    async def prospects_by_team(self, team_abbr: str) -> dict:
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"prospects/{team_abbr}")
+        return self.client.json(response)
+
+    async def players_by_team(self, team_abbr: str, season: str) -> Dict[str, Any]:
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"roster/{team_abbr}/{season}")
+        return self.client.json(response)
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional, List
 
-from myNHLapi.nhlpy.http_client import HttpClient, Endpoint
+from myNHLapi.nhlpy.http_client import AsyncHttpClient, HttpClient, Endpoint
 
 
 class Schedule:
@@ -17,16 +17,23 @@ class Schedule:
         Returns:
            dict: Game schedule data for the specified date.
         """
+        date = self._normalize_date(date)
+        schedule_data: dict = self.client.get_json(endpoint=Endpoint.API_WEB_V1, resource=f"schedule/{date}")
+        return self._daily_payload(schedule_data, date)
+
+    @staticmethod
+    def _normalize_date(date: Optional[str]) -> str:
         try:
             if not date:
-                date = datetime.now().strftime("%Y-%m-%d")  # Default to today's date
-            else:
-                # Parse and reformat the date to ensure YYYY-MM-DD
-                date = datetime.strptime(date, "%Y-%m-%d").strftime("%Y-%m-%d")
+                return datetime.now().strftime("%Y-%m-%d")  # Default to today's date
+            # Parse and reformat the date to ensure YYYY-MM-DD
+            return datetime.strptime(date, "%Y-%m-%d").strftime("%Y-%m-%d")
         except ValueError:
             raise ValueError("Invalid date format. Please use YYYY-MM-DD.")
 
-        schedule_data: dict = self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"schedule/{date}").json()
+    @staticmethod
+    def _daily_payload(schedule_data: dict, date: str) -> dict:
+        """Pick the requested day out of a weekly schedule response."""
         response_payload = {
             "nextStartDate": schedule_data.get("nextStartDate", None),
             "previousStartDate": schedule_data.get("previousStartDate", None),
@@ -56,7 +63,7 @@ class Schedule:
         """
         res = date if date else "now"
 
-        return self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"schedule/{res}").json()
+        return self.client.get_json(endpoint=Endpoint.API_WEB_V1, resource=f"schedule/{res}")
 
     def team_monthly_schedule(self, team_abbr: str, month: Optional[str] = None) -> List[dict]:
         """Gets monthly schedule for specified team or the given month.  If no month is supplied it will default to now.
@@ -69,7 +76,7 @@ class Schedule:
             List[dict]: List of games in the monthly schedule.
         """
         resource = f"club-schedule/{team_abbr}/month/{month if month else 'now'}"
-        response = self.client.get(endpoint=Endpoint.API_WEB_V1, resource=resource).json()
+        response = self.client.get_json(endpoint=Endpoint.API_WEB_V1, resource=resource)
         return response.get("games", [])
 
     def team_weekly_schedule(self, team_abbr: str, date: Optional[str] = None) -> List[dict]:
@@ -84,7 +91,7 @@ class Schedule:
             List[dict]: List of games in the weekly schedule.
         """
         resource = f"club-schedule/{team_abbr}/week/{date if date else 'now'}"
-        response = self.client.get(endpoint=Endpoint.API_WEB_V1, resource=resource).json()
+        response = self.client.get_json(endpoint=Endpoint.API_WEB_V1, resource=resource)
         return response.get("games", [])
 
     def team_season_schedule(self, team_abbr: str, season: str) -> dict:
@@ -99,7 +106,7 @@ class Schedule:
         """
         request = self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"club-schedule-season/{team_abbr}/{season}")
 
-        return request.json()
+        return self.client.json(request)
 
     def calendar_schedule(self, date: str) -> dict:
         """Gets schedule in calendar format for specified date. Im not really sure
@@ -114,7 +121,7 @@ class Schedule:
            Example:
                API endpoint: https://api-web.nhle.com/v1/schedule-calendar/2023-11-08
         """
-        return self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"schedule-calendar/{date}").json()
+        return self.client.get_json(endpoint=Endpoint.API_WEB_V1, resource=f"schedule-calendar/{date}")
 
     def playoff_carousel(self, season: str) -> dict:
         """Gets list of all series games up to current playoff round.
@@ -128,7 +135,7 @@ class Schedule:
         Example:
            API endpoint: https://api-web.nhle.com/v1/playoff-series/carousel/20232024/
         """
-        return self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"playoff-series/carousel/{season}").json()
+        return self.client.get_json(endpoint=Endpoint.API_WEB_V1, resource=f"playoff-series/carousel/{season}")
 
     def playoff_series_schedule(self, season: str, series: str) -> dict:
         """Returns the schedule for a specified playoff series.
@@ -144,9 +151,7 @@ class Schedule:
            API endpoint: https://api-web.nhle.com/v1/schedule/playoff-series/20232024/a/
         """
 
-        return self.client.get(
-            endpoint=Endpoint.API_WEB_V1, resource=f"schedule/playoff-series/{season}/{series}"
-        ).json()
+        return self.client.get_json(endpoint=Endpoint.API_WEB_V1, resource=f"schedule/playoff-series/{season}/{series}")
 
     def playoff_bracket(self, year: str) -> dict:
         """Returns the playoff bracket.
@@ -161,4 +166,55 @@ class Schedule:
            API endpoint: https://api-web.nhle.com/v1/playoff-bracket/2024
         """
 
-        return self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"playoff-bracket/{year}").json()
+        return self.client.get_json(endpoint=Endpoint.API_WEB_V1, resource=f"playoff-bracket/{year}")
+
+
+class AsyncSchedule(Schedule):
+    """asyncio version of ``Schedule``.  Every method is a coroutine with the same arguments and return value."""
+
+    def __init__(self, http_client: AsyncHttpClient) -> None:
+        self.client = http_client
+
+    async def daily_schedule(self, date: Optional[str] = None) -> dict:
+        date = self._normalize_date(date)
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"schedule/{date}")
+        return self._daily_payload(self.client.json(response), date)
+
+    async def weekly_schedule(self, date: Optional[str] = None) -> dict:
+        res = date if date else "now"
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"schedule/{res}")
+        return self.client.json(response)
+
+    async def team_monthly_schedule(self, team_abbr: str, month: Optional[str] = None) -> List[dict]:
+        resource = f"club-schedule/{team_abbr}/month/{month if month else 'now'}"
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource=resource)
+        return self.client.json(response).get("games", [])
+
+    async def team_weekly_schedule(self, team_abbr: str, date: Optional[str] = None) -> List[dict]:
+        resource = f"club-schedule/{team_abbr}/week/{date if date else 'now'}"
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource=resource)
+        return self.client.json(response).get("games", [])
+
+    async def team_season_schedule(self, team_abbr: str, season: str) -> dict:
+        response = await self.client.get(
+            endpoint=Endpoint.API_WEB_V1, resource=f"club-schedule-season/{team_abbr}/{season}"
+        )
+        return self.client.json(response)
+
+    async def calendar_schedule(self, date: str) -> dict:
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"schedule-calendar/{date}")
+        return self.client.json(response)
+
+    async def playoff_carousel(self, season: str) -> dict:
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"playoff-series/carousel/{season}")
+        return self.client.json(response)
+
+    async def playoff_series_schedule(self, season: str, series: str) -> dict:
+        response = await self.client.get(
+            endpoint=Endpoint.API_WEB_V1, resource=f"schedule/playoff-series/{season}/{series}"
+        )
+        return self.client.json(response)
+
+    async def playoff_bracket(self, year: str) -> dict:
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"playoff-bracket/{year}")
+        return self.client.json(response)
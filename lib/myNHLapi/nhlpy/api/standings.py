@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from myNHLapi.nhlpy.http_client import Endpoint
+from myNHLapi.nhlpy.http_client import AsyncHttpClient, Endpoint
 
 
 class Standings:
@@ -25,16 +25,18 @@ class Standings:
         # We need to look up the last date of the season and use that as the date, since it doesnt seem to take
         # season as a param.
         if season:
-            seasons = self.season_standing_manifest()
-
-            season_data = next((s for s in seasons if s.get("id") == int(season)), None)
-            if not season_data:
-                raise ValueError(f"Invalid Season Id {season}")
-            date = season_data.get("standingsEnd")
+            date = self._season_end_date(self.season_standing_manifest(), season)
 
         res = date if date else "now"
 
-        return self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"standings/{res}").json()
+        return self.client.get_json(endpoint=Endpoint.API_WEB_V1, resource=f"standings/{res}")
+
+    @staticmethod
+    def _season_end_date(seasons: List[dict], season: str) -> str:
+        season_data = next((s for s in seasons if s.get("id") == int(season)), None)
+        if not season_data:
+            raise ValueError(f"Invalid Season Id {season}")
+        return season_data.get("standingsEnd")
 
     def season_standing_manifest(self) -> List[dict]:
         """Gets metadata for all NHL seasons.
@@ -61,5 +63,25 @@ class Standings:
                "wildcardInUse": true
            }]
         """
-        response = self.client.get(endpoint=Endpoint.API_WEB_V1, resource="standings-season").json()
+        response = self.client.get_json(endpoint=Endpoint.API_WEB_V1, resource="standings-season")
         return response.get("seasons", [])
+
+
+class AsyncStandings(Standings):
+    """asyncio version of ``Standings``.  Every method is a coroutine with the same arguments and return value."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self.client = http_client
+
+    async def league_standings(self, date: Optional[str] = None, season: Optional[str] = None) -> dict:
+        if season:
+            date = self._season_end_date(await self.season_standing_manifest(), season)
+
+        res = date if date else "now"
+
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"standings/{res}")
+        return self.client.json(response)
+
+    async def season_standing_manifest(self) -> List[dict]:
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource="standings-season")
+        return self.client.json(response).get("seasons", [])
@@ -1,10 +1,15 @@
+import asyncio
 import json
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Dict, Iterator, List
 
 from myNHLapi.nhlpy.api.query.builder import QueryContext
 from myNHLapi.nhlpy.api.query.filters import _goalie_stats_sorts
 from myNHLapi.nhlpy.api.query.sorting.sorting_options import SortingOptions
-from myNHLapi.nhlpy.http_client import HttpClient, Endpoint
+from myNHLapi.nhlpy.http_client import AsyncHttpClient, HttpClient, Endpoint
+
+# bulk reports page through every skater, so they need a total order that stays stable between pages
+_BULK_SORT = [{"property": "playerId", "direction": "ASC"}, {"property": "seasonId", "direction": "ASC"}]
 
 
 class Stats:
@@ -38,18 +43,226 @@ class Stats:
                         end_season=end,
                         fact_cayenne_exp=f"playerId={player_id}"
                     )
+        return self._join_summary_realtime(skater_sum, skater_rt)
+
+    def bulk_player_stats(
+        self, start: str, end: str, fact_cayenne_exp: str = "gamesPlayed>=1", page_size: int = 100
+    ) -> Dict[str, List[dict]]:
+        """Fetches the joined summary/realtime season rows of every skater in a season range.
+
+        League-wide version of ``get_player_stats``: each report is walked in pages of ``page_size`` instead of
+        being queried once per player, so the whole league costs a few requests per report.
+
+        Args:
+            start (str): Beginning of season range in YYYYYYYY format (e.g., "20222023").
+            end (str): End of season range in YYYYYYYY format.
+            fact_cayenne_exp (str, optional): Filter applied to both reports. Defaults to 'gamesPlayed>=1'.
+            page_size (int, optional): Rows requested per page. Defaults to 100.
+
+        Returns:
+            Dict[str, List[dict]]: Player ID (as a string) to that player's season rows, each shaped like
+            the rows ``get_player_stats`` returns.
+
+        Example:
+            stats = client.stats.bulk_player_stats(start="20222023", end="20242025")
+            stats["8478402"]
+        """
+        skater_sum = self._bulk_skater_report("summary", start, end, fact_cayenne_exp, page_size)
+        skater_rt = self._bulk_skater_report("realtime", start, end, fact_cayenne_exp, page_size)
+        return self._group_by_player(self._join_summary_realtime(skater_sum, skater_rt))
+
+    def _bulk_skater_report(self, report: str, start, end, fact_cayenne_exp, page_size) -> List[dict]:
+        q_params = self._skater_params(start, end, None, 2, False, _BULK_SORT, 0, page_size, fact_cayenne_exp, None)
+        return list(self._paginate(f"en/skater/{report}", q_params, page_size))
+
+    def _paginate(self, resource: str, q_params: dict, page_size: int, prefetch: bool = False) -> Iterator[dict]:
+        """Yield the rows of a /stats/rest report page by page until ``total`` is reached.
+
+        With ``prefetch`` the next page is requested on a background thread while the caller consumes this one.
+        """
+        q_params = self._total_order(q_params)
+
+        def fetch(offset):
+            return self.client.get_json(
+                endpoint=Endpoint.API_STATS, resource=resource, query_params={**q_params, "start": offset}
+            )
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            offset = q_params["start"]
+            page = fetch(offset)
+            while True:
+                offset += page_size
+                more = bool(page["data"]) and offset < page.get("total", 0)
+                upcoming = executor.submit(fetch, offset) if more and executor else None
+                yield from page["data"]
+                if not more:
+                    return
+                page = upcoming.result() if upcoming else fetch(offset)
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
+
+    @staticmethod
+    def _total_order(q_params: dict) -> dict:
+        """Append the _BULK_SORT tie-breakers missing from the sort, so rows are not skipped or repeated across pages.
+
+        Aggregated rows span seasons and have no seasonId, so only playerId is added for them.
+        """
+        sort = json.loads(q_params.get("sort") or "[]")
+        present = {order["property"] for order in sort}
+        for order in _BULK_SORT:
+            if order["property"] not in present and not (order["property"] == "seasonId" and q_params["isAggregate"]):
+                sort.append(order)
+        return {**q_params, "sort": json.dumps(sort)}
+
+    @staticmethod
+    def _join_summary_realtime(skater_sum: List[dict], skater_rt: List[dict]) -> List[dict]:
+        """Copy hits and blocked shots from the realtime report onto the matching summary season rows."""
+        realtime = {(y.get("playerId"), y["seasonId"]): y for y in skater_rt}
         output = []
         for x in skater_sum:
-            for y in skater_rt:
-                if x['seasonId'] == y['seasonId']:
-                    x['hits'] = y['hits']
-                    x['blockedShots'] = y['blockedShots']
-                    output.append(x)
-                    continue
+            y = realtime.get((x.get("playerId"), x["seasonId"]))
+            if y is not None:
+                x["hits"] = y["hits"]
+                x["blockedShots"] = y["blockedShots"]
+                output.append(x)
 
+        return output
 
+    @staticmethod
+    def _group_by_player(rows: List[dict]) -> Dict[str, List[dict]]:
+        output = {}
+        for row in rows:
+            output.setdefault(str(row["playerId"]), []).append(row)
         return output
 
+    @staticmethod
+    def _team_summary_params(
+        start_season,
+        end_season,
+        game_type_id,
+        is_game,
+        is_aggregate,
+        sort_expr,
+        start,
+        limit,
+        fact_cayenne_exp,
+        default_cayenne_exp,
+    ) -> dict:
+        q_params = {
+            "isAggregate": is_aggregate,
+            "isGame": is_game,
+            "start": start,
+            "limit": limit,
+            "factCayenneExp": fact_cayenne_exp,
+        }
+
+        if not sort_expr:
+            sort_expr = [
+                {"property": "points", "direction": "DESC"},
+                {"property": "wins", "direction": "DESC"},
+                {"property": "teamId", "direction": "ASC"},
+            ]
+        q_params["sort"] = json.dumps(sort_expr)
+
+        if not default_cayenne_exp:
+            default_cayenne_exp = f"gameTypeId={game_type_id} and seasonId<={end_season} and seasonId>={start_season}"
+        q_params["cayenneExp"] = default_cayenne_exp
+        return q_params
+
+    @staticmethod
+    def _skater_params(
+        start_season,
+        end_season,
+        franchise_id,
+        game_type_id,
+        aggregate,
+        sort_expr,
+        start,
+        limit,
+        fact_cayenne_exp,
+        default_cayenne_exp,
+    ) -> dict:
+        q_params = {
+            "isAggregate": aggregate,
+            "isGame": False,
+            "start": start,
+            "limit": limit,
+            "factCayenneExp": fact_cayenne_exp,
+        }
+
+        if not sort_expr:
+            sort_expr = [
+                # {"property": "points", "direction": "DESC"},
+                # {"property": "gamesPlayed", "direction": "ASC"},
+                # {"property": "playerId", "direction": "ASC"},
+            ]
+        q_params["sort"] = json.dumps(sort_expr)
+
+        if not default_cayenne_exp:
+            default_cayenne_exp = f"gameTypeId={game_type_id} and seasonId<={end_season} and seasonId>={start_season}"
+            if franchise_id:
+                default_cayenne_exp = f"franchiseId={franchise_id} and {default_cayenne_exp}"
+        q_params["cayenneExp"] = default_cayenne_exp
+        return q_params
+
+    @staticmethod
+    def _query_context_params(query_context, report_type, sort_expr, aggregate, start, limit) -> dict:
+        q_params = {
+            "isAggregate": aggregate,
+            "isGame": False,
+            "start": start,
+            "limit": limit,
+            "factCayenneExp": query_context.fact_query,
+        }
+
+        if not sort_expr:
+            sort_expr = SortingOptions.get_default_sorting_for_report(report_type)
+
+        q_params["sort"] = json.dumps(sort_expr)
+        q_params["cayenneExp"] = query_context.query_str
+        return q_params
+
+    @staticmethod
+    def _goalie_params(
+        start_season,
+        end_season,
+        stats_type,
+        game_type_id,
+        franchise_id,
+        aggregate,
+        sort_expr,
+        start,
+        limit,
+        fact_cayenne_exp,
+        default_cayenne_exp,
+    ) -> dict:
+        q_params = {
+            "isAggregate": aggregate,
+            "isGame": False,
+            "start": start,
+            "limit": limit,
+            "factCayenneExp": fact_cayenne_exp,
+        }
+
+        if end_season is None:
+            end_season = start_season
+
+        if not sort_expr:
+            sort_expr = _goalie_stats_sorts(report=stats_type)
+
+        q_params["sort"] = json.dumps(sort_expr)
+
+        if not default_cayenne_exp:
+            default_cayenne_exp = f"gameTypeId={game_type_id} and seasonId<={end_season} and seasonId>={start_season}"
+
+        if franchise_id:
+            default_cayenne_exp = f"franchiseId={franchise_id} and {default_cayenne_exp}"
+
+        q_params["cayenneExp"] = default_cayenne_exp
+        return q_params
+
     def gametypes_per_season_directory_by_team(self, team_abbr: str) -> dict:
         """Gets all game types played by a team throughout their history.
 
@@ -73,7 +286,7 @@ class Stats:
              ]
 
         """
-        return self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"club-stats-season/{team_abbr}").json()
+        return self.client.get_json(endpoint=Endpoint.API_WEB_V1, resource=f"club-stats-season/{team_abbr}")
 
     def player_career_stats(self, player_id: str) -> dict:
         """Gets a player's career statistics and biographical information.
@@ -107,7 +320,7 @@ class Stats:
              'sweaterNumber': 97,
              'position': 'C',
         """
-        return self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"player/{player_id}/landing").json()
+        return self.client.get_json(endpoint=Endpoint.API_WEB_V1, resource=f"player/{player_id}/landing")
 
     def player_game_log(self, player_id: str, season_id: str, game_type: int) -> List[dict]:
         """Gets a player's game log for a specific season and game type.
@@ -152,9 +365,9 @@ class Stats:
               ...
               ]
         """
-        data = self.client.get(
+        data = self.client.get_json(
             endpoint=Endpoint.API_WEB_V1, resource=f"player/{player_id}/game-log/{season_id}/{game_type}"
-        ).json()
+        )
         return data.get("gameLog", [])
     
 
@@ -170,9 +383,9 @@ class Stats:
                 3: Playoffs
                 1: Preseason"""
         
-        data = self.client.get(
+        data = self.client.get_json(
             endpoint=Endpoint.API_WEB_V1, resource=f"club-stats/{team}/{season}/{game_type}"
-        ).json()
+        )
 
         return data
 
@@ -251,27 +464,19 @@ class Stats:
               'winsInShootout': 3},
               ... ]
         """
-        q_params = {
-            "isAggregate": is_aggregate,
-            "isGame": is_game,
-            "start": start,
-            "limit": limit,
-            "factCayenneExp": fact_cayenne_exp,
-        }
-
-        if not sort_expr:
-            sort_expr = [
-                {"property": "points", "direction": "DESC"},
-                {"property": "wins", "direction": "DESC"},
-                {"property": "teamId", "direction": "ASC"},
-            ]
-        q_params["sort"] = json.dumps(sort_expr)
-
-        if not default_cayenne_exp:
-            default_cayenne_exp = f"gameTypeId={game_type_id} and seasonId<={end_season} and seasonId>={start_season}"
-        q_params["cayenneExp"] = default_cayenne_exp
-
-        return self.client.get(endpoint=Endpoint.API_STATS, resource="en/team/summary", query_params=q_params).json()[
+        q_params = self._team_summary_params(
+            start_season,
+            end_season,
+            game_type_id,
+            is_game,
+            is_aggregate,
+            sort_expr,
+            start,
+            limit,
+            fact_cayenne_exp,
+            default_cayenne_exp,
+        )
+        return self.client.get_json(endpoint=Endpoint.API_STATS, resource="en/team/summary", query_params=q_params)[
             "data"
         ]
 
@@ -352,29 +557,19 @@ class Stats:
               'timeOnIcePerGame': 1207.1341},
               ... ]
         """
-        q_params = {
-            "isAggregate": aggregate,
-            "isGame": False,
-            "start": start,
-            "limit": limit,
-            "factCayenneExp": fact_cayenne_exp,
-        }
-
-        if not sort_expr:
-            sort_expr = [
-                # {"property": "points", "direction": "DESC"},
-                # {"property": "gamesPlayed", "direction": "ASC"},
-                # {"property": "playerId", "direction": "ASC"},
-            ]
-        q_params["sort"] = json.dumps(sort_expr)
-
-        if not default_cayenne_exp:
-            default_cayenne_exp = f"gameTypeId={game_type_id} and seasonId<={end_season} and seasonId>={start_season}"
-            if franchise_id:
-                default_cayenne_exp = f"franchiseId={franchise_id} and {default_cayenne_exp}"
-        q_params["cayenneExp"] = default_cayenne_exp
-
-        return self.client.get(endpoint=Endpoint.API_STATS, resource="en/skater/summary", query_params=q_params).json()[
+        q_params = self._skater_params(
+            start_season,
+            end_season,
+            franchise_id,
+            game_type_id,
+            aggregate,
+            sort_expr,
+            start,
+            limit,
+            fact_cayenne_exp,
+            default_cayenne_exp,
+        )
+        return self.client.get_json(endpoint=Endpoint.API_STATS, resource="en/skater/summary", query_params=q_params)[
             "data"
         ]
     
@@ -456,29 +651,19 @@ class Stats:
               'timeOnIcePerGame': 1207.1341},
               ... ]
         """
-        q_params = {
-            "isAggregate": aggregate,
-            "isGame": False,
-            "start": start,
-            "limit": limit,
-            "factCayenneExp": fact_cayenne_exp,
-        }
-
-        if not sort_expr:
-            sort_expr = [
-                # {"property": "points", "direction": "DESC"},
-                # {"property": "gamesPlayed", "direction": "ASC"},
-                # {"property": "playerId", "direction": "ASC"},
-            ]
-        q_params["sort"] = json.dumps(sort_expr)
-
-        if not default_cayenne_exp:
-            default_cayenne_exp = f"gameTypeId={game_type_id} and seasonId<={end_season} and seasonId>={start_season}"
-            if franchise_id:
-                default_cayenne_exp = f"franchiseId={franchise_id} and {default_cayenne_exp}"
-        q_params["cayenneExp"] = default_cayenne_exp
-
-        return self.client.get(endpoint=Endpoint.API_STATS, resource="en/skater/realtime", query_params=q_params).json()[
+        q_params = self._skater_params(
+            start_season,
+            end_season,
+            franchise_id,
+            game_type_id,
+            aggregate,
+            sort_expr,
+            start,
+            limit,
+            fact_cayenne_exp,
+            default_cayenne_exp,
+        )
+        return self.client.get_json(endpoint=Endpoint.API_STATS, resource="en/skater/realtime", query_params=q_params)[
             "data"
         ]
 
@@ -564,22 +749,10 @@ class Stats:
            'timeOnIcePerGame': 904.5714},
            ...]
         """
-        q_params = {
-            "isAggregate": aggregate,
-            "isGame": False,
-            "start": start,
-            "limit": limit,
-            "factCayenneExp": query_context.fact_query,
-        }
-
-        if not sort_expr:
-            sort_expr = SortingOptions.get_default_sorting_for_report(report_type)
-
-        q_params["sort"] = json.dumps(sort_expr)
-        q_params["cayenneExp"] = query_context.query_str
-        return self.client.get(
+        q_params = self._query_context_params(query_context, report_type, sort_expr, aggregate, start, limit)
+        return self.client.get_json(
             endpoint=Endpoint.API_STATS, resource=f"en/skater/{report_type}", query_params=q_params
-        ).json()
+        )
 
     def goalie_stats_summary(
         self,
@@ -650,31 +823,448 @@ class Stats:
               'timeOnIce': 119145,
               'wins': 25},
         """
-        q_params = {
-            "isAggregate": aggregate,
-            "isGame": False,
-            "start": start,
-            "limit": limit,
-            "factCayenneExp": fact_cayenne_exp,
-        }
+        q_params = self._goalie_params(
+            start_season,
+            end_season,
+            stats_type,
+            game_type_id,
+            franchise_id,
+            aggregate,
+            sort_expr,
+            start,
+            limit,
+            fact_cayenne_exp,
+            default_cayenne_exp,
+        )
+        response = self.client.get_json(
+            endpoint=Endpoint.API_STATS, resource=f"en/goalie/{stats_type}", query_params=q_params
+        )
+        return response.get("data", [])
 
-        if end_season is None:
-            end_season = start_season
+    def iter_skater_stats_summary(
+        self,
+        start_season: str,
+        end_season: str,
+        franchise_id: str = None,
+        game_type_id: int = 2,
+        aggregate: bool = False,
+        sort_expr: List[dict] = None,
+        page_size: int = 100,
+        fact_cayenne_exp: str = "gamesPlayed>=1",
+        default_cayenne_exp: str = None,
+        prefetch: bool = False,
+    ) -> Iterator[dict]:
+        """Streams every row of ``skater_stats_summary``, requesting ``page_size`` rows at a time.
 
-        if not sort_expr:
-            sort_expr = _goalie_stats_sorts(report=stats_type)
+        Takes the same filters as ``skater_stats_summary``.  Pages are fetched lazily as the iterator is consumed
+        and the walk stops at the report's ``total``.  With ``prefetch=True`` the next page is fetched in the
+        background while the current one is being consumed.
 
-        q_params["sort"] = json.dumps(sort_expr)
+        Example:
+            for player in client.stats.iter_skater_stats_summary(start_season="20242025", end_season="20242025"):
+                print(player["skaterFullName"])
+        """
+        q_params = self._skater_params(
+            start_season,
+            end_season,
+            franchise_id,
+            game_type_id,
+            aggregate,
+            sort_expr,
+            0,
+            page_size,
+            fact_cayenne_exp,
+            default_cayenne_exp,
+        )
+        return self._paginate("en/skater/summary", q_params, page_size, prefetch)
+
+    def iter_skater_stats_realtime(
+        self,
+        start_season: str,
+        end_season: str,
+        franchise_id: str = None,
+        game_type_id: int = 2,
+        aggregate: bool = False,
+        sort_expr: List[dict] = None,
+        page_size: int = 100,
+        fact_cayenne_exp: str = "gamesPlayed>=1",
+        default_cayenne_exp: str = None,
+        prefetch: bool = False,
+    ) -> Iterator[dict]:
+        """Streams every row of ``skater_stats_realtime``.  See ``iter_skater_stats_summary``."""
+        q_params = self._skater_params(
+            start_season,
+            end_season,
+            franchise_id,
+            game_type_id,
+            aggregate,
+            sort_expr,
+            0,
+            page_size,
+            fact_cayenne_exp,
+            default_cayenne_exp,
+        )
+        return self._paginate("en/skater/realtime", q_params, page_size, prefetch)
+
+    def iter_skater_stats_with_query_context(
+        self,
+        query_context: QueryContext,
+        report_type: str,
+        sort_expr: List[dict] = None,
+        aggregate: bool = False,
+        page_size: int = 100,
+        prefetch: bool = False,
+    ) -> Iterator[dict]:
+        """Streams the ``data`` rows of ``skater_stats_with_query_context``.  See ``iter_skater_stats_summary``."""
+        q_params = self._query_context_params(query_context, report_type, sort_expr, aggregate, 0, page_size)
+        return self._paginate(f"en/skater/{report_type}", q_params, page_size, prefetch)
+
+    def iter_goalie_stats_summary(
+        self,
+        start_season: str,
+        end_season: str = None,
+        stats_type: str = "summary",
+        game_type_id: int = 2,
+        franchise_id: str = None,
+        aggregate: bool = False,
+        sort_expr: List[dict] = None,
+        page_size: int = 100,
+        fact_cayenne_exp: str = None,
+        default_cayenne_exp: str = None,
+        prefetch: bool = False,
+    ) -> Iterator[dict]:
+        """Streams every row of ``goalie_stats_summary``.  See ``iter_skater_stats_summary``."""
+        q_params = self._goalie_params(
+            start_season,
+            end_season,
+            stats_type,
+            game_type_id,
+            franchise_id,
+            aggregate,
+            sort_expr,
+            0,
+            page_size,
+            fact_cayenne_exp,
+            default_cayenne_exp,
+        )
+        return self._paginate(f"en/goalie/{stats_type}", q_params, page_size, prefetch)
+
+
+class AsyncStats(Stats):
+    """asyncio version of ``Stats``.  Every public method is a coroutine with the same arguments and return value."""
+
+    def __init__(self, http_client: AsyncHttpClient):
+        self.client = http_client
 
-        if not default_cayenne_exp:
-            default_cayenne_exp = f"gameTypeId={game_type_id} and seasonId<={end_season} and seasonId>={start_season}"
+    async def get_player_stats(self, player_id: str, start, end) -> dict:
+        # the two reports are independent, so fetch them concurrently
+        skater_sum, skater_rt = await asyncio.gather(
+            self.skater_stats_summary(start_season=start, end_season=end, fact_cayenne_exp=f"playerId={player_id}"),
+            self.skater_stats_realtime(start_season=start, end_season=end, fact_cayenne_exp=f"playerId={player_id}"),
+        )
+        return self._join_summary_realtime(skater_sum, skater_rt)
+
+    async def bulk_player_stats(
+        self, start: str, end: str, fact_cayenne_exp: str = "gamesPlayed>=1", page_size: int = 100
+    ) -> Dict[str, List[dict]]:
+        skater_sum, skater_rt = await asyncio.gather(
+            self._bulk_skater_report("summary", start, end, fact_cayenne_exp, page_size),
+            self._bulk_skater_report("realtime", start, end, fact_cayenne_exp, page_size),
+        )
+        return self._group_by_player(self._join_summary_realtime(skater_sum, skater_rt))
+
+    async def _bulk_skater_report(self, report: str, start, end, fact_cayenne_exp, page_size) -> List[dict]:
+        q_params = self._skater_params(start, end, None, 2, False, _BULK_SORT, 0, page_size, fact_cayenne_exp, None)
+        resource = f"en/skater/{report}"
+
+        # the first page tells us the total, the rest can then be fetched concurrently
+        first = await self._fetch_page(resource, q_params, 0)
+        offsets = range(page_size, first.get("total", 0), page_size)
+        rest = await asyncio.gather(*(self._fetch_page(resource, q_params, offset) for offset in offsets))
+        rows = list(first["data"])
+        for page in rest:
+            rows.extend(page["data"])
+        return rows
+
+    async def _fetch_page(self, resource: str, q_params: dict, offset: int) -> dict:
+        response = await self.client.get(
+            endpoint=Endpoint.API_STATS, resource=resource, query_params={**q_params, "start": offset}
+        )
+        return self.client.json(response)
+
+    async def _paginate(
+        self, resource: str, q_params: dict, page_size: int, prefetch: bool = False
+    ) -> AsyncIterator[dict]:
+        q_params = self._total_order(q_params)
+        upcoming = None
+        try:
+            offset = q_params["start"]
+            page = await self._fetch_page(resource, q_params, offset)
+            while True:
+                offset += page_size
+                more = bool(page["data"]) and offset < page.get("total", 0)
+                if more and prefetch:
+                    upcoming = asyncio.ensure_future(self._fetch_page(resource, q_params, offset))
+                for row in page["data"]:
+                    yield row
+                if not more:
+                    return
+                page = await upcoming if upcoming else await self._fetch_page(resource, q_params, offset)
+                upcoming = None
+        finally:
+            if upcoming:
+                upcoming.cancel()
+
+    async def gametypes_per_season_directory_by_team(self, team_abbr: str) -> dict:
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"club-stats-season/{team_abbr}")
+        return self.client.json(response)
+
+    async def player_career_stats(self, player_id: str) -> dict:
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"player/{player_id}/landing")
+        return self.client.json(response)
+
+    async def player_game_log(self, player_id: str, season_id: str, game_type: int) -> List[dict]:
+        response = await self.client.get(
+            endpoint=Endpoint.API_WEB_V1, resource=f"player/{player_id}/game-log/{season_id}/{game_type}"
+        )
+        return self.client.json(response).get("gameLog", [])
 
-        if franchise_id:
-            default_cayenne_exp = f"franchiseId={franchise_id} and {default_cayenne_exp}"
+    async def full_team_data(self, season: str, team: str, game_type: int = 2) -> List[dict]:
+        response = await self.client.get(
+            endpoint=Endpoint.API_WEB_V1, resource=f"club-stats/{team}/{season}/{game_type}"
+        )
+        return self.client.json(response)
 
-        q_params["cayenneExp"] = default_cayenne_exp
+    async def team_summary(
+        self,
+        start_season: str,
+        end_season: str,
+        game_type_id: int = 2,
+        is_game: bool = False,
+        is_aggregate: bool = False,
+        sort_expr: List[dict] = None,
+        start: int = 0,
+        limit: int = 50,
+        fact_cayenne_exp: str = "gamesPlayed>1",
+        default_cayenne_exp: str = None,
+    ) -> List[dict]:
+        q_params = self._team_summary_params(
+            start_season,
+            end_season,
+            game_type_id,
+            is_game,
+            is_aggregate,
+            sort_expr,
+            start,
+            limit,
+            fact_cayenne_exp,
+            default_cayenne_exp,
+        )
+        response = await self.client.get(endpoint=Endpoint.API_STATS, resource="en/team/summary", query_params=q_params)
+        return self.client.json(response)["data"]
+
+    async def skater_stats_summary(
+        self,
+        start_season: str,
+        end_season: str,
+        franchise_id: str = None,
+        game_type_id: int = 2,
+        aggregate: bool = False,
+        sort_expr: List[dict] = None,
+        start: int = 0,
+        limit: int = 25,
+        fact_cayenne_exp: str = "gamesPlayed>=1",
+        default_cayenne_exp: str = None,
+    ) -> List[dict]:
+        q_params = self._skater_params(
+            start_season,
+            end_season,
+            franchise_id,
+            game_type_id,
+            aggregate,
+            sort_expr,
+            start,
+            limit,
+            fact_cayenne_exp,
+            default_cayenne_exp,
+        )
+        response = await self.client.get(
+            endpoint=Endpoint.API_STATS, resource="en/skater/summary", query_params=q_params
+        )
+        return self.client.json(response)["data"]
+
+    async def skater_stats_realtime(
+        self,
+        start_season: str,
+        end_season: str,
+        franchise_id: str = None,
+        game_type_id: int = 2,
+        aggregate: bool = False,
+        sort_expr: List[dict] = None,
+        start: int = 0,
+        limit: int = 25,
+        fact_cayenne_exp: str = "gamesPlayed>=1",
+        default_cayenne_exp: str = None,
+    ) -> List[dict]:
+        q_params = self._skater_params(
+            start_season,
+            end_season,
+            franchise_id,
+            game_type_id,
+            aggregate,
+            sort_expr,
+            start,
+            limit,
+            fact_cayenne_exp,
+            default_cayenne_exp,
+        )
+        response = await self.client.get(
+            endpoint=Endpoint.API_STATS, resource="en/skater/realtime", query_params=q_params
+        )
+        return self.client.json(response)["data"]
+
+    async def skater_stats_with_query_context(
+        self,
+        query_context: QueryContext,
+        report_type: str,
+        sort_expr: List[dict] = None,
+        aggregate: bool = False,
+        start: int = 0,
+        limit: int = 25,
+    ) -> dict:
+        q_params = self._query_context_params(query_context, report_type, sort_expr, aggregate, start, limit)
+        response = await self.client.get(
+            endpoint=Endpoint.API_STATS, resource=f"en/skater/{report_type}", query_params=q_params
+        )
+        return self.client.json(response)
 
-        response = self.client.get(
+    async def goalie_stats_summary(
+        self,
+        start_season: str,
+        end_season: str = None,
+        stats_type: str = "summary",
+        game_type_id: int = 2,
+        franchise_id: str = None,
+        aggregate: bool = False,
+        sort_expr: List[dict] = None,
+        start: int = 0,
+        limit: int = 25,
+        fact_cayenne_exp: str = None,
+        default_cayenne_exp: str = None,
+    ) -> List[dict]:
+        q_params = self._goalie_params(
+            start_season,
+            end_season,
+            stats_type,
+            game_type_id,
+            franchise_id,
+            aggregate,
+            sort_expr,
+            start,
+            limit,
+            fact_cayenne_exp,
+            default_cayenne_exp,
+        )
+        response = await self.client.get(
             endpoint=Endpoint.API_STATS, resource=f"en/goalie/{stats_type}", query_params=q_params
-        ).json()
-        return response.get("data", [])
+        )
+        return self.client.json(response).get("data", [])
+
+    async def iter_skater_stats_summary(
+        self,
+        start_season: str,
+        end_season: str,
+        franchise_id: str = None,
+        game_type_id: int = 2,
+        aggregate: bool = False,
+        sort_expr: List[dict] = None,
+        page_size: int = 100,
+        fact_cayenne_exp: str = "gamesPlayed>=1",
+        default_cayenne_exp: str = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[dict]:
+        q_params = self._skater_params(
+            start_season,
+            end_season,
+            franchise_id,
+            game_type_id,
+            aggregate,
+            sort_expr,
+            0,
+            page_size,
+            fact_cayenne_exp,
+            default_cayenne_exp,
+        )
+        async for row in self._paginate("en/skater/summary", q_params, page_size, prefetch):
+            yield row
+
+    async def iter_skater_stats_realtime(
+        self,
+        start_season: str,
+        end_season: str,
+        franchise_id: str = None,
+        game_type_id: int = 2,
+        aggregate: bool = False,
+        sort_expr: List[dict] = None,
+        page_size: int = 100,
+        fact_cayenne_exp: str = "gamesPlayed>=1",
+        default_cayenne_exp: str = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[dict]:
+        q_params = self._skater_params(
+            start_season,
+            end_season,
+            franchise_id,
+            game_type_id,
+            aggregate,
+            sort_expr,
+            0,
+            page_size,
+            fact_cayenne_exp,
+            default_cayenne_exp,
+        )
+        async for row in self._paginate("en/skater/realtime", q_params, page_size, prefetch):
+            yield row
+
+    async def iter_skater_stats_with_query_context(
+        self,
+        query_context: QueryContext,
+        report_type: str,
+        sort_expr: List[dict] = None,
+        aggregate: bool = False,
+        page_size: int = 100,
+        prefetch: bool = False,
+    ) -> AsyncIterator[dict]:
+        q_params = self._query_context_params(query_context, report_type, sort_expr, aggregate, 0, page_size)
+        async for row in self._paginate(f"en/skater/{report_type}", q_params, page_size, prefetch):
+            yield row
+
+    async def iter_goalie_stats_summary(
+        self,
+        start_season: str,
+        end_season: str = None,
+        stats_type: str = "summary",
+        game_type_id: int = 2,
+        franchise_id: str = None,
+        aggregate: bool = False,
+        sort_expr: List[dict] = None,
+        page_size: int = 100,
+        fact_cayenne_exp: str = None,
+        default_cayenne_exp: str = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[dict]:
+        q_params = self._goalie_params(
+            start_season,
+            end_season,
+            stats_type,
+            game_type_id,
+            franchise_id,
+            aggregate,
+            sort_expr,
+            0,
+            page_size,
+            fact_cayenne_exp,
+            default_cayenne_exp,
+        )
+        async for row in self._paginate(f"en/goalie/{stats_type}", q_params, page_size, prefetch):
+            yield row
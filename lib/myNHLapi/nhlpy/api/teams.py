@@ -1,5 +1,5 @@
 from typing import List, Dict, Optional, Any
-from myNHLapi.nhlpy.http_client import Endpoint, HttpClient
+from myNHLapi.nhlpy.http_client import AsyncHttpClient, Endpoint, HttpClient
 
 
 # @dataclass
@@ -29,7 +29,7 @@ class Teams:
 
     def _fetch_standings_data(self, date: str) -> List[Dict[str, Any]]:
         """Fetch standings data from NHL API."""
-        response = self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"standings/{date}").json()
+        response = self.client.get_json(endpoint=Endpoint.API_WEB_V1, resource=f"standings/{date}")
         return response.get("standings", [])
 
     def _parse_teams_from_standings(self, standings_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -59,7 +59,10 @@ class Teams:
 
     def _enrich_teams_with_franchise_ids(self, teams: List[Dict[str, Any]]) -> None:
         """Add franchise IDs to teams using franchise data."""
-        franchises = self.franchises()
+        self._apply_franchise_ids(teams, self.franchises())
+
+    def _apply_franchise_ids(self, teams: List[Dict[str, Any]], franchises: List[Dict[str, Any]]) -> None:
+        """Join franchise IDs onto teams by name."""
         franchise_lookup = self._create_franchise_lookup(franchises)
 
         for team in teams:
@@ -134,7 +137,7 @@ class Teams:
         Returns:
             Dictionary containing roster information for the specified team and season.
         """
-        return self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"roster/{team_abbr}/{season}").json()
+        return self.client.get_json(endpoint=Endpoint.API_WEB_V1, resource=f"roster/{team_abbr}/{season}")
 
     def franchises(self) -> List[Dict[str, Any]]:
         """Get a list of all past and current NHL franchises.
@@ -143,5 +146,27 @@ class Teams:
             List of all NHL franchises, including historical/defunct teams.
         """
         # franchise_url = f"{self.NHL_STATS_API_BASE}/en/franchise"
-        response = self.client.get(endpoint=Endpoint.API_STATS, resource="en/franchise").json()
+        response = self.client.get_json(endpoint=Endpoint.API_STATS, resource="en/franchise")
         return response.get("data", [])
+
+
+class AsyncTeams(Teams):
+    """asyncio version of ``Teams``.  Every public method is a coroutine with the same arguments and return value."""
+
+    def __init__(self, http_client: AsyncHttpClient) -> None:
+        self.client = http_client
+        self.api_ver = "/stats/rest/"
+
+    async def teams(self, date: str = "now") -> List[Dict[str, Any]]:
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"standings/{date}")
+        teams = self._parse_teams_from_standings(self.client.json(response).get("standings", []))
+        self._apply_franchise_ids(teams, await self.franchises())
+        return teams
+
+    async def team_roster(self, team_abbr: str, season: str) -> Dict[str, Any]:
+        response = await self.client.get(endpoint=Endpoint.API_WEB_V1, resource=f"roster/{team_abbr}/{season}")
+        return self.client.json(response)
+
+    async def franchises(self) -> List[Dict[str, Any]]:
+        response = await self.client.get(endpoint=Endpoint.API_STATS, resource="en/franchise")
+        return self.client.json(response).get("data", [])
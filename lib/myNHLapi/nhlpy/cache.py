@@ -0,0 +1,168 @@
+import hashlib
+from abc import ABC, abstractmethod
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Callable, List, Optional, Tuple, Union
+
+import httpx
+
+from myNHLapi.nhlpy.http_client import Endpoint
+
+# A TTL is a number of seconds, PERMANENT (never expires) or a callable that decides from the response body.
+PERMANENT = None
+TTL = Union[None, float, Callable[[bytes], Optional[float]]]
+
+FINAL_GAME_STATES = ("OFF", "FINAL")
+
+
+def game_ttl(body: bytes) -> Optional[float]:
+    """Completed games never change, so keep them forever.  Live or future games are only cached briefly."""
+    try:
+        state = json.loads(body).get("gameState")
+    except (ValueError, AttributeError):
+        return 3600
+    if state in FINAL_GAME_STATES:
+        return PERMANENT
+    if state is None:
+        return 3600
+    return 30
+
+
+# First matching rule wins, anything unmatched uses ResponseCache.default_ttl.
+DEFAULT_TTL_RULES: List[Tuple[str, TTL]] = [
+    (r"(^|/)now(/|$)", 60),
+    (r"^(standings|score)/", 300),
+    (r"^(gamecenter/\d+/|wsc/game-story/\d+)", game_ttl),
+    (r"^en/shiftcharts", 3600),
+]
+
+
+class ResponseCache(ABC):
+    """Cache of successful GET responses, keyed on endpoint, resource and query params.
+
+    Bodies are zlib compressed.  This class holds the keying, TTL policy and hit/miss counters, subclasses only
+    provide ``_read``, ``_write`` and ``clear`` for their storage.  Pass an instance to ``NHLClient(cache=...)``.
+    """
+
+    def __init__(self, ttl_rules: List[Tuple[str, TTL]] = None, default_ttl: TTL = 3600, compress_level: int = 6):
+        """
+        :param ttl_rules: list of (regex, ttl) matched against the resource.  Defaults to DEFAULT_TTL_RULES.
+        :param default_ttl: ttl for resources no rule matches.  Defaults to 1 hour.
+        :param compress_level: zlib compression level, 1-9.
+        """
+        rules = DEFAULT_TTL_RULES if ttl_rules is None else ttl_rules
+        self._ttl_rules = [(re.compile(pattern), ttl) for pattern, ttl in rules]
+        self._default_ttl = default_ttl
+        self._compress_level = compress_level
+        self._counter_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(endpoint: Endpoint, resource: str, query_params: dict = None) -> str:
+        raw = json.dumps([endpoint.value, resource, sorted((query_params or {}).items())], default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def ttl_for(self, resource: str, body: bytes) -> Optional[float]:
+        ttl = self._default_ttl
+        for pattern, rule_ttl in self._ttl_rules:
+            if pattern.search(resource):
+                ttl = rule_ttl
+                break
+        return ttl(body) if callable(ttl) else ttl
+
+    def get(self, endpoint: Endpoint, resource: str, query_params: dict = None) -> Optional[httpx.Response]:
+        """Return the cached response, or None on a miss or an expired entry."""
+        entry = self._read(self.key(endpoint, resource, query_params))
+        if entry is not None:
+            content_type, body, expires = entry
+            if expires is None or expires > time.time():
+                self._count(hit=True)
+                return httpx.Response(
+                    200,
+                    content=zlib.decompress(body),
+                    headers={"content-type": content_type, "x-nhlpy-cache": "hit"},
+                    request=httpx.Request("GET", f"{endpoint.value}{resource}", params=query_params),
+                )
+        self._count(hit=False)
+        return None
+
+    def set(self, endpoint: Endpoint, resource: str, query_params: dict, response: httpx.Response) -> None:
+        body = response.content
+        ttl = self.ttl_for(resource, body)
+        if ttl is not None and ttl <= 0:
+            return
+        expires = None if ttl is None else time.time() + ttl
+        content_type = response.headers.get("content-type", "application/json")
+        self._write(
+            self.key(endpoint, resource, query_params), content_type, zlib.compress(body, self._compress_level), expires
+        )
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / total if total else 0.0}
+
+    def _count(self, hit: bool) -> None:
+        with self._counter_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    @abstractmethod
+    def _read(self, key: str) -> Optional[Tuple[str, bytes, Optional[float]]]:
+        """(content_type, compressed body, expires) stored under key, or None."""
+
+    @abstractmethod
+    def _write(self, key: str, content_type: str, body: bytes, expires: Optional[float]) -> None:
+        """Store a compressed body under key, replacing any previous entry."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every stored response."""
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteResponseCache(ResponseCache):
+    """ResponseCache stored in a single SQLite file.  Safe to share between threads."""
+
+    def __init__(self, path: str = "nhl_api_cache.sqlite3", **kwargs):
+        super().__init__(**kwargs)
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, content_type TEXT, body BLOB, expires REAL, stored REAL)"
+            )
+
+    def _read(self, key: str) -> Optional[Tuple[str, bytes, Optional[float]]]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT content_type, body, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+    def _write(self, key: str, content_type: str, body: bytes, expires: Optional[float]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, content_type, body, expires, stored) VALUES (?, ?, ?, ?, ?)",
+                (key, content_type, body, expires, time.time()),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
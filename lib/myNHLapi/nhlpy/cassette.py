@@ -0,0 +1,188 @@
+import base64
+import gzip
+import json
+import os
+import threading
+import zlib
+from typing import Dict, Iterator, Optional
+
+import httpx
+
+# Only these headers are kept; bodies are stored decoded, so content-encoding/length no longer apply.
+KEPT_HEADERS = ("content-type", "retry-after")
+
+
+def _recordable(status: int) -> bool:
+    """Throttling and server errors are transient and would only poison a replay."""
+    return status < 500 and status != 429
+
+
+class CassetteMiss(Exception):
+    """Raised in replay mode for a request the cassette has no response for."""
+
+    def __init__(self, method: str, url: str):
+        self.method = method
+        self.url = url
+        super().__init__(f"{method} {url} is not in the cassette")
+
+
+class Cassette:
+    """Archive of raw NHL API responses for offline runs and repeatable load tests.
+
+    Responses are keyed on method, URL and query params and stored as gzip compressed JSON lines, appended as they
+    are recorded.  Pass one to ``NHLClient(cassette=...)``, or serve it with ``nhlpy.standin.StandInServer``.
+
+    Modes:
+        "record": every request goes to the network and its response is added to the archive
+        "replay": requests are only answered from the archive, anything else raises ``CassetteMiss``
+        "auto":   answer from the archive when possible and record the rest
+    """
+
+    MODES = ("record", "replay", "auto")
+
+    def __init__(self, path: str, mode: str = "auto"):
+        """
+        :param path: archive file, e.g. "data/cassettes/season.jsonl.gz".  Created on the first recording.
+        :param mode: "record", "replay" or "auto".
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}, not {mode!r}")
+        self.path = path
+        self.mode = mode
+        self._entries: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._writer = None
+
+        if os.path.exists(path):
+            with gzip.open(path, "rt") as f:
+                try:
+                    for line in f:
+                        entry = json.loads(line)
+                        self._entries[self.key(entry["method"], entry["url"])] = entry
+                except (EOFError, zlib.error, ValueError):
+                    # the tail of an archive whose recording was cut short, everything before it is kept
+                    pass
+
+    @staticmethod
+    def key(method: str, url) -> str:
+        url = httpx.URL(url)
+        return json.dumps([method, str(url.copy_with(query=None)), sorted(url.params.multi_items())])
+
+    def __contains__(self, request: httpx.Request) -> bool:
+        return self.key(request.method, request.url) in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(list(self._entries.values()))
+
+    def lookup(self, method: str, url) -> Optional[dict]:
+        """The stored entry for a request: {"method", "url", "status", "headers", "body"} with a base64 body."""
+        return self._entries.get(self.key(method, url))
+
+    def play(self, request: httpx.Request) -> httpx.Response:
+        entry = self.lookup(request.method, request.url)
+        if entry is None:
+            raise CassetteMiss(request.method, str(request.url))
+        return httpx.Response(
+            entry["status"], headers=entry["headers"], content=base64.b64decode(entry["body"]), request=request
+        )
+
+    def add(self, method: str, url: str, status: int, headers: dict, body: bytes) -> None:
+        """Store a response and append it to the archive.  Safe to call from many threads."""
+        entry = {
+            "method": method,
+            "url": str(url),
+            "status": status,
+            "headers": {name: headers[name] for name in KEPT_HEADERS if name in headers},
+            "body": base64.b64encode(body).decode("ascii"),
+        }
+        with self._lock:
+            self._entries[self.key(method, url)] = entry
+            if self._writer is None:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                self._writer = gzip.open(self.path, "at")
+            self._writer.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    def record(self, request: httpx.Request, response: httpx.Response) -> httpx.Response:
+        """Keep a response that has been read in full, and return a copy of it for the caller."""
+        if _recordable(response.status_code):
+            self.add(request.method, str(request.url), response.status_code, response.headers, response.content)
+        return httpx.Response(
+            response.status_code,
+            headers={name: response.headers[name] for name in KEPT_HEADERS if name in response.headers},
+            content=response.content,
+            request=request,
+        )
+
+    def transport(self, inner: httpx.BaseTransport) -> "CassetteTransport":
+        """Wrap the transport of a sync client, see ``HttpClient``."""
+        return CassetteTransport(self, inner)
+
+    def async_transport(self, inner: httpx.AsyncBaseTransport) -> "AsyncCassetteTransport":
+        """Wrap the transport of an async client, see ``AsyncHttpClient``."""
+        return AsyncCassetteTransport(self, inner)
+
+    def close(self) -> None:
+        """Finish the archive.  Recording again afterwards appends a new gzip member, which reads back fine."""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+
+class CassetteTransport(httpx.BaseTransport):
+    """httpx transport that answers from a ``Cassette`` and/or records what ``inner`` returns."""
+
+    def __init__(self, cassette: Cassette, inner: httpx.BaseTransport):
+        self.cassette = cassette
+        self.inner = inner
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.cassette.mode != "record" and request in self.cassette:
+            return self.cassette.play(request)
+        if self.cassette.mode == "replay":
+            raise CassetteMiss(request.method, str(request.url))
+        response = self.inner.handle_request(request)
+        try:
+            response.read()
+        finally:
+            response.close()
+        return self.cassette.record(request, response)
+
+    def close(self) -> None:
+        self.inner.close()
+        self.cassette.close()
+
+
+class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+    """asyncio version of ``CassetteTransport``."""
+
+    def __init__(self, cassette: Cassette, inner: httpx.AsyncBaseTransport):
+        self.cassette = cassette
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.cassette.mode != "record" and request in self.cassette:
+            return self.cassette.play(request)
+        if self.cassette.mode == "replay":
+            raise CassetteMiss(request.method, str(request.url))
+        response = await self.inner.handle_async_request(request)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        return self.cassette.record(request, response)
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+        self.cassette.close()
+
+
+def cassette_from_env() -> Optional[Cassette]:
+    """Cassette named by $NHL_API_CASSETTE (mode from $NHL_API_CASSETTE_MODE, default "auto"), or None if unset."""
+    path = os.environ.get("NHL_API_CASSETTE")
+    if not path:
+        return None
+    return Cassette(path, mode=os.environ.get("NHL_API_CASSETTE_MODE", "auto"))
@@ -1,12 +1,53 @@
 class ClientConfig:
     def __init__(
-        self, debug: bool = False, timeout: int = 10, ssl_verify: bool = True, follow_redirects: bool = True
+        self,
+        debug: bool = False,
+        timeout: int = 10,
+        ssl_verify: bool = True,
+        follow_redirects: bool = True,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        cache=None,
+        rate_limiter=None,
+        max_retries: int = 3,
+        single_flight: bool = True,
+        cassette=None,
+        base_url: str = None,
+        fast_json: bool = False,
     ) -> None:
         self.debug = debug
         self.timeout = timeout
         self.ssl_verify = ssl_verify
         self.follow_redirects = follow_redirects
 
+        # Connection pool settings, shared by every request made through the client
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+
+        # Optional nhlpy.cache.ResponseCache, consulted before every GET
+        self.cache = cache
+
+        # Optional nhlpy.rate_limit.RateLimiter pacing requests per host, and how often a 429/5xx is retried
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+
+        # Collapse concurrent identical GETs into one request
+        self.single_flight = single_flight
+
+        # Optional nhlpy.cassette.Cassette that records responses or replays them without the network
+        self.cassette = cassette
+
+        # Send every request to this server instead of the NHL hosts, e.g. a local nhlpy.standin.StandInServer.
+        # The NHL host becomes the first path segment: {base_url}/api-web.nhle.com/v1/...
+        self.base_url = base_url.rstrip("/") if base_url else None
+
+        # Decode response bodies with orjson/msgspec when installed, see nhlpy.decode
+        self.fast_json = fast_json
+
         self.api_web_base_url = "https://api-web.nhle.com"
         self.api_base_url = "https://api.nhle.com"
         self.api_web_api_ver = "/v1/"
@@ -0,0 +1,152 @@
+"""Fast JSON decoding for the hot NHL payloads.
+
+``loads`` uses orjson or msgspec when one is installed (``pip install nhl-api-py[fast]``) and the standard library
+otherwise.  ``decode_play_by_play`` and ``decode_boxscore`` go further with msgspec: they decode straight into typed
+structs holding only the fields below, skipping everything else in the payload (names, headshots, clips, ...).
+Without msgspec they return ``Record`` objects with the same attribute access (missing fields read as None), so
+callers do not need to care.
+"""
+
+import json
+from functools import lru_cache
+from typing import List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on the environment
+    msgspec = None
+
+
+def loads(body):
+    """Decode a JSON document from bytes or str with the fastest available library."""
+    if orjson is not None:
+        return orjson.loads(body)
+    if msgspec is not None:
+        return _decoder(None).decode(body)
+    return json.loads(body)
+
+
+class Record:
+    """Fallback for the typed structs: a JSON object's keys as attributes, None for the ones it does not have."""
+
+    def __init__(self, fields: dict, **overrides):
+        self.__dict__.update(fields, **overrides)
+
+    def __getattr__(self, name):
+        # only reached for missing attributes
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return None
+
+    def __eq__(self, other):
+        return isinstance(other, Record) and self.__dict__ == other.__dict__
+
+    def __repr__(self):
+        return f"Record({self.__dict__!r})"
+
+
+if msgspec is not None:
+
+    class PlayDetails(msgspec.Struct):
+        """The player fields of a play's details, whichever of them the event type has."""
+
+        winningPlayerId: Optional[int] = None
+        losingPlayerId: Optional[int] = None
+        hittingPlayerId: Optional[int] = None
+        hitteePlayerId: Optional[int] = None
+        playerId: Optional[int] = None
+        scoringPlayerId: Optional[int] = None
+        assist1PlayerId: Optional[int] = None
+        assist2PlayerId: Optional[int] = None
+        shootingPlayerId: Optional[int] = None
+        blockingPlayerId: Optional[int] = None
+        goalieInNetId: Optional[int] = None
+        committedByPlayerId: Optional[int] = None
+        drawnByPlayerId: Optional[int] = None
+        servedByPlayerId: Optional[int] = None
+        descKey: Optional[str] = None
+        duration: Optional[int] = None
+
+    class Play(msgspec.Struct):
+        typeCode: int
+        details: Optional[PlayDetails] = None
+
+    class RosterSpot(msgspec.Struct):
+        playerId: int
+        teamId: int
+        positionCode: str
+
+    class PlayByPlay(msgspec.Struct):
+        id: int
+        gameState: Optional[str] = None
+        plays: List[Play] = []
+        rosterSpots: List[RosterSpot] = []
+
+    class SkaterGameStats(msgspec.Struct):
+        playerId: int
+        position: str = ""
+        goals: int = 0
+        assists: int = 0
+        points: int = 0
+        plusMinus: int = 0
+        pim: int = 0
+        hits: int = 0
+        sog: int = 0
+        blockedShots: int = 0
+        giveaways: int = 0
+        takeaways: int = 0
+        faceoffWinningPctg: float = 0.0
+
+    class TeamGameStats(msgspec.Struct):
+        forwards: List[SkaterGameStats] = []
+        defense: List[SkaterGameStats] = []
+
+    class PlayerByGameStats(msgspec.Struct):
+        homeTeam: TeamGameStats
+        awayTeam: TeamGameStats
+
+    class Boxscore(msgspec.Struct):
+        id: int
+        gameState: Optional[str] = None
+        playerByGameStats: Optional[PlayerByGameStats] = None
+
+
+@lru_cache(maxsize=None)
+def _decoder(schema):
+    return msgspec.json.Decoder(schema) if schema is not None else msgspec.json.Decoder()
+
+
+def decode_play_by_play(body):
+    """Play-by-play bytes as a ``PlayByPlay`` struct: id, gameState, plays (typeCode, details) and rosterSpots."""
+    if msgspec is not None:
+        return _decoder(PlayByPlay).decode(body)
+    doc = loads(body)
+    return Record(
+        doc,
+        plays=[
+            Record(play, details=Record(play["details"]) if "details" in play else None) for play in doc.get("plays", [])
+        ],
+        rosterSpots=[Record(spot) for spot in doc.get("rosterSpots", [])],
+    )
+
+
+def decode_boxscore(body):
+    """Boxscore bytes as a ``Boxscore`` struct: id, gameState and per-skater playerByGameStats."""
+    if msgspec is not None:
+        return _decoder(Boxscore).decode(body)
+    doc = loads(body)
+    stats = doc.get("playerByGameStats")
+    if stats is None:
+        return Record(doc)
+    teams = {
+        team: Record(
+            {group: [Record(player) for player in stats[team].get(group, [])] for group in ("forwards", "defense")}
+        )
+        for team in ("homeTeam", "awayTeam")
+    }
+    return Record(doc, playerByGameStats=Record(teams))
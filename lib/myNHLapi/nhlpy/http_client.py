@@ -1,8 +1,16 @@
 from enum import Enum
-from typing import Optional
+from typing import AsyncIterator, Iterator, Optional
 
+import asyncio
 import httpx
+import json
 import logging
+import threading
+import time
+
+from myNHLapi.nhlpy.decode import loads
+from myNHLapi.nhlpy.rate_limit import backoff_delay, parse_retry_after
+from myNHLapi.nhlpy.single_flight import SingleFlight
 
 
 class Endpoint(Enum):
@@ -66,9 +74,20 @@ class UnauthorizedException(NHLApiException):
         super().__init__(message, status_code, NHLApiErrorCode.UNAUTHORIZED)
 
 
-class HttpClient:
+# Status codes worth retrying: throttling and transient upstream failures
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+# Bytes per chunk yielded by HttpClient.stream
+STREAM_CHUNK_SIZE = 16 * 1024
+
+
+class _BaseHttpClient:
+    """Config, logging and response handling shared by the sync and async http clients."""
+
     def __init__(self, config) -> None:
         self._config = config
+        # concurrent identical GETs share one request; see SingleFlight.saved for how many were spared
+        self.single_flight = SingleFlight() if config.single_flight else None
         self._logger = logging.getLogger(__name__)
         if self._config.debug:
             self._logger.setLevel(logging.DEBUG)
@@ -80,6 +99,93 @@ class HttpClient:
         else:
             self._logger.setLevel(logging.WARNING)
 
+    def _limits(self) -> httpx.Limits:
+        """Build the connection pool limits from the config"""
+        return httpx.Limits(
+            max_connections=self._config.max_connections,
+            max_keepalive_connections=self._config.max_keepalive_connections,
+            keepalive_expiry=self._config.keepalive_expiry,
+        )
+
+    def _transport_kwargs(self) -> dict:
+        """Keyword arguments for the connection pool (transport) of the underlying httpx client"""
+        return {
+            "verify": self._config.ssl_verify,
+            "http2": self._config.http2,
+            "limits": self._limits(),
+        }
+
+    def _client_kwargs(self) -> dict:
+        """Keyword arguments used to build the underlying httpx client"""
+        return {
+            "timeout": self._config.timeout,
+            "follow_redirects": self._config.follow_redirects,
+            **self._transport_kwargs(),
+        }
+
+    @staticmethod
+    def _request_key(endpoint: Endpoint, resource: str, query_params: dict) -> str:
+        return json.dumps([endpoint.value, resource, sorted((query_params or {}).items())], default=str)
+
+    @staticmethod
+    def _api_url(endpoint: Endpoint, resource: str) -> str:
+        """The NHL URL of a resource.  The rate limiter is keyed on it even when base_url sends requests elsewhere."""
+        return f"{endpoint.value}{resource}"
+
+    def _full_url(self, endpoint: Endpoint, resource: str) -> str:
+        """The URL the request is sent to: the NHL URL, or the same path on base_url if one is set."""
+        full_url = self._api_url(endpoint, resource)
+        if self._config.base_url:
+            full_url = f"{self._config.base_url}/{full_url.split('://', 1)[1]}"
+        if self._config.debug:
+            self._logger.debug(f"GET: {full_url}")
+        return full_url
+
+    def _retry_delay(self, api_url: str, response: Optional[httpx.Response], attempt: int) -> Optional[float]:
+        """Feed the outcome of a request to the rate limiter and decide whether to retry it.
+
+        :param api_url: the request's NHL URL, see ``_api_url``
+        :param response: the response, or None when the request failed at the transport level
+        :return: seconds to wait before the next attempt, or None if the response should be returned as is
+        """
+        limiter = self._config.rate_limiter
+        retry_after = None
+        if response is not None:
+            if response.status_code not in RETRY_STATUS_CODES:
+                if limiter is not None and response.is_success:
+                    limiter.on_success(api_url)
+                return None
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if response.status_code == 429 and limiter is not None:
+                limiter.on_throttle(api_url, retry_after)
+
+        if attempt >= self._config.max_retries:
+            return None
+
+        delay = limiter.backoff(attempt, retry_after) if limiter is not None else backoff_delay(attempt, retry_after)
+        status = response.status_code if response is not None else "transport error"
+        self._logger.warning(f"GET {api_url} -> {status}, retry {attempt + 1} in {delay:.2f}s")
+        return delay
+
+    def json(self, response: httpx.Response):
+        """The response body decoded as JSON, with ``decode.loads`` if the config asks for fast JSON."""
+        if self._config.fast_json:
+            return loads(response.content)
+        return response.json()
+
+    def _cache_get(self, endpoint: Endpoint, resource: str, query_params: dict) -> Optional[httpx.Response]:
+        cache = self._config.cache
+        if cache is None:
+            return None
+        response = cache.get(endpoint, resource, query_params)
+        if response is not None and self._config.debug:
+            self._logger.debug(f"CACHE HIT: {endpoint.value}{resource}")
+        return response
+
+    def _cache_set(self, endpoint: Endpoint, resource: str, query_params: dict, response: httpx.Response) -> None:
+        if self._config.cache is not None:
+            self._config.cache.set(endpoint, resource, query_params, response)
+
     def _handle_response(self, response: httpx.Response, url: str) -> None:
         """Handle different HTTP status codes and raise appropriate exceptions"""
 
@@ -111,6 +217,60 @@ class HttpClient:
         else:
             raise NHLApiException(f"Unexpected error: {error_message}", response.status_code)
 
+
+class HttpClient(_BaseHttpClient):
+    """Thin wrapper around a long-lived, pooled ``httpx.Client``.
+
+    The underlying client is created lazily on the first request and reused for every request after that, so
+    connections (and their TCP/TLS handshakes) are kept alive and shared between threads.  Call ``close()`` when
+    you are done with it, or let the owning ``NHLClient`` do it for you.
+    """
+
+    def __init__(self, config) -> None:
+        super().__init__(config)
+        self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
+
+    def _get_client(self) -> httpx.Client:
+        """Return the shared httpx.Client, creating it on first use.  Safe to call from many threads."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    kwargs = self._client_kwargs()
+                    if self._config.cassette is not None:
+                        kwargs["transport"] = self._config.cassette.transport(
+                            httpx.HTTPTransport(**self._transport_kwargs())
+                        )
+                    self._client = httpx.Client(**kwargs)
+        return self._client
+
+    def close(self) -> None:
+        """Close the pooled connections.  A later request will transparently open a new pool."""
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def _send(self, api_url: str, full_url: str, query_params: dict) -> httpx.Response:
+        """GET through the rate limiter, retrying throttled and transient failures with backoff."""
+        limiter = self._config.rate_limiter
+        attempt = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire(api_url)
+            try:
+                r = self._get_client().get(url=full_url, params=query_params)
+            except httpx.TransportError:
+                delay = self._retry_delay(api_url, None, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(api_url, r, attempt)
+                if delay is None:
+                    return r
+            time.sleep(delay)
+            attempt += 1
+
     def get(self, endpoint: Endpoint, resource: str, query_params: dict = None) -> httpx.Response:
         """
         Private method to make a get request to the NHL API.  This wraps the lib httpx functionality.
@@ -120,7 +280,7 @@ class HttpClient:
         :return: httpx.Response
         :raises:
             ResourceNotFoundException: When the resource is not found
-            RateLimitExceededException: When rate limit is exceeded
+            RateLimitExceededException: When rate limit is still exceeded after max_retries retries
             ServerErrorException: When server returns 5xx error
             BadRequestException: When request is malformed
             UnauthorizedException: When authentication fails
@@ -129,13 +289,176 @@ class HttpClient:
             url=f"{self._config.api_web_base_url}{self._config.api_web_api_ver}{resource}"
             )
         """
-        with httpx.Client(
-            verify=self._config.ssl_verify, timeout=self._config.timeout, follow_redirects=self._config.follow_redirects
-        ) as client:
-            full_url = f"{endpoint.value}{resource}"
-            if self._config.debug:
-                self._logger.debug(f"GET: {full_url}")
-            r: httpx.Response = client.get(url=full_url, params=query_params)
+        if self.single_flight is None:
+            return self._get(endpoint, resource, query_params)
+        return self.single_flight.do(
+            self._request_key(endpoint, resource, query_params), lambda: self._get(endpoint, resource, query_params)
+        )
+
+    def _get(self, endpoint: Endpoint, resource: str, query_params: dict) -> httpx.Response:
+        cached = self._cache_get(endpoint, resource, query_params)
+        if cached is not None:
+            return cached
+
+        full_url = self._full_url(endpoint, resource)
+        r: httpx.Response = self._send(self._api_url(endpoint, resource), full_url, query_params)
 
         self._handle_response(r, resource)
+        self._cache_set(endpoint, resource, query_params, r)
         return r
+
+    def get_json(self, endpoint: Endpoint, resource: str, query_params: dict = None):
+        """``get`` a resource and return its body decoded as JSON, see ``json``."""
+        return self.json(self.get(endpoint, resource, query_params))
+
+    def stream(
+        self, endpoint: Endpoint, resource: str, query_params: dict = None, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """GET a resource as a stream of body chunks, so a large body can be consumed while it downloads.
+
+        Goes through the rate limiter and retries like ``get``, but not single flight or the cache: caching needs
+        the whole body, which is what streaming avoids holding.  Retries only happen before the first chunk is
+        yielded.
+        :raises: the same exceptions as ``get``
+        """
+        api_url = self._api_url(endpoint, resource)
+        full_url = self._full_url(endpoint, resource)
+        limiter = self._config.rate_limiter
+        attempt = 0
+        started = False
+        while True:
+            if limiter is not None:
+                limiter.acquire(api_url)
+            try:
+                with self._get_client().stream("GET", url=full_url, params=query_params) as r:
+                    if r.is_success:
+                        self._retry_delay(api_url, r, attempt)
+                        for chunk in r.iter_bytes(chunk_size):
+                            started = True
+                            yield chunk
+                        return
+                    r.read()
+                    delay = self._retry_delay(api_url, r, attempt)
+                    if delay is None:
+                        self._handle_response(r, resource)
+            except httpx.TransportError:
+                if started:
+                    raise
+                delay = self._retry_delay(api_url, None, attempt)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+
+class AsyncHttpClient(_BaseHttpClient):
+    """asyncio counterpart of ``HttpClient`` built on a single pooled ``httpx.AsyncClient``.
+
+    The pool is created lazily on the first request.  Every coroutine awaiting ``get`` shares it, so a single event
+    loop can keep many requests in flight over a handful of keep-alive connections.
+    """
+
+    def __init__(self, config) -> None:
+        super().__init__(config)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared httpx.AsyncClient, creating it on first use."""
+        if self._client is None:
+            kwargs = self._client_kwargs()
+            if self._config.cassette is not None:
+                kwargs["transport"] = self._config.cassette.async_transport(
+                    httpx.AsyncHTTPTransport(**self._transport_kwargs())
+                )
+            self._client = httpx.AsyncClient(**kwargs)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled connections.  A later request will transparently open a new pool."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    async def _send(self, api_url: str, full_url: str, query_params: dict) -> httpx.Response:
+        """Async version of ``HttpClient._send``."""
+        limiter = self._config.rate_limiter
+        attempt = 0
+        while True:
+            if limiter is not None:
+                await limiter.acquire_async(api_url)
+            try:
+                r = await self._get_client().get(url=full_url, params=query_params)
+            except httpx.TransportError:
+                delay = self._retry_delay(api_url, None, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(api_url, r, attempt)
+                if delay is None:
+                    return r
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get(self, endpoint: Endpoint, resource: str, query_params: dict = None) -> httpx.Response:
+        """
+        Async version of ``HttpClient.get``.
+        :param query_params:
+        :param endpoint:
+        :param resource:
+        :return: httpx.Response
+        :raises: the same exceptions as ``HttpClient.get``
+        """
+        if self.single_flight is None:
+            return await self._get(endpoint, resource, query_params)
+        return await self.single_flight.do_async(
+            self._request_key(endpoint, resource, query_params), lambda: self._get(endpoint, resource, query_params)
+        )
+
+    async def _get(self, endpoint: Endpoint, resource: str, query_params: dict) -> httpx.Response:
+        cached = self._cache_get(endpoint, resource, query_params)
+        if cached is not None:
+            return cached
+
+        full_url = self._full_url(endpoint, resource)
+        r: httpx.Response = await self._send(self._api_url(endpoint, resource), full_url, query_params)
+
+        self._handle_response(r, resource)
+        self._cache_set(endpoint, resource, query_params, r)
+        return r
+
+    async def get_json(self, endpoint: Endpoint, resource: str, query_params: dict = None):
+        """Async version of ``HttpClient.get_json``."""
+        return self.json(await self.get(endpoint, resource, query_params))
+
+    async def stream(
+        self, endpoint: Endpoint, resource: str, query_params: dict = None, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Async version of ``HttpClient.stream``."""
+        api_url = self._api_url(endpoint, resource)
+        full_url = self._full_url(endpoint, resource)
+        limiter = self._config.rate_limiter
+        attempt = 0
+        started = False
+        while True:
+            if limiter is not None:
+                await limiter.acquire_async(api_url)
+            try:
+                async with self._get_client().stream("GET", url=full_url, params=query_params) as r:
+                    if r.is_success:
+                        self._retry_delay(api_url, r, attempt)
+                        async for chunk in r.aiter_bytes(chunk_size):
+                            started = True
+                            yield chunk
+                        return
+                    await r.aread()
+                    delay = self._retry_delay(api_url, r, attempt)
+                    if delay is None:
+                        self._handle_response(r, resource)
+            except httpx.TransportError:
+                if started:
+                    raise
+                delay = self._retry_delay(api_url, None, attempt)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
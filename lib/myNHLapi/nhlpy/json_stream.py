@@ -0,0 +1,118 @@
+"""Incremental parsing of a JSON object as its bytes arrive.
+
+``iter_items`` turns a stream of byte chunks holding one JSON object into its top-level ``(key, value)`` pairs, in
+document order, as soon as each value is complete.  Keys listed in ``expand`` must hold arrays and are yielded one
+element at a time, so e.g. a play-by-play document's ``plays`` never has to be held in memory as a whole::
+
+    for key, value in iter_items(response.iter_bytes(), expand=("plays",)):
+        if key == "plays":
+            ...  # one play
+"""
+
+import codecs
+import json
+import re
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Tuple
+
+# separators between items; commas are skipped like whitespace, the decoder validates the values themselves
+_SKIP = re.compile(r"[ \t\n\r,]*")
+_SPACE = re.compile(r"[ \t\n\r]*")
+_COLON = re.compile(r"[ \t\n\r]*:")
+
+
+class ItemParser:
+    """Push parser behind ``iter_items``: ``feed`` chunks in, get the completed top-level items back."""
+
+    def __init__(self, expand: Iterable[str] = ()):
+        self.expand = frozenset(expand)
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = "start"
+        self._key = None
+
+    def feed(self, chunk: bytes, final: bool = False) -> List[Tuple[str, object]]:
+        self._buffer += self._text.decode(chunk, final)
+        items = []
+        pos = 0
+        buffer = self._buffer
+        while True:
+            pos = _SKIP.match(buffer, pos).end()
+            if pos >= len(buffer):
+                break
+            char = buffer[pos]
+
+            if self._state == "start":
+                if char != "{":
+                    raise ValueError(f"expected a JSON object, got {char!r}")
+                self._state = "key"
+                pos += 1
+            elif self._state == "key":
+                if char == "}":
+                    self._state = "done"
+                    pos += 1
+                    continue
+                try:
+                    key, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                colon = _COLON.match(buffer, end)
+                if colon is None:
+                    if _SPACE.match(buffer, end).end() == len(buffer) and not final:
+                        break
+                    raise ValueError(f"expected ':' after key {key!r}")
+                if not isinstance(key, str):
+                    raise ValueError(f"expected a key, got {key!r}")
+                self._key = key
+                self._state = "value"
+                pos = colon.end()
+            elif self._state == "value" and self._key in self.expand and char == "[":
+                self._state = "array"
+                pos += 1
+            elif self._state == "array" and char == "]":
+                self._state = "key"
+                pos += 1
+            elif self._state in ("value", "array"):
+                try:
+                    value, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                if end == len(buffer) and not final:
+                    # a number at the very end of the buffer may still have digits to come
+                    break
+                items.append((self._key, value))
+                if self._state == "value":
+                    self._state = "key"
+                pos = end
+            else:
+                raise ValueError(f"unexpected {char!r} after the end of the document")
+
+        self._buffer = buffer[pos:]
+        if final and self._state != "done":
+            raise ValueError("JSON document ended early")
+        return items
+
+    def close(self) -> List[Tuple[str, object]]:
+        return self.feed(b"", final=True)
+
+
+def iter_items(chunks: Iterable[bytes], expand: Iterable[str] = ()) -> Iterator[Tuple[str, object]]:
+    """(key, value) for each top-level item of the JSON object in ``chunks``, element by element for ``expand``."""
+    parser = ItemParser(expand)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aiter_items(chunks: AsyncIterable[bytes], expand: Iterable[str] = ()) -> AsyncIterator[Tuple[str, object]]:
+    """Async version of ``iter_items``."""
+    parser = ItemParser(expand)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
@@ -1,5 +1,11 @@
+import asyncio
+from typing import Any, Awaitable, Iterable, List, Optional
+
+from myNHLapi.nhlpy.cache import ResponseCache
+from myNHLapi.nhlpy.cassette import Cassette
+from myNHLapi.nhlpy.rate_limit import RateLimiter
 from myNHLapi.nhlpy.api import teams, standings, schedule, game_center, stats, misc, helpers, players
-from myNHLapi.nhlpy.http_client import HttpClient
+from myNHLapi.nhlpy.http_client import AsyncHttpClient, HttpClient
 from myNHLapi.nhlpy.config import ClientConfig
 
 
@@ -11,10 +17,30 @@ class NHLClient:
     such as:
         client = NHLClient()
         client = NHLClient(debug=True) # for a lil extra logging
+
+    The client owns a pooled, keep-alive connection that is shared by every request (and every thread) made
+    through it.  Close it when you are done, or use it as a context manager:
+        with NHLClient() as client:
+            client.teams.teams()
     """
 
     def __init__(
-        self, debug: bool = False, timeout: int = 10, ssl_verify: bool = True, follow_redirects: bool = True
+        self,
+        debug: bool = False,
+        timeout: int = 10,
+        ssl_verify: bool = True,
+        follow_redirects: bool = True,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_retries: int = 3,
+        single_flight: bool = True,
+        cassette: Optional[Cassette] = None,
+        base_url: Optional[str] = None,
+        fast_json: bool = False,
     ) -> None:
         """
         :param follow_redirects: bool.  Some of these endpoints use redirects (ew).  This is the case when using
@@ -22,12 +48,46 @@ class NHLClient:
         :param debug: bool, Defaults to False.  Set to True for extra logging.
         :param timeout: int, Defaults to 10 seconds.
         :param ssl_verify: bool, Defaults to True.  Set to false if you want to ignore SSL verification.
+        :param max_connections: int, Defaults to 20.  Max number of concurrent connections in the pool.  Size this
+        to at least the number of worker threads sharing the client.
+        :param max_keepalive_connections: int, Defaults to 10.  Max number of idle connections kept open.
+        :param keepalive_expiry: float, Defaults to 30 seconds.  How long an idle connection is kept open.
+        :param http2: bool, Defaults to False.  Requires the optional `h2` package (`pip install httpx[http2]`).
+        :param cache: ResponseCache, Defaults to None.  e.g. SQLiteResponseCache("nhl.sqlite3") to keep responses
+        on disk and skip the network on a hit.  Completed games are cached forever, "now"/standings briefly.
+        :param rate_limiter: RateLimiter, Defaults to a new RateLimiter().  Per-host token buckets that adapt to
+        429s.  Share one instance between clients to share the budget.
+        :param max_retries: int, Defaults to 3.  Retries for 429/502/503/504 and transport errors, honoring
+        Retry-After or backing off exponentially with jitter.
+        :param single_flight: bool, Defaults to True.  Concurrent identical requests (e.g. many threads asking for
+        the same boxscore) share one in-flight request.  ``client.single_flight.saved`` counts the requests spared.
+        :param cassette: Cassette, Defaults to None.  e.g. Cassette("season.jsonl.gz", mode="record") to capture every
+        response, or mode="replay" to run without the network.
+        :param base_url: str, Defaults to None.  Send requests to another server instead of the NHL hosts, e.g. a
+        local ``nhlpy.standin`` server at "http://127.0.0.1:8765".
+        :param fast_json: bool, Defaults to False.  Decode responses with orjson or msgspec when installed
+        (``pip install nhl-api-py[fast]``).  See ``nhlpy.decode`` for typed decoding of play-by-play and boxscores.
         """
         # This config type setup isnt doing what I thought it would.  This will be reworked later on.
         self._config = ClientConfig(
-            debug=debug, timeout=timeout, ssl_verify=ssl_verify, follow_redirects=follow_redirects
+            debug=debug,
+            timeout=timeout,
+            ssl_verify=ssl_verify,
+            follow_redirects=follow_redirects,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            cache=cache,
+            rate_limiter=rate_limiter if rate_limiter is not None else RateLimiter(),
+            max_retries=max_retries,
+            single_flight=single_flight,
+            cassette=cassette,
+            base_url=base_url,
+            fast_json=fast_json,
         )
         self._http_client = HttpClient(self._config)
+        self.single_flight = self._http_client.single_flight
 
         self.teams = teams.Teams(http_client=self._http_client)
         self.standings = standings.Standings(http_client=self._http_client)
@@ -37,3 +97,105 @@ class NHLClient:
         self.misc = misc.Misc(http_client=self._http_client)
         self.helpers = helpers.Helpers(http_client=self._http_client)
         self.players = players.Players(http_client=self._http_client)
+
+    def close(self) -> None:
+        """Close the underlying connection pool."""
+        self._http_client.close()
+
+    def __enter__(self) -> "NHLClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class AsyncNHLClient:
+    """
+    asyncio version of ``NHLClient``.  It exposes the same endpoint modules, but every endpoint method is a
+    coroutine and all of them share one pooled ``httpx.AsyncClient``:
+        async with AsyncNHLClient() as client:
+            boxscores = await client.gather(client.game_center.boxscore(g) for g in game_ids)
+
+    Takes the same arguments as ``NHLClient``.
+    """
+
+    def __init__(
+        self,
+        debug: bool = False,
+        timeout: int = 10,
+        ssl_verify: bool = True,
+        follow_redirects: bool = True,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_retries: int = 3,
+        single_flight: bool = True,
+        cassette: Optional[Cassette] = None,
+        base_url: Optional[str] = None,
+        fast_json: bool = False,
+    ) -> None:
+        self._config = ClientConfig(
+            debug=debug,
+            timeout=timeout,
+            ssl_verify=ssl_verify,
+            follow_redirects=follow_redirects,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            cache=cache,
+            rate_limiter=rate_limiter if rate_limiter is not None else RateLimiter(),
+            max_retries=max_retries,
+            single_flight=single_flight,
+            cassette=cassette,
+            base_url=base_url,
+            fast_json=fast_json,
+        )
+        self._http_client = AsyncHttpClient(self._config)
+        self.single_flight = self._http_client.single_flight
+
+        self.teams = teams.AsyncTeams(http_client=self._http_client)
+        self.standings = standings.AsyncStandings(http_client=self._http_client)
+        self.schedule = schedule.AsyncSchedule(http_client=self._http_client)
+        self.game_center = game_center.AsyncGameCenter(http_client=self._http_client)
+        self.stats = stats.AsyncStats(http_client=self._http_client)
+        self.misc = misc.AsyncMisc(http_client=self._http_client)
+        self.helpers = helpers.AsyncHelpers(http_client=self._http_client)
+        self.players = players.AsyncPlayers(http_client=self._http_client)
+
+    async def gather(
+        self, aws: Iterable[Awaitable[Any]], limit: int = 100, return_exceptions: bool = False
+    ) -> List[Any]:
+        """Await many requests with at most ``limit`` of them in flight at once.
+
+        Results come back in the same order as ``aws``.  Requests beyond the pool size simply wait for a free
+        connection, so ``limit`` bounds memory and open sockets rather than throughput.
+
+        Args:
+            aws: Coroutines (or other awaitables), e.g. ``(client.game_center.boxscore(g) for g in game_ids)``
+            limit (int): Max number of awaitables running concurrently.  Defaults to 100.
+            return_exceptions (bool): Same as ``asyncio.gather``.  When False the first failure is raised.
+
+        Returns:
+            List of results, in input order.
+        """
+        semaphore = asyncio.Semaphore(limit)
+
+        async def _bounded(aw: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await aw
+
+        return await asyncio.gather(*(_bounded(aw) for aw in aws), return_exceptions=return_exceptions)
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._http_client.aclose()
+
+    async def __aenter__(self) -> "AsyncNHLClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
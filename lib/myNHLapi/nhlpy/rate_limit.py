@@ -0,0 +1,156 @@
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class HostBudget:
+    """Request budget for one host.
+
+    Args:
+        rate (float): Requests per second to start at.
+        burst (int): Bucket size, i.e. how many requests may go out back to back after an idle period.
+        max_rate (float): Ceiling the rate may climb to while the server keeps answering without 429s.
+        min_rate (float): Floor the rate may drop to after repeated 429s.
+    """
+
+    def __init__(self, rate: float, burst: int, max_rate: float, min_rate: float = 0.5) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+
+
+DEFAULT_BUDGETS: Dict[str, HostBudget] = {
+    "api-web.nhle.com": HostBudget(rate=10, burst=20, max_rate=50),
+    "api.nhle.com": HostBudget(rate=5, burst=10, max_rate=25),
+}
+DEFAULT_BUDGET = HostBudget(rate=5, burst=10, max_rate=25)
+
+
+class TokenBucket:
+    """Token bucket whose refill rate adapts to the server (AIMD).
+
+    Every success nudges the rate up by ``increase`` towards ``max_rate``, every 429 multiplies it by ``decrease``
+    and blocks the bucket until the server's ``Retry-After``.  Callers reserve a slot under a short lock and then
+    sleep outside it, so the same bucket can be shared by threads and by coroutines on an event loop.
+    """
+
+    def __init__(self, budget: HostBudget, increase: float = 0.1, decrease: float = 0.5) -> None:
+        self._budget = budget
+        self._increase = increase
+        self._decrease = decrease
+        self._lock = threading.Lock()
+        self.rate = budget.rate
+        self._tokens = float(budget.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._budget.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # tokens may go negative: each waiter is queued one token-interval behind the previous one
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            return max(wait, self._blocked_until - now)
+
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.rate = min(self._budget.max_rate, self.rate + self._increase)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        with self._lock:
+            self.rate = max(self._budget.min_rate, self.rate * self._decrease)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+
+
+class RateLimiter:
+    """Per-host token buckets shared by every request made through a client.
+
+    One instance can be passed to several clients (sync and async) so they share the same budget.
+
+    Args:
+        budgets (Dict[str, HostBudget]): Budget per host name.  Defaults to DEFAULT_BUDGETS.
+        default_budget (HostBudget): Budget for hosts without an entry in ``budgets``.
+        backoff_base (float): First retry delay in seconds when the server gives no ``Retry-After``.
+        backoff_max (float): Cap on a single retry delay.
+    """
+
+    def __init__(
+        self,
+        budgets: Dict[str, HostBudget] = None,
+        default_budget: HostBudget = DEFAULT_BUDGET,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+    ) -> None:
+        self._budgets = DEFAULT_BUDGETS if budgets is None else budgets
+        self._default_budget = default_budget
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self.throttled = 0
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(host, TokenBucket(self._budgets.get(host, self._default_budget)))
+        return bucket
+
+    def acquire(self, url: str) -> None:
+        self.bucket(url).acquire()
+
+    async def acquire_async(self, url: str) -> None:
+        await self.bucket(url).acquire_async()
+
+    def on_success(self, url: str) -> None:
+        self.bucket(url).on_success()
+
+    def on_throttle(self, url: str, retry_after: Optional[float] = None) -> None:
+        with self._lock:
+            self.throttled += 1
+        self.bucket(url).on_throttle(retry_after)
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        return backoff_delay(attempt, retry_after, self._backoff_base, self._backoff_max)
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None, base: float = 0.5, cap: float = 30.0) -> float:
+    """Delay before retry number ``attempt`` (0 based).  Honors Retry-After, else full-jitter exponential."""
+    if retry_after is not None:
+        return min(retry_after, cap)
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header, given either as seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,76 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """Collapse concurrent identical calls into one.
+
+    The first caller for a key runs the function, every caller that arrives with the same key while it is still
+    running waits for it and gets the same result (or exception).  Nothing is remembered once the call finishes,
+    so this only removes duplicate work that overlaps in time, it is not a cache.
+
+    ``saved`` counts the calls that were served by someone else's in-flight call.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._async_calls: Dict[Hashable, asyncio.Future] = {}
+        self.executed = 0
+        self.saved = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.saved += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._async_calls.get(key)
+        if task is not None:
+            self.saved += 1
+        else:
+            # the call runs in its own task that every caller, the first one included, only waits on, so a
+            # cancelled caller stops waiting without ending the request for the others
+            task = self._async_calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._finish_async(key, done))
+            self.executed += 1
+        return await asyncio.shield(task)
+
+    def _finish_async(self, key: Hashable, task: asyncio.Future) -> None:
+        del self._async_calls[key]
+        if not task.cancelled():
+            # mark the exception as retrieved in case every caller was cancelled before it came in
+            task.exception()
+
+    def stats(self) -> dict:
+        return {"executed": self.executed, "saved": self.saved}
@@ -0,0 +1,221 @@
+"""Local stand-in for the NHL API, serving a ``Cassette`` over HTTP for offline, repeatable load tests.
+
+    python -m myNHLapi.nhlpy.standin --cassette season.jsonl.gz --template pbp.json --template boxscore.json \\
+        --latency 0.05 --jitter 0.02 --throttle 0.01 --bandwidth 2000000
+
+then point a client at it with ``NHLClient(base_url="http://127.0.0.1:8765")``.
+"""
+
+import argparse
+import base64
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, Optional, Tuple
+
+from myNHLapi.nhlpy.cassette import Cassette
+
+GAME_URL = re.compile(r"^https://api-web\.nhle\.com/v1/gamecenter/(\d+)/(boxscore|play-by-play)$")
+
+# Bodies are written in chunks of this size when a bandwidth cap is set
+CHUNK_SIZE = 16 * 1024
+
+
+def load_templates(paths: Iterable[str]) -> Dict[str, Tuple[bytes, bytes]]:
+    """{kind: (game id, body)} from saved boxscore/play-by-play payloads such as the bundled boxscore.json/pbp.json.
+
+    The stand-in answers a game the cassette does not have with the template of the same kind, with the
+    template's game id swapped for the requested one, so a couple of payloads are enough for a full-season run.
+    """
+    templates = {}
+    for path in paths:
+        with open(path, "rb") as f:
+            body = f.read()
+        payload = json.loads(body)
+        kind = "play-by-play" if "plays" in payload else "boxscore"
+        templates[kind] = (str(payload["id"]).encode(), body)
+    return templates
+
+
+class StandInServer(ThreadingHTTPServer):
+    """HTTP server that replays a cassette with configurable latency, jitter, 429 injection and bandwidth.
+
+    Requests are expected in the form ``/<nhl host>/<path>``, which is what ``NHLClient(base_url=server.url)``
+    sends.  All randomness comes from one seeded generator, so a run with the same seed and request order sees
+    the same delays and throttles.  ``stats`` counts requests, throttles, template hits and misses.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        throttle: float = 0.0,
+        retry_after: float = 1.0,
+        bandwidth: Optional[float] = None,
+        templates: Optional[Dict[str, Tuple[bytes, bytes]]] = None,
+        seed: int = 0,
+    ):
+        """
+        :param cassette: responses to serve.
+        :param port: 0 picks a free port, see ``url``.
+        :param latency: seconds added before every response.
+        :param jitter: up to this many seconds added to or taken off the latency, uniformly.
+        :param throttle: share of requests, 0-1, answered with 429 and a Retry-After header instead.
+        :param retry_after: seconds sent in the Retry-After header of injected 429s.
+        :param bandwidth: cap in bytes per second for each response body.  None for no cap.
+        :param templates: fallback game payloads from ``load_templates``.
+        :param seed: seed for the jitter and 429 injection.
+        """
+        super().__init__((host, port), _Handler)
+        self.cassette = cassette
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle = throttle
+        self.retry_after = retry_after
+        self.bandwidth = bandwidth
+        self.templates = templates or {}
+        self.stats = {"requests": 0, "throttled": 0, "templated": 0, "misses": 0}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def draw(self) -> Tuple[float, bool]:
+        """Delay for the next request and whether it gets throttled."""
+        with self._lock:
+            self.stats["requests"] += 1
+            delay = max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+            throttled = self._random.random() < self.throttle
+            if throttled:
+                self.stats["throttled"] += 1
+        return delay, throttled
+
+    def lookup(self, url: str) -> Optional[Tuple[int, dict, bytes]]:
+        """(status, headers, body) for an NHL API url, from the cassette or a template."""
+        entry = self.cassette.lookup("GET", url)
+        if entry is not None:
+            return entry["status"], entry["headers"], base64.b64decode(entry["body"])
+
+        match = GAME_URL.match(url.split("?", 1)[0])
+        if match and match.group(2) in self.templates:
+            template_id, body = self.templates[match.group(2)]
+            with self._lock:
+                self.stats["templated"] += 1
+            return 200, {"content-type": "application/json"}, body.replace(template_id, match.group(1).encode())
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return None
+
+    def start(self) -> "StandInServer":
+        """Serve on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        server: StandInServer = self.server
+        delay, throttled = server.draw()
+        time.sleep(delay)
+
+        if throttled:
+            self._send(429, {"retry-after": str(server.retry_after)}, b'{"message": "Too Many Requests"}')
+            return
+
+        host, _, path = self.path.lstrip("/").partition("/")
+        found = server.lookup(f"https://{host}/{path}")
+        if found is None:
+            self._send(404, {"content-type": "application/json"}, b'{"message": "Not in cassette"}')
+            return
+        self._send(*found)
+
+    def _send(self, status: int, headers: dict, body: bytes) -> None:
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+
+        bandwidth = self.server.bandwidth
+        if not bandwidth:
+            self.wfile.write(body)
+            return
+        for start in range(0, len(body), CHUNK_SIZE):
+            chunk = body[start : start + CHUNK_SIZE]
+            self.wfile.write(chunk)
+            time.sleep(len(chunk) / bandwidth)
+
+    def log_message(self, format, *args) -> None:
+        # one line per request would drown out the load test itself
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a recorded cassette as a local NHL API stand-in.")
+    parser.add_argument("--cassette", required=True, help="cassette archive recorded with NHLClient(cassette=...)")
+    parser.add_argument(
+        "--template", action="append", default=[], help="boxscore/play-by-play JSON to serve for unrecorded games"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="+/- seconds of uniform jitter on the latency")
+    parser.add_argument("--throttle", type=float, default=0.0, help="share of requests answered with 429, 0-1")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds on injected 429s")
+    parser.add_argument("--bandwidth", type=float, help="bytes per second per response")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = StandInServer(
+        Cassette(args.cassette, mode="replay"),
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        throttle=args.throttle,
+        retry_after=args.retry_after,
+        bandwidth=args.bandwidth,
+        templates=load_templates(args.template),
+        seed=args.seed,
+    )
+    print(f"Serving {len(server.cassette)} recorded responses on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(server.stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import asyncio
+import inspect
+from unittest import mock
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from myNHLapi.nhlpy import AsyncNHLClient
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.mark.parametrize(
+    "module", ["teams", "standings", "schedule", "game_center", "stats", "misc", "helpers", "players"]
+)
+def test_every_public_endpoint_is_a_coroutine(module):
+    endpoint = getattr(AsyncNHLClient(), module)
+    public = [name for name, _ in inspect.getmembers(endpoint, inspect.ismethod) if not name.startswith("_")]
+    assert public
+    for name in public:
+        method = getattr(endpoint, name)
+        assert inspect.iscoroutinefunction(method) or inspect.isasyncgenfunction(method), f"{module}.{name} is not async"
+
+
+@mock.patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+def test_async_boxscore(h_m):
+    h_m.return_value = MagicMock()
+    client = AsyncNHLClient()
+    _run(client.game_center.boxscore(game_id="2020020001"))
+    h_m.assert_awaited_once()
+    assert h_m.call_args[1]["url"] == "https://api-web.nhle.com/v1/gamecenter/2020020001/boxscore"
+
+
+@mock.patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+def test_async_skater_stats_summary_params_match_sync(h_m, nhl_client):
+    h_m.return_value = MagicMock()
+    client = AsyncNHLClient()
+    _run(client.stats.skater_stats_summary(start_season="20232024", end_season="20232024", franchise_id=19))
+    with mock.patch("httpx.Client.get") as sync_m:
+        nhl_client.stats.skater_stats_summary(start_season="20232024", end_season="20232024", franchise_id=19)
+
+    assert h_m.call_args[1]["url"] == "https://api.nhle.com/stats/rest/en/skater/summary"
+    assert h_m.call_args[1]["params"] == sync_m.call_args[1]["params"]
+
+
+@mock.patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+def test_async_get_player_stats_joins_reports(h_m):
+    summary = MagicMock()
+    summary.json.return_value = {"data": [{"seasonId": 20232024, "points": 10}]}
+    realtime = MagicMock()
+    realtime.json.return_value = {"data": [{"seasonId": 20232024, "hits": 5, "blockedShots": 3}]}
+    h_m.side_effect = [summary, realtime]
+
+    client = AsyncNHLClient()
+    result = _run(client.stats.get_player_stats("8478402", start="20232024", end="20232024"))
+
+    assert result == [{"seasonId": 20232024, "points": 10, "hits": 5, "blockedShots": 3}]
+
+
+@mock.patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+def test_async_bulk_player_stats_fetches_remaining_pages(h_m):
+    def page(rows, total):
+        response = MagicMock()
+        response.json.return_value = {"data": rows, "total": total}
+        return response
+
+    h_m.side_effect = [
+        page([{"playerId": 1, "seasonId": 20232024}], 2),
+        page([{"playerId": 1, "seasonId": 20232024, "hits": 4, "blockedShots": 1}], 2),
+        page([{"playerId": 2, "seasonId": 20232024}], 2),
+        page([{"playerId": 2, "seasonId": 20232024, "hits": 0, "blockedShots": 7}], 2),
+    ]
+
+    client = AsyncNHLClient()
+    result = _run(client.stats.bulk_player_stats(start="20232024", end="20232024", page_size=1))
+
+    assert h_m.await_count == 4
+    assert result["1"][0]["hits"] == 4
+    assert result["2"][0]["blockedShots"] == 7
+
+
+@mock.patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+def test_async_iter_goalie_stats_summary_walks_pages(h_m):
+    def page(rows, total):
+        response = MagicMock()
+        response.json.return_value = {"data": rows, "total": total}
+        return response
+
+    h_m.side_effect = [page([{"playerId": 1}, {"playerId": 2}], 3), page([{"playerId": 3}], 3)]
+
+    async def run():
+        rows = AsyncNHLClient().stats.iter_goalie_stats_summary("20232024", page_size=2, prefetch=True)
+        return [row["playerId"] async for row in rows]
+
+    assert _run(run()) == [1, 2, 3]
+    assert [c[1]["params"]["start"] for c in h_m.call_args_list] == [0, 2]
+    assert h_m.call_args[1]["url"] == "https://api.nhle.com/stats/rest/en/goalie/summary"
+
+
+def test_gather_bounds_concurrency_and_keeps_order():
+    client = AsyncNHLClient()
+    in_flight = 0
+    peak = 0
+
+    async def work(i):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return i
+
+    results = _run(client.gather((work(i) for i in range(20)), limit=4))
+
+    assert results == list(range(20))
+    assert peak == 4
+
+
+@mock.patch("httpx.AsyncClient.aclose", new_callable=AsyncMock)
+@mock.patch("httpx.AsyncClient.get", new_callable=AsyncMock)
+def test_async_context_manager_closes_pool(h_m, close_m):
+    h_m.return_value = MagicMock()
+
+    async def run():
+        async with AsyncNHLClient() as client:
+            await client.misc.countries()
+
+    _run(run())
+    close_m.assert_awaited_once()
@@ -0,0 +1,84 @@
+import json
+import time
+from unittest import mock
+
+import httpx
+import pytest
+
+from myNHLapi.nhlpy.cache import PERMANENT, ResponseCache, SQLiteResponseCache
+from myNHLapi.nhlpy.http_client import Endpoint
+from myNHLapi.nhlpy.nhl_client import NHLClient
+
+
+def _response(payload: dict) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json=payload,
+        request=httpx.Request("GET", "https://api-web.nhle.com/v1/test"),
+    )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = SQLiteResponseCache(str(tmp_path / "cache.sqlite3"))
+    yield c
+    c.close()
+
+
+def test_cache_roundtrip_and_counters(cache):
+    assert cache.get(Endpoint.API_WEB_V1, "player/1/landing") is None
+
+    cache.set(Endpoint.API_WEB_V1, "player/1/landing", None, _response({"playerId": 1}))
+    hit = cache.get(Endpoint.API_WEB_V1, "player/1/landing")
+
+    assert hit.json() == {"playerId": 1}
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_cache_key_includes_query_params(cache):
+    cache.set(Endpoint.API_STATS, "en/skater/summary", {"start": 0}, _response({"data": [1]}))
+
+    assert cache.get(Endpoint.API_STATS, "en/skater/summary", {"start": 100}) is None
+    assert cache.get(Endpoint.API_STATS, "en/skater/summary", {"start": 0}).json() == {"data": [1]}
+
+
+@pytest.mark.parametrize(
+    "resource,payload,expected",
+    [
+        ("gamecenter/2023020001/boxscore", {"gameState": "OFF"}, PERMANENT),
+        ("gamecenter/2023020001/play-by-play", {"gameState": "FINAL"}, PERMANENT),
+        ("gamecenter/2023020001/boxscore", {"gameState": "LIVE"}, 30),
+        ("standings/now", {}, 60),
+        ("standings/2024-04-18", {}, 300),
+        ("player/8478402/landing", {}, 3600),
+    ],
+)
+def test_cache_ttl_policy(cache, resource, payload, expected):
+    assert cache.ttl_for(resource, json.dumps(payload).encode()) == expected
+
+
+def test_cache_expired_entry_is_a_miss(cache):
+    cache.set(Endpoint.API_WEB_V1, "standings/now", None, _response({"standings": []}))
+
+    with mock.patch("time.time", return_value=time.time() + 120):
+        assert cache.get(Endpoint.API_WEB_V1, "standings/now") is None
+
+
+def test_client_cache_hit_skips_network(cache):
+    client = NHLClient(cache=cache)
+    with mock.patch("httpx.Client.get", return_value=_response({"gameState": "OFF", "id": 1})) as h_m:
+        first = client.game_center.boxscore(game_id="2023020001")
+        second = client.game_center.boxscore(game_id="2023020001")
+
+    h_m.assert_called_once()
+    assert first == second == {"gameState": "OFF", "id": 1}
+    assert cache.hits == 1
+
+
+def test_incomplete_cache_subclass_fails_on_creation():
+    class ReadOnlyCache(ResponseCache):
+        def _read(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        ReadOnlyCache()
@@ -0,0 +1,120 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from myNHLapi.nhlpy.cassette import Cassette, CassetteMiss
+from myNHLapi.nhlpy.nhl_client import AsyncNHLClient, NHLClient
+from myNHLapi.nhlpy.rate_limit import DEFAULT_BUDGETS, RateLimiter
+from myNHLapi.nhlpy.standin import StandInServer, load_templates
+
+
+def _upstream(requests):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        return httpx.Response(200, json={"url": str(request.url)})
+
+    return handler
+
+
+def test_record_then_replay_without_network(tmp_path, monkeypatch):
+    path = str(tmp_path / "tape.jsonl.gz")
+    requests = []
+    monkeypatch.setattr(httpx, "HTTPTransport", lambda **kwargs: httpx.MockTransport(_upstream(requests)))
+
+    with NHLClient(cassette=Cassette(path, mode="record")) as client:
+        recorded = client.game_center.boxscore(game_id="2023020280")
+    assert len(requests) == 1
+
+    with NHLClient(cassette=Cassette(path, mode="replay")) as client:
+        assert client.game_center.boxscore(game_id="2023020280") == recorded
+        with pytest.raises(CassetteMiss):
+            client.game_center.boxscore(game_id="2023020281")
+    assert len(requests) == 1
+
+
+def test_cassette_key_ignores_query_order(tmp_path):
+    cassette = Cassette(str(tmp_path / "tape.jsonl.gz"))
+    cassette.add("GET", "https://api.nhle.com/stats/rest/en/skater/summary?b=2&a=1", 200, {}, b"{}")
+
+    assert cassette.lookup("GET", "https://api.nhle.com/stats/rest/en/skater/summary?a=1&b=2") is not None
+    assert cassette.lookup("GET", "https://api.nhle.com/stats/rest/en/skater/summary?a=1") is None
+
+
+def test_auto_mode_records_misses_only(tmp_path, monkeypatch):
+    path = str(tmp_path / "tape.jsonl.gz")
+    requests = []
+    monkeypatch.setattr(httpx, "AsyncHTTPTransport", lambda **kwargs: httpx.MockTransport(_upstream(requests)))
+
+    async def run():
+        async with AsyncNHLClient(cassette=Cassette(path), single_flight=False) as client:
+            await client.game_center.play_by_play("2023020280")
+            await client.game_center.play_by_play("2023020280")
+
+    asyncio.run(run())
+    assert len(requests) == 1
+    assert len(Cassette(path)) == 1
+
+
+def test_truncated_archive_keeps_complete_entries(tmp_path):
+    path = str(tmp_path / "tape.jsonl.gz")
+    cassette = Cassette(path)
+    cassette.add("GET", "https://api-web.nhle.com/v1/a", 200, {}, b"1")
+    cassette.close()
+    cassette.add("GET", "https://api-web.nhle.com/v1/b", 200, {}, b"2" * 200)
+    cassette.close()
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(data[:-40])
+
+    cassette = Cassette(path)
+    assert len(cassette) == 1
+    assert cassette.lookup("GET", "https://api-web.nhle.com/v1/a") is not None
+
+
+def test_standin_replays_with_templates_and_throttling(tmp_path):
+    cassette = Cassette(str(tmp_path / "tape.jsonl.gz"), mode="replay")
+    cassette.add(
+        "GET",
+        "https://api-web.nhle.com/v1/standings/now",
+        200,
+        {"content-type": "application/json"},
+        b'{"standings": []}',
+    )
+    template = tmp_path / "pbp.json"
+    template.write_text(json.dumps({"id": 2024030413, "gameState": "OFF", "plays": []}))
+
+    server = StandInServer(cassette, templates=load_templates([str(template)]), throttle=0.5, retry_after=0, seed=1)
+    with server:
+        limiter = RateLimiter()
+        with NHLClient(base_url=server.url, rate_limiter=limiter, max_retries=20) as client:
+            assert client.standings.league_standings(date="now") == {"standings": []}
+            assert client.game_center.play_by_play("2023020001")["id"] == 2023020001
+
+    assert server.stats["templated"] == 1
+    assert server.stats["throttled"] > 0
+    assert server.stats["requests"] == 2 + server.stats["throttled"]
+
+
+def test_standin_requests_use_the_nhl_hosts_rate_limits(tmp_path):
+    cassette = Cassette(str(tmp_path / "tape.jsonl.gz"), mode="replay")
+    cassette.add(
+        "GET",
+        "https://api-web.nhle.com/v1/standings/now",
+        200,
+        {"content-type": "application/json"},
+        b'{"standings": []}',
+    )
+    cassette.add("GET", "https://api.nhle.com/stats/rest/en/config", 200, {"content-type": "application/json"}, b"{}")
+
+    with StandInServer(cassette) as server:
+        limiter = RateLimiter()
+        with NHLClient(base_url=server.url, rate_limiter=limiter) as client:
+            client.standings.league_standings(date="now")
+            client.misc.config()
+
+    # each request is paced by its NHL host's budget, not one shared bucket for the stand-in's address
+    assert set(limiter._buckets) == {"api-web.nhle.com", "api.nhle.com"}
+    assert limiter.bucket("https://api-web.nhle.com/")._budget is DEFAULT_BUDGETS["api-web.nhle.com"]
@@ -0,0 +1,82 @@
+import json
+from unittest import mock
+
+import httpx
+import pytest
+
+from myNHLapi.nhlpy import decode, http_client
+from myNHLapi.nhlpy.nhl_client import NHLClient
+
+PLAY_BY_PLAY = {
+    "id": 2023020280,
+    "gameState": "OFF",
+    "venue": {"default": "Nationwide Arena"},
+    "plays": [
+        {"typeCode": 520, "typeDescKey": "period-start"},
+        {"typeCode": 502, "details": {"winningPlayerId": 1, "losingPlayerId": 2, "xCoord": 0, "zoneCode": "N"}},
+        {"typeCode": 509, "details": {"committedByPlayerId": 2, "descKey": "fighting", "duration": 5}},
+    ],
+    "rosterSpots": [{"teamId": 29, "playerId": 1, "positionCode": "C", "headshot": "https://assets.nhle.com/1.png"}],
+}
+
+BOXSCORE = {
+    "id": 2023020280,
+    "gameState": "OFF",
+    "playerByGameStats": {
+        "homeTeam": {
+            "forwards": [{"playerId": 1, "position": "C", "hits": 3, "faceoffWinningPctg": 0, "toi": "14:10"}],
+            "defense": [],
+            "goalies": [{"playerId": 30, "position": "G", "saves": 30}],
+        },
+        "awayTeam": {"forwards": [], "defense": [{"playerId": 2, "position": "D", "blockedShots": 4}], "goalies": []},
+    },
+}
+
+
+@pytest.fixture(params=["typed", "fallback"])
+def decoder(request, monkeypatch):
+    if request.param == "typed":
+        pytest.importorskip("msgspec")
+    else:
+        monkeypatch.setattr(decode, "msgspec", None)
+    return request.param
+
+
+def test_decode_play_by_play(decoder):
+    pbp = decode.decode_play_by_play(json.dumps(PLAY_BY_PLAY).encode())
+
+    assert pbp.id == 2023020280
+    assert pbp.gameState == "OFF"
+    assert [play.typeCode for play in pbp.plays] == [520, 502, 509]
+    assert pbp.plays[0].details is None
+    assert pbp.plays[1].details.winningPlayerId == 1
+    assert pbp.plays[1].details.hittingPlayerId is None
+    assert pbp.plays[2].details.descKey == "fighting"
+    assert [(spot.playerId, spot.teamId, spot.positionCode) for spot in pbp.rosterSpots] == [(1, 29, "C")]
+
+
+def test_decode_boxscore(decoder):
+    boxscore = decode.decode_boxscore(json.dumps(BOXSCORE).encode())
+
+    home = boxscore.playerByGameStats.homeTeam
+    away = boxscore.playerByGameStats.awayTeam
+    assert [(p.playerId, p.position, p.hits) for p in home.forwards] == [(1, "C", 3)]
+    assert home.forwards[0].faceoffWinningPctg == 0
+    assert [(p.playerId, p.blockedShots) for p in away.defense] == [(2, 4)]
+
+
+def test_loads_matches_json():
+    body = json.dumps(PLAY_BY_PLAY).encode()
+    assert decode.loads(body) == json.loads(body)
+
+
+@mock.patch("httpx.Client.get")
+def test_fast_json_client_decodes_with_loads(h_m):
+    h_m.return_value = httpx.Response(200, json={"plays": []}, request=httpx.Request("GET", "https://api-web.nhle.com"))
+
+    with NHLClient(fast_json=True) as client, mock.patch.object(http_client, "loads", wraps=decode.loads) as loads:
+        assert client.game_center.play_by_play("2023020280") == {"plays": []}
+        assert client.misc.config() == {"plays": []}
+    assert loads.call_count == 2
+    # the response is decoded, not changed into another class
+    assert type(h_m.return_value) is httpx.Response
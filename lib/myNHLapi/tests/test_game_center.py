@@ -15,6 +15,13 @@ def test_play_by_play(h_m, nhl_client):
     assert h_m.call_args[1]["url"] == "https://api-web.nhle.com/v1/gamecenter/2020020001/play-by-play"
 
 
+@mock.patch("httpx.Client.get")
+def test_play_by_play_raw(h_m, nhl_client):
+    h_m.return_value.content = b'{"plays": []}'
+    assert nhl_client.game_center.play_by_play(game_id="2020020001", raw=True) == b'{"plays": []}'
+    h_m.return_value.json.assert_not_called()
+
+
 @mock.patch("httpx.Client.get")
 def test_match_up(h_m, nhl_client):
     nhl_client.game_center.match_up(game_id="2020020001")
@@ -66,6 +73,13 @@ def test_shift_chart_data_empty_excludes(h_m, nhl_client):
     )
 
 
+@mock.patch("httpx.Client.get")
+def test_shift_chart_data_raw(h_m, nhl_client):
+    h_m.return_value.content = b'{"data": []}'
+    assert nhl_client.game_center.shift_chart_data(game_id="2020020001", raw=True) == b'{"data": []}'
+    h_m.return_value.json.assert_not_called()
+
+
 @mock.patch("httpx.Client.get")
 def test_season_series_matchup(h_m, nhl_client):
     nhl_client.game_center.season_series_matchup(game_id="2020020001")
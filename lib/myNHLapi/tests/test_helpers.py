@@ -0,0 +1,57 @@
+import asyncio
+from unittest import mock
+
+import httpx
+
+from myNHLapi.nhlpy.nhl_client import AsyncNHLClient
+
+TEAMS = [{"abbr": "BUF"}, {"abbr": "TOR"}, {"abbr": ""}]
+
+SCHEDULES = {
+    "BUF": {
+        "games": [
+            {"id": 2023020002, "gameDate": "2023-10-12", "gameType": 2, "gameState": "OFF"},
+            {"id": 2023010001, "gameDate": "2023-09-24", "gameType": 1, "gameState": "OFF"},
+        ]
+    },
+    "TOR": {
+        "games": [
+            {"id": 2023020002, "gameDate": "2023-10-12", "gameType": 2, "gameState": "OFF"},
+            {"id": 2023020050, "gameDate": "2023-10-20", "gameType": 2, "gameState": "FUT"},
+        ]
+    },
+}
+
+
+def _schedule_response(url, **kwargs):
+    team = url.split("/")[-2]
+    return httpx.Response(200, json=SCHEDULES[team], request=httpx.Request("GET", url))
+
+
+@mock.patch("httpx.Client.get", side_effect=_schedule_response)
+def test_season_games_dedupes_and_sorts_by_date(h_m, nhl_client):
+    games = nhl_client.helpers.season_games("20232024", teams=TEAMS)
+
+    assert [game["id"] for game in games] == [2023010001, 2023020002, 2023020050]
+    assert games[1] == {"id": 2023020002, "gameDate": "2023-10-12", "gameType": 2, "gameState": "OFF"}
+    assert sorted(call[1]["url"].split("/")[-2] for call in h_m.call_args_list) == ["BUF", "TOR"]
+
+
+@mock.patch("httpx.Client.get", side_effect=_schedule_response)
+def test_game_ids_by_season_filters_type_and_state(h_m, nhl_client):
+    game_ids = nhl_client.helpers.game_ids_by_season("20232024", game_types=[2], game_states=["OFF"], teams=TEAMS)
+    assert game_ids == [2023020002]
+
+
+@mock.patch("httpx.AsyncClient.get")
+def test_async_game_ids_by_season(h_m):
+    async def get(url, **kwargs):
+        return _schedule_response(url)
+
+    h_m.side_effect = get
+
+    async def run():
+        async with AsyncNHLClient() as client:
+            return await client.helpers.game_ids_by_season("20232024", game_types=[2], teams=TEAMS)
+
+    assert asyncio.run(run()) == [2023020002, 2023020050]
@@ -0,0 +1,79 @@
+import asyncio
+import json
+from unittest import mock
+
+import pytest
+
+from myNHLapi.nhlpy.cache import SQLiteResponseCache
+from myNHLapi.nhlpy.cassette import Cassette
+from myNHLapi.nhlpy.json_stream import iter_items
+from myNHLapi.nhlpy.nhl_client import AsyncNHLClient, NHLClient
+from myNHLapi.nhlpy.standin import StandInServer, load_templates
+
+DOCUMENT = {
+    "id": 2023020280,
+    "gameState": "OFF",
+    "venue": {"default": 'Nationwide Arena: "home"'},
+    "plays": [{"typeCode": 502, "details": {"winningPlayerId": n, "xCoord": -69.5}} for n in range(50)],
+    "rosterSpots": [{"playerId": 1, "positionCode": "C"}],
+    "regPeriods": 3,
+}
+
+
+def _chunks(body: bytes, size: int):
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 64, 10**6])
+def test_iter_items_matches_json_for_any_chunking(size):
+    body = json.dumps(DOCUMENT, indent=1).encode()
+    items = list(iter_items(_chunks(body, size), expand=("plays",)))
+
+    assert [value for key, value in items if key == "plays"] == DOCUMENT["plays"]
+    assert {key: value for key, value in items if key != "plays"} == {k: v for k, v in DOCUMENT.items() if k != "plays"}
+    assert [key for key, _ in items][:4] == ["id", "gameState", "venue", "plays"]
+
+
+def test_iter_items_waits_for_trailing_digits():
+    assert list(iter_items([b'{"a": 12', b'3, "b": []}'])) == [("a", 123), ("b", [])]
+
+
+@pytest.mark.parametrize("body", [b'{"a": 1', b'{"a" 1}', b"[1]", b'{"a": 1} x', b'{"plays": [{"a": }]}'])
+def test_iter_items_rejects_malformed_documents(body):
+    with pytest.raises(ValueError):
+        list(iter_items(_chunks(body, 2), expand=("plays",)))
+
+
+@pytest.fixture
+def server(tmp_path):
+    template = tmp_path / "pbp.json"
+    template.write_text(json.dumps(DOCUMENT))
+    cassette = Cassette(str(tmp_path / "tape.jsonl.gz"), mode="replay")
+    with StandInServer(cassette, templates=load_templates([str(template)]), bandwidth=10**6) as server:
+        yield server
+
+
+def test_play_by_play_stream_keeps_no_body_for_the_cache(server, tmp_path):
+    cache = SQLiteResponseCache(str(tmp_path / "cache.sqlite3"))
+    with NHLClient(base_url=server.url, cache=cache) as client:
+        with mock.patch.object(cache, "set", wraps=cache.set) as cache_set, mock.patch("json.loads") as json_loads:
+            items = list(client.game_center.play_by_play("2023020281", stream=True))
+            again = list(client.game_center.play_by_play("2023020281", stream=True))
+    cache.close()
+
+    assert items[0] == ("id", 2023020281)
+    assert len([value for key, value in items if key == "plays"]) == 50
+    assert again == items
+    # the body is neither joined for the cache nor parsed a second time for its TTL
+    cache_set.assert_not_called()
+    json_loads.assert_not_called()
+    assert server.stats["requests"] == 2
+
+
+def test_async_play_by_play_stream(server):
+    async def run():
+        async with AsyncNHLClient(base_url=server.url) as client:
+            return [item async for item in await client.game_center.play_by_play("2023020281", stream=True)]
+
+    items = asyncio.run(run())
+    assert [key for key, _ in items].count("plays") == 50
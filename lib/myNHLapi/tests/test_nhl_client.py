@@ -17,9 +17,10 @@ from myNHLapi.nhlpy.http_client import (
 class MockResponse:
     """Mock httpx.Response for testing"""
 
-    def __init__(self, status_code, json_data=None):
+    def __init__(self, status_code, json_data=None, headers=None):
         self.status_code = status_code
         self._json_data = json_data or {}
+        self.headers = headers or {}
         self.url = "https://api.nhle.com/test"
 
     def json(self):
@@ -40,6 +41,13 @@ def mock_config():
     config.follow_redirects = True
     config.api_web_base_url = "https://api.nhl.com"
     config.api_web_api_ver = "/v1"
+    config.cache = None
+    config.rate_limiter = None
+    config.max_retries = 0
+    config.single_flight = True
+    config.cassette = None
+    config.base_url = None
+    config.fast_json = False
     return config
 
 
@@ -84,7 +92,7 @@ def test_http_client_error_handling(http_client, status_code, expected_exception
     mock_response = MockResponse(status_code=status_code, json_data={"message": "Test error message"})
 
     with patch("httpx.Client") as mock_client:
-        mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+        mock_client.return_value.get.return_value = mock_response
 
         with pytest.raises(expected_exception) as exc_info:
             http_client.get(endpoint=Endpoint.API_CORE, resource="/test")
@@ -98,7 +106,7 @@ def test_http_client_success_response(http_client):
     mock_response = MockResponse(status_code=200, json_data={"data": "test"})
 
     with patch("httpx.Client") as mock_client:
-        mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+        mock_client.return_value.get.return_value = mock_response
         response = http_client.get(endpoint=Endpoint.API_CORE, resource="/test")
         assert response.status_code == 200
 
@@ -109,7 +117,7 @@ def test_http_client_non_json_error_response(http_client):
     mock_response.json = Mock(side_effect=ValueError)  # Simulate JSON decode error
 
     with patch("httpx.Client") as mock_client:
-        mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+        mock_client.return_value.get.return_value = mock_response
 
         with pytest.raises(ServerErrorException) as exc_info:
             http_client.get(endpoint=Endpoint.API_CORE, resource="test")
@@ -124,7 +132,7 @@ def test_http_client_get_by_url_with_params(http_client):
     query_params = {"season": "20232024"}
 
     with patch("httpx.Client") as mock_client:
-        mock_instance = mock_client.return_value.__enter__.return_value
+        mock_instance = mock_client.return_value
         mock_instance.get.return_value = mock_response
 
         response = http_client.get(endpoint=Endpoint.API_CORE, resource="test", query_params=query_params)
@@ -139,9 +147,76 @@ def test_http_client_custom_error_message(http_client):
     mock_response = MockResponse(status_code=400, json_data={"message": custom_message})
 
     with patch("httpx.Client") as mock_client:
-        mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+        mock_client.return_value.get.return_value = mock_response
 
         with pytest.raises(BadRequestException) as exc_info:
             http_client.get(endpoint=Endpoint.API_CORE, resource="/test")
 
         assert custom_message in str(exc_info.value)
+
+
+def test_http_client_reuses_pooled_client(http_client):
+    """Test the underlying httpx.Client is created once and shared across requests"""
+    mock_response = MockResponse(status_code=200, json_data={"data": "test"})
+
+    with patch("httpx.Client") as mock_client:
+        mock_client.return_value.get.return_value = mock_response
+
+        http_client.get(endpoint=Endpoint.API_CORE, resource="test")
+        http_client.get(endpoint=Endpoint.API_CORE, resource="test2")
+
+        mock_client.assert_called_once()
+        assert mock_client.return_value.get.call_count == 2
+
+
+def test_http_client_close_reopens_pool(http_client):
+    """Test close() releases the pool and a later request opens a new one"""
+    mock_response = MockResponse(status_code=200, json_data={"data": "test"})
+
+    with patch("httpx.Client") as mock_client:
+        mock_client.return_value.get.return_value = mock_response
+
+        http_client.get(endpoint=Endpoint.API_CORE, resource="test")
+        http_client.close()
+        mock_client.return_value.close.assert_called_once()
+
+        http_client.get(endpoint=Endpoint.API_CORE, resource="test")
+        assert mock_client.call_count == 2
+
+
+def test_nhl_client_context_manager_closes_pool():
+    with patch("httpx.Client") as mock_client:
+        mock_client.return_value.get.return_value = MockResponse(status_code=200)
+
+        with NHLClient(max_connections=8, http2=False) as c:
+            c.game_center.boxscore(game_id="2020020001")
+
+        limits = mock_client.call_args[1]["limits"]
+        assert limits.max_connections == 8
+        mock_client.return_value.close.assert_called_once()
+
+
+def test_http_client_retries_429_honoring_retry_after(http_client, mock_config):
+    """Test a throttled request is retried after Retry-After instead of raising"""
+    mock_config.max_retries = 2
+    throttled = MockResponse(status_code=429, headers={"Retry-After": "2"})
+    ok = MockResponse(status_code=200, json_data={"data": "test"})
+
+    with patch("httpx.Client") as mock_client, patch("time.sleep") as sleep_m:
+        mock_client.return_value.get.side_effect = [throttled, ok]
+        response = http_client.get(endpoint=Endpoint.API_CORE, resource="test")
+
+    assert response.status_code == 200
+    sleep_m.assert_called_once_with(2.0)
+
+
+def test_http_client_raises_after_max_retries(http_client, mock_config):
+    """Test persistent 503s are retried max_retries times and then raised"""
+    mock_config.max_retries = 2
+
+    with patch("httpx.Client") as mock_client, patch("time.sleep"):
+        mock_client.return_value.get.return_value = MockResponse(status_code=503)
+        with pytest.raises(ServerErrorException):
+            http_client.get(endpoint=Endpoint.API_CORE, resource="test")
+
+    assert mock_client.return_value.get.call_count == 3
@@ -0,0 +1,52 @@
+from unittest import mock
+
+from myNHLapi.nhlpy.rate_limit import HostBudget, RateLimiter, TokenBucket, backoff_delay, parse_retry_after
+
+
+def test_bucket_allows_burst_then_spaces_requests():
+    bucket = TokenBucket(HostBudget(rate=10, burst=2, max_rate=10))
+    with mock.patch("time.monotonic", return_value=100.0):
+        bucket._updated = 100.0
+        assert bucket._reserve() == 0
+        assert bucket._reserve() == 0
+        assert bucket._reserve() == 0.1
+        assert bucket._reserve() == 0.2
+
+
+def test_bucket_adapts_rate():
+    bucket = TokenBucket(HostBudget(rate=10, burst=2, max_rate=10.2, min_rate=4), increase=0.1)
+    bucket.on_success()
+    bucket.on_success()
+    bucket.on_success()
+    assert bucket.rate == 10.2
+
+    bucket.on_throttle()
+    assert bucket.rate == 5.1
+    bucket.on_throttle()
+    assert bucket.rate == 4
+
+
+def test_bucket_blocks_until_retry_after():
+    bucket = TokenBucket(HostBudget(rate=10, burst=5, max_rate=10))
+    with mock.patch("time.monotonic", return_value=50.0):
+        bucket._updated = 50.0
+        bucket.on_throttle(retry_after=3)
+        assert bucket._reserve() == 3
+
+
+def test_limiter_keeps_a_bucket_per_host():
+    limiter = RateLimiter()
+    web = limiter.bucket("https://api-web.nhle.com/v1/gamecenter/1/boxscore")
+    stats = limiter.bucket("https://api.nhle.com/stats/rest/en/skater/summary")
+
+    assert web is limiter.bucket("https://api-web.nhle.com/v1/score/now")
+    assert web is not stats
+    assert web.rate == 10 and stats.rate == 5
+
+
+def test_backoff_and_retry_after():
+    assert backoff_delay(3, retry_after=7) == 7
+    assert 0 <= backoff_delay(3, base=0.5) <= 4
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from unittest.mock import MagicMock
+
+import pytest
+
+from myNHLapi.nhlpy import AsyncNHLClient, NHLClient
+from myNHLapi.nhlpy.single_flight import SingleFlight
+
+
+def test_concurrent_identical_calls_share_one_execution():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(1)
+        return "boxscore"
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        leader = pool.submit(flight.do, "game-1", fetch)
+        started.wait(1)
+        followers = [pool.submit(flight.do, "game-1", fetch) for _ in range(4)]
+        time.sleep(0.05)
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert results == ["boxscore"] * 5
+    assert len(calls) == 1
+    assert flight.stats() == {"executed": 1, "saved": 4}
+
+
+def test_errors_are_shared_and_not_remembered():
+    flight = SingleFlight()
+
+    with pytest.raises(ValueError):
+        flight.do("key", mock.Mock(side_effect=ValueError))
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.executed == 2
+
+
+def test_client_coalesces_duplicate_requests():
+    release = threading.Event()
+
+    def slow_get(*args, **kwargs):
+        release.wait(1)
+        return MagicMock()
+
+    client = NHLClient()
+    with mock.patch("httpx.Client.get", side_effect=slow_get) as h_m:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(client.game_center.boxscore, "2023020001") for _ in range(8)]
+            time.sleep(0.05)
+            release.set()
+            [f.result() for f in futures]
+
+    h_m.assert_called_once()
+    assert client.single_flight.saved == 7
+
+
+def test_async_client_coalesces_duplicate_requests():
+    async def slow_get(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return MagicMock()
+
+    async def run(client):
+        return await asyncio.gather(*(client.game_center.play_by_play("2023020001") for _ in range(10)))
+
+    client = AsyncNHLClient()
+    with mock.patch("httpx.AsyncClient.get", side_effect=slow_get) as h_m:
+        asyncio.run(run(client))
+
+    h_m.assert_called_once()
+    assert client.single_flight.saved == 9
+
+
+def test_async_cancelled_leader_does_not_cancel_followers():
+    flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return "boxscore"
+
+    async def run():
+        leader = asyncio.ensure_future(flight.do_async("game-1", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do_async("game-1", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(run()) == "boxscore"
+    assert flight.stats() == {"executed": 1, "saved": 1}
+    assert not flight._async_calls
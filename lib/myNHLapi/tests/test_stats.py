@@ -1,3 +1,4 @@
+import json
 from unittest import mock
 
 
@@ -116,3 +117,84 @@ def test_player_game_log_playoffs(h_m, nhl_client):
     nhl_client.stats.player_game_log(player_id="8481528", season_id="20232024", game_type=3)
     h_m.assert_called_once()
     assert h_m.call_args[1]["url"] == "https://api-web.nhle.com/v1/player/8481528/game-log/20232024/3"
+
+
+def _report_page(rows, total):
+    response = mock.MagicMock()
+    response.json.return_value = {"data": rows, "total": total}
+    return response
+
+
+@mock.patch("httpx.Client.get")
+def test_bulk_player_stats_pages_and_joins(h_m, nhl_client):
+    summary = [{"playerId": pid, "seasonId": 20232024, "points": pid} for pid in (1, 2, 3)]
+    realtime = [{"playerId": pid, "seasonId": 20232024, "hits": pid, "blockedShots": pid} for pid in (3, 2, 1)]
+    h_m.side_effect = [
+        _report_page(summary[:2], 3),
+        _report_page(summary[2:], 3),
+        _report_page(realtime[:2], 3),
+        _report_page(realtime[2:], 3),
+    ]
+
+    result = nhl_client.stats.bulk_player_stats(start="20232024", end="20232024", page_size=2)
+
+    assert h_m.call_count == 4
+    assert [c[1]["params"]["start"] for c in h_m.call_args_list] == [0, 2, 0, 2]
+    assert h_m.call_args_list[2][1]["url"] == "https://api.nhle.com/stats/rest/en/skater/realtime"
+    assert result["2"] == [{"playerId": 2, "seasonId": 20232024, "points": 2, "hits": 2, "blockedShots": 2}]
+    assert sorted(result) == ["1", "2", "3"]
+
+
+@mock.patch("httpx.Client.get")
+def test_iter_skater_stats_summary_is_lazy(h_m, nhl_client):
+    h_m.side_effect = [_report_page([{"playerId": 1}, {"playerId": 2}], 3), _report_page([{"playerId": 3}], 3)]
+
+    rows = nhl_client.stats.iter_skater_stats_summary(start_season="20232024", end_season="20232024", page_size=2)
+    assert h_m.call_count == 0
+    assert next(rows)["playerId"] == 1
+    assert h_m.call_count == 1
+    assert [row["playerId"] for row in rows] == [2, 3]
+    assert h_m.call_count == 2
+    assert [c[1]["params"]["start"] for c in h_m.call_args_list] == [0, 2]
+    assert h_m.call_args[1]["params"]["limit"] == 2
+
+
+@mock.patch("httpx.Client.get")
+def test_iter_skater_stats_realtime_prefetches_next_page(h_m, nhl_client):
+    h_m.side_effect = [_report_page([{"playerId": 1}], 2), _report_page([{"playerId": 2}], 2)]
+
+    rows = nhl_client.stats.iter_skater_stats_realtime(
+        start_season="20232024", end_season="20232024", page_size=1, prefetch=True
+    )
+
+    assert [row["playerId"] for row in rows] == [1, 2]
+    assert h_m.call_count == 2
+    assert h_m.call_args[1]["url"] == "https://api.nhle.com/stats/rest/en/skater/realtime"
+
+
+@mock.patch("httpx.Client.get")
+def test_iter_pages_have_a_total_order(h_m, nhl_client):
+    h_m.side_effect = [_report_page([{"playerId": 1}], 1)]
+
+    list(nhl_client.stats.iter_skater_stats_summary(start_season="20232024", end_season="20232024"))
+    assert json.loads(h_m.call_args[1]["params"]["sort"]) == [
+        {"property": "playerId", "direction": "ASC"},
+        {"property": "seasonId", "direction": "ASC"},
+    ]
+
+    h_m.side_effect = [_report_page([{"playerId": 1}], 1)]
+    points = [{"property": "points", "direction": "DESC"}]
+    list(
+        nhl_client.stats.iter_skater_stats_summary(
+            start_season="20232024", end_season="20242025", aggregate=True, sort_expr=points
+        )
+    )
+    assert json.loads(h_m.call_args[1]["params"]["sort"]) == points + [{"property": "playerId", "direction": "ASC"}]
+
+
+@mock.patch("httpx.Client.get")
+def test_iter_stops_on_empty_page(h_m, nhl_client):
+    h_m.side_effect = [_report_page([], 10)]
+
+    assert list(nhl_client.stats.iter_goalie_stats_summary(start_season="20232024")) == []
+    h_m.assert_called_once()
@@ -0,0 +1,80 @@
+"""
+meta_store.py
+draft-day player metadata (picked flag and note) kept in SQLite. changes are
+buffered per player and written together in one transaction shortly after the
+first change, so bursts of clicks cost one small commit instead of rewriting
+the whole file, and a crash never leaves a half-written store behind
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+
+
+class MetaStore:
+    """Row-per-player store for {'picked': bool, 'note': str}, with debounced, atomic writes."""
+
+    def __init__(self, path="data/player_meta.sqlite3", legacy_json="data/json/player_meta.json", debounce=0.5):
+        """
+        :param path: SQLite file, created on first use.
+        :param legacy_json: old player_meta.json, imported once when the store is new.
+        :param debounce: seconds to collect changes before they are committed together.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.debounce = debounce
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._timer = None
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (player_id TEXT PRIMARY KEY, picked INTEGER, note TEXT)")
+            empty = self._conn.execute("SELECT COUNT(*) FROM meta").fetchone()[0] == 0
+        if empty and legacy_json and os.path.exists(legacy_json):
+            with open(legacy_json, "r") as f:
+                for player, meta in json.load(f).items():
+                    self._pending[player] = meta
+            self.flush()
+        atexit.register(self.close)
+
+    def load(self, players):
+        """{player: {'picked', 'note'}} for every player, with defaults for players never changed."""
+        meta = {player: {'picked': False, 'note': ''} for player in players}
+        with self._lock:
+            rows = self._conn.execute("SELECT player_id, picked, note FROM meta").fetchall()
+        for player, picked, note in rows:
+            meta[player] = {'picked': bool(picked), 'note': note}
+        return meta
+
+    def mark(self, player, meta):
+        """Queue a player's current meta.  It is committed within the debounce window, or on flush()."""
+        with self._lock:
+            self._pending[player] = {'picked': bool(meta['picked']), 'note': meta['note']}
+            if self._timer is None:
+                self._timer = threading.Timer(self.debounce, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """Commit every queued change in one transaction."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+            rows = [(player, int(meta['picked']), meta['note']) for player, meta in self._pending.items()]
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO meta (player_id, picked, note) VALUES (?, ?, ?) "
+                    "ON CONFLICT(player_id) DO UPDATE SET picked = excluded.picked, note = excluded.note",
+                    rows,
+                )
+            self._pending = {}
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._conn.close()
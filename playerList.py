@@ -1,5 +1,10 @@
 # get list of all players who played at least 30 games in one of the last 3 seasons
-from nhlpy import NHLClient
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "lib"))
+from myNHLapi.nhlpy import NHLClient
+from myNHLapi.nhlpy.cassette import cassette_from_env
 
 def main():
     seasons= ['20242025', '20232024']
@@ -20,21 +25,21 @@ def get_roster_player_ids(season):
     Returns a dict mapping playerId -> playerName for all players rostered
     in those seasons across all teams.
     """
-    client = NHLClient()
+    client = NHLClient(cassette=cassette_from_env(), base_url=os.environ.get("NHL_API_BASE_URL"))
     teams = client.teams.teams()
     team_ids = [team['franchise_id'] for team in teams]
     players = []
     for id in team_ids:
-        skater_stats = client.stats.skater_stats_summary(
+        skater_stats = client.stats.iter_skater_stats_summary(
                             start_season=season, 
                             end_season=season,
                             franchise_id=id,
-                            limit=1000,
-                            fact_cayenne_exp="gamesPlayed>=30"
+                            fact_cayenne_exp="gamesPlayed>=30",
+                            prefetch=True
                         )
-        players += skater_stats
+        players += [p['playerId'] for p in skater_stats]
 
-    return list(set([p['playerId'] for p in players]))
+    return list(set(players))
 
 
 if __name__ == "__main__":
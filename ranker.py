@@ -4,113 +4,123 @@ Command line script for ranking hockey players.
 """
 
 import argparse
+import csv
 import json
+import sys
 
-seasons = ['20222023', '20232024', '20242025']
-
-stats_weights = {
-    'points': 0.2,
-    'plusMinus': 0.4,
-    'shg': 0.4,
-    'faceoff': 0.2,
-    'blocks': 0.7,
-    'hits': 0.8,
-    'pim': 0.6,
-    'gp': 0.5,
-    'fights': 0.8 
-}
-
-year_weights = {
-    '20222023': 0.3,
-    '20232024': 0.6,
-    '20242025': 0.8
-}
+import numpy as np
+
+from DataManager import DataManager
+
+FIELDS = ['rank', 'playerId', 'name', 'team', 'position', 'rating']
 
 def get_args():
-	parser = argparse.ArgumentParser(description="Rank hockey players based on stats.")
-	parser.add_argument('--player', type=str, required=False, help='player to look for')
-	
-	return parser.parse_args()
-
-def load_file(season):
-	with open(f'data/json/{season}_full.json', 'r') as f:
-		return json.load(f)
-	
-def load_player_list(filename):
-    """Load player IDs from a txt file into a list."""
-    with open(filename, 'r') as f:
-        return [line.strip() for line in f if line.strip()]
-
-
-def get_ratings(): 
-    players = []
-    stats = {}
-    player_list = load_player_list('player_list.txt')
-
-    for season in seasons:
-        season_data = load_file(season)
-        stats[season] = season_data
-
-    for player_id in player_list:
-        player = get_rating(player_id)
-        players.append(player)
-        
-    return players
-
-def get_rating(player_id):
-    rating = 0
-    for season in seasons:
-        season_rating = 0
-        if player_id not in stats[season]:
-            continue
-    
-        season_rating += (stats[season][player_id]['points_ratio'] * stats_weights['points'])
-        season_rating += (stats[season][player_id]['plusMinus_ratio'] * stats_weights['plusMinus'])
-        season_rating += (stats[season][player_id]['shg_ratio'] * stats_weights['shg'])
-        season_rating += (stats[season][player_id]['faceoff_ratio'] * stats_weights['faceoff'])
-        season_rating += (stats[season][player_id]['blocks_ratio'] * stats_weights['blocks'])
-        season_rating += (stats[season][player_id]['hits_ratio'] * stats_weights['hits'])
-        season_rating += (stats[season][player_id]['pim_ratio'] * stats_weights['pim'])
-        season_rating += (stats[season][player_id]['fights_ratio'] * stats_weights['fights'])
-        season_rating += ((stats[season][player_id]['gp'] / 82) * stats_weights['gp'])
-        rating += (season_rating * year_weights[season])
-
-    player = {
-            'playerId': player_id,
-            'rating': rating
-    }
-     
-
-def display_rankings(ratings, top_n=100):
-    extra_data = load_file('20242025')
-
-    sorted_players = sorted(ratings, key=lambda x: x['rating'], reverse=True)
-    print(f"Top {top_n} Players:")
-    for rank, player in enumerate(sorted_players[:top_n], start=1):
-        player_name = extra_data.get(player['playerId'], {}).get('skaterFullName', 'Unknown')
-        print(f"{rank:>3}. ID: {player['playerId']}, Name: {player_name}, Score: {player['rating']:.4f}")
-
-def display_player(search_player, ratings):
-    player_data = load_file('20242025')
-    average_score = sum([i['rating'] for i in ratings]) / len(ratings) if ratings else 0
-
-    for player in ratings:
-        id = str(player['playerId'])
-        if id not in player_data:
-            continue
-
-        if search_player.lower() in player_data[id]['skaterFullName'].lower():
-            print(f"Player ID: {id}, Name: {player_data[id]['skaterFullName']}, Score: {player['rating']:.4f}, Above Average: {player['rating']-average_score:.2f}")
+    parser = argparse.ArgumentParser(description="Rank hockey players based on stats.")
+    parser.add_argument('--player', type=str, required=False, help='player to look for')
+    parser.add_argument('--top', type=int, default=100, help='number of players to list, 0 for all')
+    parser.add_argument('--position', choices=['F', 'D'], help='only forwards or defensemen')
+    parser.add_argument('--team', type=str, help='only players on this team, e.g. TOR')
+    parser.add_argument('--format', choices=['text', 'csv', 'json', 'parquet'], default='text')
+    parser.add_argument('--output', type=str, help='file to write to, defaults to stdout (required for parquet)')
+
+    return parser.parse_args()
+
+def get_mask(dm, position=None, team=None):
+    """Boolean mask over dm.players for the --position/--team filters."""
+    mask = np.ones(len(dm.players), dtype=bool)
+    if position:
+        mask &= dm.column(dm.bios, 'position', default='') == position
+    if team:
+        mask &= dm.player_teams == team.upper()
+    return mask
+
+def top_n(ratings, mask, n):
+    """Indices of the n best rated players inside mask, best first."""
+    candidates = np.flatnonzero(mask)
+    if n and n < len(candidates):
+        # only the top n need a full sort
+        candidates = candidates[np.argpartition(-ratings[candidates], n - 1)[:n]]
+    return candidates[np.argsort(-ratings[candidates], kind='stable')]
+
+def get_rankings(dm, top=100, position=None, team=None):
+    ratings = dm.compute_ratings()
+    rows = []
+    for rank, i in enumerate(top_n(ratings, get_mask(dm, position, team), top), start=1):
+        player = dm.players[i]
+        bio = dm.bios[player]
+        rows.append({
+            'rank': rank,
+            'playerId': player,
+            'name': bio['name'],
+            'team': bio['team'],
+            'position': bio['position'],
+            'rating': float(ratings[i])
+        })
+    return rows
+
+def display_rankings(rows):
+    print(f"Top {len(rows)} Players:")
+    for row in rows:
+        print(f"{row['rank']:>3}. ID: {row['playerId']}, Name: {row['name']}, Score: {row['rating']:.4f}")
+
+def has_parquet_engine():
+    """Whether pandas can write parquet, which takes pyarrow or fastparquet."""
+    for engine in ('pyarrow', 'fastparquet'):
+        try:
+            __import__(engine)
+            return True
+        except ImportError:
+            pass
+    return False
+
+def export_rankings(rows, format, output=None):
+    if format == 'parquet':
+        if not output:
+            sys.exit("--output is required for parquet")
+        if not has_parquet_engine():
+            sys.exit("--format parquet needs pyarrow or fastparquet, pip install pyarrow")
+        import pandas as pd
+        pd.DataFrame(rows, columns=FIELDS).to_parquet(output, index=False)
+        return
+
+    f = open(output, 'w', newline='') if output else sys.stdout
+    try:
+        if format == 'csv':
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            json.dump(rows, f, indent=2)
+            f.write("\n")
+    finally:
+        if output:
+            f.close()
+
+def display_player(dm, search_player):
+    ratings = dm.compute_ratings()
+    average_score = float(ratings.mean()) if len(ratings) else 0
+    ranks = dm.get_ranks()
+
+    for i, (player, name) in enumerate(zip(dm.players, dm.column(dm.bios, 'name', default='').tolist())):
+        if search_player.lower() in name.lower():
+            print(f"Player ID: {player}, Name: {name}, Rank: {ranks[i] + 1}, Score: {ratings[i]:.4f}, Above Average: {ratings[i]-average_score:.2f}")
             return
+    print(f"No player matching '{search_player}'")
+
 def main():
     args = get_args()
-    ratings = get_ratings()
+    dm = DataManager(ratings_only=True)
 
     if args.player:
-        display_player(args.player, ratings)
+        display_player(dm, args.player)
+        return
+
+    rows = get_rankings(dm, top=args.top, position=args.position, team=args.team)
+    if args.format == 'text':
+        display_rankings(rows)
     else:
-        display_rankings(ratings)
-      
+        export_rankings(rows, args.format, args.output)
+
 
 
 
@@ -0,0 +1,213 @@
+"""
+snapshot.py
+columnar snapshot of the per-season data files. every table is a directory of
+.npy columns plus a player-ID index, opened with memory mapping so a reader
+only pages in the columns it actually touches
+"""
+
+import json
+import os
+import shutil
+from collections.abc import Mapping, MutableMapping
+
+import numpy as np
+
+SNAPSHOT_DIR = os.path.join('data', 'snapshot')
+SEASONS = ['20222023', '20232024', '20242025']
+DATASETS = ['main', 'additional', 'ratios', 'full']
+
+
+def table_path(name, season=None):
+    return os.path.join(SNAPSHOT_DIR, f'{season}_{name}' if season else name)
+
+
+def to_column(values):
+    """Pick the narrowest numpy dtype for a column.  Missing numbers become nan, missing strings ''."""
+    present = [v for v in values if v is not None]
+    if present and all(isinstance(v, bool) for v in present) and len(present) == len(values):
+        return np.array(values, dtype=bool)
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present):
+        if all(isinstance(v, int) for v in present) and len(present) == len(values):
+            return np.array(values, dtype=np.int64)
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    return np.array(['' if v is None else str(v) for v in values], dtype=str)
+
+
+def write_table(path, records):
+    """Write {player_id: row} as one .npy file per column.  The table is swapped in whole once it is complete."""
+    ids = list(records)
+    columns = []
+    for row in records.values():
+        for key in row:
+            if key not in columns:
+                columns.append(key)
+
+    tmp_path = path + '.tmp'
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+    np.save(os.path.join(tmp_path, 'ids.npy'), np.array(ids, dtype=str))
+    files = {}
+    for n, column in enumerate(columns):
+        files[column] = f'c{n}.npy'
+        np.save(os.path.join(tmp_path, files[column]), to_column([records[pid].get(column) for pid in ids]))
+    with open(os.path.join(tmp_path, 'columns.json'), 'w') as f:
+        json.dump(files, f, indent=2)
+
+    shutil.rmtree(path, ignore_errors=True)
+    os.rename(tmp_path, path)
+
+
+def source_files(seasons=SEASONS, datasets=DATASETS):
+    """The JSON files a snapshot of these seasons and datasets is built from, as far as they exist."""
+    files = [f'data/json/{season}_{name}.json' for season in seasons for name in datasets]
+    return [filename for filename in files + ['data/json/player_bios.json'] if os.path.exists(filename)]
+
+
+def source_stamp(filename):
+    stat = os.stat(filename)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def load_sources():
+    """{filename: [size, mtime_ns]} of the JSON files the snapshot tables were built from."""
+    try:
+        with open(os.path.join(SNAPSHOT_DIR, 'sources.json'), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def build_snapshot(seasons=SEASONS, datasets=DATASETS):
+    """Convert data/json/<season>_<dataset>.json and player_bios.json into the columnar snapshot.
+
+    The size and mtime of every file converted go into sources.json, so has_snapshot can tell when a table no
+    longer matches its JSON file (after a stragglers run or a git pull, say).
+    """
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    sources = load_sources()
+    for season in seasons:
+        for name in datasets:
+            filename = f'data/json/{season}_{name}.json'
+            if not os.path.exists(filename):
+                continue
+            stamp = source_stamp(filename)
+            with open(filename, 'r') as f:
+                records = json.load(f)
+            if isinstance(records, list):
+                records = {str(row['playerId']): row for row in records}
+            write_table(table_path(name, season), records)
+            sources[filename] = stamp
+
+    filename = 'data/json/player_bios.json'
+    stamp = source_stamp(filename)
+    with open(filename, 'r') as f:
+        write_table(table_path('bios'), json.load(f))
+    sources[filename] = stamp
+
+    tmp_path = os.path.join(SNAPSHOT_DIR, 'sources.json.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(sources, f, indent=2)
+    os.replace(tmp_path, os.path.join(SNAPSHOT_DIR, 'sources.json'))
+
+
+def has_snapshot(seasons=SEASONS):
+    """Whether the snapshot has every table for these seasons, each built from the JSON file as it is now."""
+    if not all(os.path.exists(os.path.join(table_path('full', season), 'columns.json')) for season in seasons):
+        return False
+    sources = load_sources()
+    stale = [filename for filename in source_files(seasons) if sources.get(filename) != source_stamp(filename)]
+    if stale:
+        print(f"Snapshot is older than {len(stale)} of its JSON files ({stale[0]}, ...), reading the JSON files "
+              "instead; python snapshot.py rebuilds it")
+        return False
+    return True
+
+
+class Table(Mapping):
+    """Read-only {player_id: row} view over a snapshot table.
+
+    Only the player-ID index is read up front; each column is memory mapped the first time a row asks for it.
+    """
+
+    def __init__(self, path):
+        self._path = path
+        with open(os.path.join(path, 'columns.json'), 'r') as f:
+            self._files = json.load(f)
+        self._index = {str(pid): i for i, pid in enumerate(np.load(os.path.join(path, 'ids.npy')))}
+        self._columns = {}
+        self._rows = {}
+        self._taken = None
+
+    def take(self, name, ids, default=np.nan):
+        """The column's values for ids, in that order, with default for ids the table does not have."""
+        if self._taken is None or self._taken[0] is not ids:
+            # ids is nearly always the same player list, so its row numbers are looked up once
+            self._taken = (ids, np.array([self._index.get(pid, -1) for pid in ids], dtype=np.int64))
+        rows = self._taken[1]
+        if not self.has_column(name) or not len(self._index):
+            return np.full(len(ids), default)
+        return np.where(rows >= 0, self.column(name)[np.maximum(rows, 0)], default)
+
+    def column(self, name):
+        if name not in self._columns:
+            self._columns[name] = np.load(os.path.join(self._path, self._files[name]), mmap_mode='r')
+        return self._columns[name]
+
+    def has_column(self, name):
+        return name in self._files
+
+    def column_names(self):
+        return list(self._files)
+
+    def __getitem__(self, player_id):
+        row = self._rows.get(player_id)
+        if row is None:
+            row = self._rows[player_id] = Row(self, self._index[player_id])
+        return row
+
+    def __contains__(self, player_id):
+        return player_id in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+
+class Row(MutableMapping):
+    """One player's row.  Values are read from the table's columns, assignments are kept on the row only."""
+
+    def __init__(self, table, i):
+        self._table = table
+        self._i = i
+        self._overrides = {}
+
+    def __getitem__(self, key):
+        if key in self._overrides:
+            return self._overrides[key]
+        if not self._table.has_column(key):
+            raise KeyError(key)
+        return self._table.column(key)[self._i].item()
+
+    def __setitem__(self, key, value):
+        self._overrides[key] = value
+
+    def __delitem__(self, key):
+        del self._overrides[key]
+
+    def __iter__(self):
+        yield from self._table.column_names()
+        yield from (key for key in self._overrides if not self._table.has_column(key))
+
+    def __len__(self):
+        return len(set(self._table.column_names()) | set(self._overrides))
+
+
+def main():
+    build_snapshot()
+    print(f"Snapshot written to {SNAPSHOT_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 """
 stragglers.py
 used for getting last pieces of data through play by play that can't be 
-obtained through the other endpoints, specifically faceoff wins and fights
+obtained through the other endpoints, specifically faceoff wins and fights,
+along with per-player counts of every other event type in the feed
 """
 
 
@@ -9,23 +10,87 @@ import sys
 import os
 import json
 import csv
+import argparse
 import concurrent.futures
+import multiprocessing
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "lib"))
 from myNHLapi.nhlpy import NHLClient
-client = NHLClient()
+from myNHLapi.nhlpy.cache import FINAL_GAME_STATES, SQLiteResponseCache
+from myNHLapi.nhlpy.cassette import cassette_from_env
+from myNHLapi.nhlpy.decode import Record, decode_play_by_play
+from checkpoint import Checkpoint
+from snapshot import build_snapshot
+from game_archive import GameArchive
+from game_index import update_season
+
+cache = SQLiteResponseCache("data/cache/nhl_api.sqlite3")
+client = NHLClient(cache=cache, cassette=cassette_from_env(), base_url=os.environ.get("NHL_API_BASE_URL"),
+                   fast_json=True)
+archive = GameArchive()
 
 FACEOFF = 502
+HIT = 503
+GIVEAWAY = 504
+GOAL = 505
+SHOT_ON_GOAL = 506
+MISSED_SHOT = 507
+BLOCKED_SHOT = 508
 PENALTY = 509
-
-fights = {}
+TAKEAWAY = 525
+
+# typeCode -> (details field naming a player, counter credited to that player).  counters are format strings
+# over the play's penalty type, so penalties are also counted per type, e.g. penalty_fighting
+EVENTS = {
+    FACEOFF: [('winningPlayerId', 'faceoffWins'), ('losingPlayerId', 'faceoffLosses')],
+    HIT: [('hittingPlayerId', 'hits'), ('hitteePlayerId', 'hitsTaken')],
+    GIVEAWAY: [('playerId', 'giveaways')],
+    TAKEAWAY: [('playerId', 'takeaways')],
+    GOAL: [('scoringPlayerId', 'goals'), ('assist1PlayerId', 'assists'), ('assist2PlayerId', 'assists')],
+    SHOT_ON_GOAL: [('shootingPlayerId', 'shotsOnGoal')],
+    MISSED_SHOT: [('shootingPlayerId', 'missedShots')],
+    BLOCKED_SHOT: [('blockingPlayerId', 'blockedShots'), ('shootingPlayerId', 'shotsBlocked')],
+    PENALTY: [('committedByPlayerId', 'penalties'), ('committedByPlayerId', 'penalty_{penaltyType}'),
+              ('drawnByPlayerId', 'penaltiesDrawn')],
+}
+COUNTERS = ['faceoffWins', 'faceoffLosses', 'hits', 'hitsTaken', 'giveaways', 'takeaways', 'goals', 'assists',
+            'shotsOnGoal', 'missedShots', 'blockedShots', 'shotsBlocked', 'penalties', 'penaltiesDrawn']
+# penalty descKeys counted on their own; any other penalty, or one without a descKey, counts as penalty_other so
+# the *_additional files always have the same columns
+PENALTY_TYPES = ['boarding', 'charging', 'cross-checking', 'delaying-game-puck-over-glass', 'elbowing',
+                 'fighting', 'high-sticking', 'holding', 'holding-the-stick', 'hooking', 'interference',
+                 'interference-goalkeeper', 'kneeing', 'misconduct', 'game-misconduct', 'roughing', 'slashing',
+                 'too-many-men-on-the-ice', 'tripping', 'unsportsmanlike-conduct', 'other']
+PENALTY_COUNTERS = ['penalty_' + penalty for penalty in PENALTY_TYPES]
+_PENALTY_TYPES = frozenset(PENALTY_TYPES)
+
+SEASONS = ['20222023', '20232024', '20242025']
+
+FETCH_WORKERS = 8
+IN_FLIGHT = 32
+# start method of the parser processes, see parse_all_games
+START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+EMPTY_STATS = {'games': 0, 'FO_mean': 0.0, 'FO_M2': 0.0}
 
 def main():
-	parse_all_games()
+	parser = argparse.ArgumentParser(description=__doc__)
+	parser.add_argument("--since", action="store_true",
+		help="add the current season's newly finished games and only parse the finished games not counted yet")
+	parser.add_argument("--stream", action="store_true",
+		help="count events on the fetch threads while each game downloads, one play in memory at a time")
+	parser.add_argument("--rebuild", action="store_true",
+		help="recount every game, reading the play-by-play from the local game archive where it has it")
+	args = parser.parse_args()
+	with client:
+		parse_all_games(since=args.since, stream=args.stream, rebuild=args.rebuild)
+	archive.close()
+	# the *_additional.json files just changed, so the app's snapshot would be out of date
+	build_snapshot()
+	print(f"API cache: {cache.stats()}, duplicate requests saved: {client.single_flight.saved}")
 
 
 def get_games():
-    for season in ['20222023','20232024', '20242025']:
+    for season in SEASONS:
         games = get_games_season(season=season)
 
         with open(f"gameIds/{season}.txt", "w") as f:
@@ -33,106 +98,213 @@ def get_games():
                 f.write(str(id) + "\n")
 
 
+def load_game_ids(season):
+    with open(f"gameIds/{season}.txt", "r") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
 def load_player_list():
     """Load player IDs from a txt file into a list."""
     with open('player_list.txt', 'r') as f:
         return [line.strip() for line in f if line.strip()]
 
-def get_teams():
-    client = NHLClient()
-    teams = client.teams.teams()
-    team_ids = [team['abbr'] for team in teams]
-
-    return team_ids
-
-def get_games_season(season="20242025"):
-     teams = get_teams()
-     games = []
-
-     for team in teams:
-        team_games = client.schedule.team_season_schedule(team_abbr=team, season=season)
-        games += [game['id'] for game in team_games['games']]
-
-     return list(set(games))
-
-def parse_game_events(game_id):
-    plays = client.game_center.play_by_play(game_id)['plays']
-    faceoff_wins = {}
-
-    boxscore = client.game_center.boxscore(game_id=game_id)
-    for team in ['homeTeam', 'awayTeam']:
-        for position in ['forwards', 'defense']:
-            try:
-                for player in boxscore['playerByGameStats'][team][position]:
-                    faceoff_wins[player['playerId']] = 0
-            except:
-                print(boxscore.keys())
-
-    for play in plays:
-        if play['typeCode'] == FACEOFF:
-            winner = play['details']['winningPlayerId']
-            faceoff_wins[winner] += 1
-
-        if play['typeCode'] == PENALTY and play['details']['descKey'] == 'fighting':
-            player = play['details']['committedByPlayerId']
-            fights[player] = fights.get(player, 0) + 1
-
-    print(f"Processed game {game_id}")
-
-    return faceoff_wins      
-
-
-
-def parse_all_games():
+def get_games_season(season="20242025", final_only=False):
+    """Game ids of a season in date order, from the season's game index after bringing it up to date."""
+    index = update_season(client, season)
+    return index.game_ids(game_states=FINAL_GAME_STATES if final_only else None)
+
+def fetch_game(game_id):
+    """Raw play-by-play body for a game.  Runs on the I/O threads, decoding is left to the parsers."""
+    return client.game_center.play_by_play(game_id, raw=True)
+
+def parse_game_events(game_id, play_by_play_body):
+    """Event counts for every skater who dressed in the game, {player_id: {counter: n}} with string ids.
+
+    Skaters come from the feed's rosterSpots, so a skater without events still shows up with {} and counts
+    as a game played.  The plays are walked once and every EVENTS entry is counted in that pass.  Runs in a
+    worker process, so it only touches its arguments and returns a fresh result per game.
+    """
+    # typed decode of only the fields used here, several times faster than building the whole document
+    pbp = decode_play_by_play(play_by_play_body)
+    if pbp.gameState not in FINAL_GAME_STATES:
+        # unfinished games are left out of the checkpoint so a later run picks them up
+        raise ValueError(f"game {game_id} is not final ({pbp.gameState})")
+
+    counts = {str(spot.playerId): {} for spot in pbp.rosterSpots if spot.positionCode != 'G'}
+    for play in pbp.plays:
+        count_play(counts, play.typeCode, play.details)
+
+    return counts
+
+def stream_game_events(game_id):
+    """parse_game_events straight off the response stream, run on a fetch thread.
+
+    Only one play is held at a time, and a game that is not final stops downloading as soon as its gameState
+    is read.  rosterSpots follows plays in the feed, so skaters without events are added at the end.  Streamed
+    games are not added to the archive.
+    """
+    counts = {}
+    state = None
+    for key, value in client.game_center.play_by_play(game_id, stream=True):
+        if key == 'gameState':
+            state = value
+            if state not in FINAL_GAME_STATES:
+                break
+        elif key == 'plays':
+            count_play(counts, value['typeCode'], Record(value['details']) if 'details' in value else None)
+        elif key == 'rosterSpots':
+            for spot in value:
+                if spot['positionCode'] != 'G':
+                    counts.setdefault(str(spot['playerId']), {})
+    if state not in FINAL_GAME_STATES:
+        raise ValueError(f"game {game_id} is not final ({state})")
+    return counts
+
+def count_play(counts, type_code, details):
+    """Credit one play to every player EVENTS names for its type."""
+    fields = EVENTS.get(type_code)
+    if fields is None or details is None:
+        return
+    for field, counter in fields:
+        player = getattr(details, field)
+        if player is None:
+            continue
+        player_counts = counts.setdefault(str(player), {})
+        penalty = details.descKey
+        counter = counter.format(penaltyType=penalty if penalty in _PENALTY_TYPES else 'other')
+        player_counts[counter] = player_counts.get(counter, 0) + 1
+
+def parse_games(game_ids, checkpoint, parsers, stream=False):
+    """Fetch games on threads and parse them on the process pool, recording each game once it is parsed.
+
+    At most IN_FLIGHT games are fetched or parsed at a time, so raw bodies never pile up in memory.  Games the
+    archive has are read first, with one archive.scan in the order they sit on disk, and go straight to the
+    parsers.  The rest are fetched; with stream the fetch threads count the events themselves as each game
+    downloads, see stream_game_events.  Fetched bodies are archived once they parse, so only final games go
+    into the archive.
+    """
+    archived = [game_id for game_id in game_ids if (game_id, 'play-by-play') in archive]
+    stored = archive.scan('play-by-play', archived)
+    queue = iter([game_id for game_id in game_ids if (game_id, 'play-by-play') not in archive])
+    running = {}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=FETCH_WORKERS) as fetchers:
+        while True:
+            while len(running) < IN_FLIGHT:
+                game_id, body = next(stored, (None, None))
+                if game_id is not None:
+                    running[parsers.submit(parse_game_events, game_id, body)] = ('parse', game_id, None)
+                    continue
+                game_id = next(queue, None)
+                if game_id is None:
+                    break
+                if stream:
+                    running[fetchers.submit(stream_game_events, game_id)] = ('parse', game_id, None)
+                else:
+                    running[fetchers.submit(fetch_game, game_id)] = ('fetch', game_id, None)
+            if not running:
+                break
+
+            done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                stage, game_id, body = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"Error processing game {game_id}: {e}")
+                    continue
+                if stage == 'fetch':
+                    running[parsers.submit(parse_game_events, game_id, result)] = ('parse', game_id, result)
+                else:
+                    if body is not None:
+                        archive.put(game_id, 'play-by-play', body)
+                    checkpoint.record(game_id, result)
+                    print(f"Processed game {game_id}")
+
+def aggregate_games(results):
+    """Games, event totals and running faceoff-win stats per player over a season's game results, in the order given.
+
+    Runs in this process: the work is a few additions per player and game, less than pickling the results to a
+    worker would cost.
+    """
+    players = {}
+    for result in results:
+        for player_id, counts in result.items():
+            stats = players.setdefault(player_id, dict(EMPTY_STATS))
+            stats['games'] += 1
+            wins = counts.get('faceoffWins', 0)
+            delta = wins - stats['FO_mean']
+            stats['FO_mean'] += delta / stats['games']
+            stats['FO_M2'] += delta * (wins - stats['FO_mean'])
+            for counter, n in counts.items():
+                stats[counter] = stats.get(counter, 0) + n
+    return players
+
+
+
+def parse_all_games(since=False, stream=False, rebuild=False):
     player_list = load_player_list()
-
-    for season in ['20222023','20232024', '20242025']:
-        with open(f"gameIds/{season}.txt", "r") as f:
-            game_ids = [line.strip() for line in f if line.strip()]
-        players = {}
-        for player in player_list:
-            players[player] = {
-                'FO_n': 0,
-                'FO_total': 0,
-                'FO_delta': 0,
-                'FO_mean': 0,
-                'FO_M2': 0,
-                'fights': 0
-            }
-
-        # Use ThreadPoolExecutor to process games concurrently
-        print(f"Processing {len(game_ids)} games for season {season}...")
-        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
-            results = list(executor.map(parse_game_events, game_ids))
-        
-        for wins in results:
-            for player_id, win_count in wins.items():
-                if str(player_id) in players:
-                    players[str(player_id)]['FO_n'] += 1
-                    players[str(player_id)]['FO_total'] += win_count
-                    delta = win_count - players[str(player_id)]['FO_mean']
-                    players[str(player_id)]['FO_mean'] += delta / players[str(player_id)]['FO_n']
-                    players[str(player_id)]['FO_M2'] += delta * (win_count - players[str(player_id)]['FO_mean'])
-
-        output = {}
-        for player_id in players:
-            output[player_id] = {
-                'faceoffWins': players[player_id]['FO_total'],
-                'faceoff_avg': players[player_id]['FO_mean'],
-                'faceoff_sd': (players[player_id]['FO_M2'] / players[player_id]['FO_n'])**0.5 if players[player_id]['FO_n'] > 1 else 0,
-                'fights': fights.get(int(player_id), 0)
-            }
-
-        with open(f"data/json/{season}_additional.json", "w") as f:
-            json.dump(output, f, indent=4)
+    # one result per game in parse_game_events' format; the older faceoff/fight-only log is left alone
+    checkpoint = Checkpoint("game_events")
+
+    # the workers start on the first submit, once the fetch threads, the httpx pool and the SQLite cache exist;
+    # forking a process with live threads can leave a child stuck on a lock, so they are started fresh instead
+    with concurrent.futures.ProcessPoolExecutor(mp_context=multiprocessing.get_context(START_METHOD)) as parsers:
+        for season in SEASONS:
+            finished = None
+            if since and season == SEASONS[-1]:
+                # pick up games scheduled or played since the last run
+                finished = get_games_season(season=season, final_only=True)
+                game_ids = sorted(set(finished) | set(load_game_ids(season)))
+                with open(f"gameIds/{season}.txt", "w") as f:
+                    for id in game_ids:
+                        f.write(id + "\n")
+            else:
+                game_ids = load_game_ids(season)
+
+            if rebuild:
+                checkpoint.discard(game_ids)
+            pending = checkpoint.pending(game_ids)
+            if finished is not None:
+                # games that are not final yet would only fail to parse; postponed games are kept whatever their id
+                finished = set(finished)
+                pending = [id for id in pending if id in finished]
+
+            print(f"Processing {len(pending)} of {len(game_ids)} games for season {season}...")
+            parse_games(pending, checkpoint, parsers, stream=stream)
+
+            done = [id for id in game_ids if id in checkpoint]
+            players = aggregate_games(checkpoint.get(id) for id in done)
+
+            output = {}
+            for player_id in player_list:
+                stats = players.get(player_id, EMPTY_STATS)
+                output[player_id] = {
+                    'faceoffWins': stats.get('faceoffWins', 0),
+                    'faceoff_avg': stats['FO_mean'],
+                    'faceoff_sd': (stats['FO_M2'] / stats['games'])**0.5 if stats['games'] > 1 else 0,
+                    'fights': stats.get('penalty_fighting', 0)
+                }
+                for counter in COUNTERS[1:] + PENALTY_COUNTERS:
+                    output[player_id][counter] = stats.get(counter, 0)
+                # games counted before the types were fixed may carry other penalty counters
+                output[player_id]['penalty_other'] += sum(
+                    n for counter, n in stats.items() if counter.startswith('penalty_') and counter not in PENALTY_COUNTERS
+                )
+
+            with open(f"data/json/{season}_additional.json", "w") as f:
+                json.dump(output, f, indent=4)
         
-        with open(f'data/csv/{season}_additional.csv', 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=['playerId', 'faceoffWins', 'faceoff_avg', 'faceoff_sd', 'fights'])
-            writer.writeheader()
-            for player_id, stats in output.items():
-                row = {'playerId': player_id}
-                row.update(stats)
-                writer.writerow(row)
+            with open(f'data/csv/{season}_additional.csv', 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=['playerId', 'faceoffWins', 'faceoff_avg', 'faceoff_sd', 'fights'] + COUNTERS[1:] + PENALTY_COUNTERS)
+                writer.writeheader()
+                for player_id, stats in output.items():
+                    row = {'playerId': player_id}
+                    row.update(stats)
+                    writer.writerow(row)
+
+    checkpoint.finish()
+    checkpoint.close()
 
 
 
@@ -0,0 +1,60 @@
+"""
+weights.py
+default rating weights, shared by DataManager and ranker. DataManager works on
+copies, so runtime tuning (DataManager.set_weights) never changes these
+"""
+
+STATS_WEIGHTS = {
+    'points':    0.10,
+    'plusMinus': 0.25,
+    'shg':       0.20,
+    'faceoff':   0.45,
+    'blocks':    0.65,
+    'hits':      0.90,
+    'pim':       0.65,
+    'gp':        0.50,
+    'fights':    0.80,
+    'age':       0.50,
+    'fr':        1.00,
+    'team':      0.20
+}
+
+YEAR_WEIGHTS = {
+    '20222023': 0.3,
+    '20232024': 0.5,
+    '20242025': 0.9
+}
+
+TEAM_WEIGHTS = {
+    "ARI": 0.99,
+    "ANA": 1.01,
+    "BOS": 1.09,
+    "BUF": 1.02,
+    "CGY": 1.05,
+    "CAR": 0.99,
+    "CBJ": 1.06,
+    "CHI": 0.94,
+    "COL": 0.93,
+    "DAL": 0.91,
+    "DET": 1.01,
+    "EDM": 0.90,
+    "FLA": 1.10,
+    "LAK": 0.98,
+    "MIN": 0.92,
+    "MTL": 1.07,
+    "NSH": 1.03,
+    "NJD": 1.04,
+    "NYI": 1.01,
+    "NYR": 1.06,
+    "OTT": 1.07,
+    "PHI": 1.02,
+    "PIT": 0.99,
+    "SJS": 0.95,
+    "SEA": 0.98,
+    "STL": 1.02,
+    "TBL": 0.94,
+    "TOR": 1.06,
+    "VAN": 1.09,
+    "VGK": 0.98,
+    "WPG": 1.04
+}